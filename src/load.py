@@ -0,0 +1,23 @@
+"""
+Ponto de entrada do estágio Gold do pipeline.
+
+A implementação fica no coletor v2 (catfact.ninja), em
+`teste_git/cat_facts_collector/v2_catfact_ninja_2026_01/src/load.py`.
+
+Uso:
+    python src/load.py
+"""
+
+import sys
+from pathlib import Path
+
+COLLECTOR_DIR = Path(__file__).resolve().parent.parent / "teste_git" / "cat_facts_collector" / "v2_catfact_ninja_2026_01"
+
+# O pacote `src` do coletor precisa vir antes deste diretório no path
+sys.path.insert(0, str(COLLECTOR_DIR))
+
+from src.load import main  # noqa: E402
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Benchmark dos codecs JSON (`src/utils/json_codec.py`) em páginas da API.
+
+As páginas têm o formato de `GET /facts` da catfact.ninja, geradas pelo
+mesmo `MockCatFactsServer` do benchmark do pipeline, com os tamanhos de
+página usados pelo crawl (25 é o menor do modo adaptativo; 100 é o máximo
+da API real). Para cada codec instalado são medidos:
+    - decode: bytes da resposta -> objetos (o que `_make_request` faz)
+    - encode: objetos -> bytes (gravação das páginas do Bronze)
+
+O `json` do stdlib sempre roda e serve de referência (`speedup`).
+
+Uso:
+    python benchmarks/json_benchmark.py
+    python benchmarks/json_benchmark.py --page-sizes 100 400 1000 --pages 200 --repeat 7
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS_DIR.parent))
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from mock_server import MockCatFactsServer  # noqa: E402
+from run_benchmarks import git_commit  # noqa: E402
+
+from src.utils.json_codec import available_codecs  # noqa: E402
+
+
+def make_pages(page_size: int, pages: int) -> List[Dict]:
+    """Páginas consecutivas de `GET /facts` com `page_size` facts cada."""
+    server = MockCatFactsServer(records=page_size * pages)
+    # facts_page limita o limit a 100, como a API real; aqui o tamanho é livre
+    template = server.facts_page(1, 1)
+    result = []
+    for page in range(1, pages + 1):
+        start = (page - 1) * page_size
+        body = dict(template, current_page=page, per_page=page_size, total=server.records,
+                    last_page=pages, **{"from": start + 1, "to": start + page_size})
+        body["data"] = [server.fact(i) for i in range(start, start + page_size)]
+        result.append(body)
+    return result
+
+
+def best_of(func: Callable[[], None], repeat: int) -> float:
+    """Menor tempo, em segundos, entre `repeat` execuções de `func`."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run_page_size(page_size: int, args: argparse.Namespace) -> Dict:
+    """
+    Mede todos os codecs instalados em páginas de `page_size` facts.
+    
+    Args:
+        page_size: Facts por página
+        args: Argumentos da linha de comando
+    
+    Returns:
+        Tamanho médio da página e, por codec, tempos e throughput
+    """
+    pages = make_pages(page_size, args.pages)
+    payloads = [json.dumps(page).encode("utf-8") for page in pages]
+    total_bytes = sum(len(payload) for payload in payloads)
+    
+    result = {"page_bytes": total_bytes // len(payloads), "codecs": {}}
+    for name, codec in available_codecs().items():
+        # Confere que o codec lê e grava o mesmo conteúdo antes de medir
+        assert codec.loads(codec.dumps(pages[0])) == pages[0]
+        
+        decode = best_of(lambda: [codec.loads(payload) for payload in payloads], args.repeat)
+        encode = best_of(lambda: [codec.dumps(page) for page in pages], args.repeat)
+        result["codecs"][name] = {
+            "decode_seconds": round(decode, 6),
+            "encode_seconds": round(encode, 6),
+            "decode_mb_per_second": round(total_bytes / decode / 1e6, 1),
+            "encode_mb_per_second": round(total_bytes / encode / 1e6, 1),
+        }
+    
+    baseline = result["codecs"]["stdlib"]
+    for name, timings in result["codecs"].items():
+        timings["decode_speedup"] = round(baseline["decode_seconds"] / timings["decode_seconds"], 2)
+        timings["encode_speedup"] = round(baseline["encode_seconds"] / timings["encode_seconds"], 2)
+        print(
+            f"  página {page_size:>5}  {name:<8} decode {timings['decode_mb_per_second']:>7.1f} MB/s "
+            f"({timings['decode_speedup']:.2f}x)  encode {timings['encode_mb_per_second']:>7.1f} MB/s "
+            f"({timings['encode_speedup']:.2f}x)"
+        )
+    return result
+
+
+def main(argv: Optional[List[str]] = None):
+    """Executa o benchmark e grava o JSON de resultados."""
+    parser = argparse.ArgumentParser(description="Benchmark dos codecs JSON em páginas da API")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=[25, 100],
+                        help="Facts por página")
+    parser.add_argument("--pages", type=int, default=100, help="Páginas por medição")
+    parser.add_argument("--repeat", type=int, default=5, help="Execuções por medição (vale a menor)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Arquivo JSON de saída (padrão: benchmarks/results/json_<data>_<commit>.json)")
+    args = parser.parse_args(argv)
+    
+    commit = git_commit()
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pages": args.pages,
+        "repeat": args.repeat,
+        "codecs": list(available_codecs()),
+        "page_sizes": {},
+    }
+    
+    for page_size in args.page_sizes:
+        report["page_sizes"][str(page_size)] = run_page_size(page_size, args)
+    
+    output = args.output or (
+        BENCHMARKS_DIR / "results"
+        / f"json_{datetime.now().strftime('%Y%m%dT%H%M%S')}_{commit or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Resultados gravados em {output}")
+
+
+if __name__ == "__main__":
+    main()
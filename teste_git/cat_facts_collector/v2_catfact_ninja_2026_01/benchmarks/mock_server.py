@@ -0,0 +1,241 @@
+"""
+Servidor local que imita o endpoint paginado `/facts` da catfact.ninja.
+
+Reproduz o formato de resposta descrito em `docs/API_DOCS.md` (mesmos
+campos de paginação, no máximo 100 facts por página) para medir o pipeline
+sem depender da API real. Permite configurar quantidade de registros,
+latência por requisição e injeção de respostas 429 e 5xx.
+
+Uso:
+    python benchmarks/mock_server.py --records 100000 --latency 0.02 --rate-429 0.01
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+MAX_PAGE_SIZE = 100
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Handler HTTP; a configuração fica no servidor (`MockCatFactsServer`)."""
+    
+    server: "_Server"
+    
+    def log_message(self, format, *args):
+        """Silencia o log de acesso padrão."""
+    
+    def do_GET(self):
+        owner = self.server.owner
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        
+        if owner.latency:
+            time.sleep(owner.latency)
+        
+        status = owner.draw_error()
+        if status == 429:
+            self.send_response(429)
+            self.send_header("Retry-After", str(owner.retry_after))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if status:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        
+        if url.path == "/facts":
+            body = owner.facts_page(
+                page=int(params.get("page", ["1"])[0]),
+                limit=int(params.get("limit", ["10"])[0])
+            )
+        elif url.path == "/fact":
+            body = owner.fact(random.randrange(max(1, owner.records)))
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        
+        payload = json.dumps(body).encode("utf-8")
+        owner.count("bytes", len(payload))
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    owner: "MockCatFactsServer"
+
+
+class MockCatFactsServer:
+    """Servidor catfact.ninja local, executado em uma thread de fundo."""
+    
+    def __init__(
+        self,
+        records: int = 327,
+        latency: float = 0.0,
+        rate_429: float = 0.0,
+        rate_5xx: float = 0.0,
+        retry_after: int = 1,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: Optional[int] = 42
+    ):
+        """
+        Configura o servidor (ainda sem iniciar).
+        
+        Args:
+            records: Total de facts disponíveis
+            latency: Atraso por requisição em segundos
+            rate_429: Fração das requisições respondidas com 429
+            rate_5xx: Fração das requisições respondidas com 503
+            retry_after: Valor do header Retry-After nas respostas 429
+            host: Interface de escuta
+            port: Porta (0 = escolhida pelo sistema)
+            seed: Semente da injeção de erros (None = aleatória)
+        """
+        self.records = records
+        self.latency = latency
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.retry_after = retry_after
+        self.host = host
+        self.port = port
+        self.counters: Dict[str, int] = {"requests": 0, "429": 0, "5xx": 0, "bytes": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        """URL base a passar para o `CatFactsAPIClient`."""
+        return f"http://{self.host}:{self.port}"
+    
+    def count(self, name: str, value: int = 1) -> None:
+        """Incrementa um contador de forma thread-safe."""
+        with self._lock:
+            self.counters[name] += value
+    
+    def draw_error(self) -> int:
+        """
+        Sorteia se a requisição atual deve falhar.
+        
+        Returns:
+            429, 503 ou 0 (sucesso)
+        """
+        with self._lock:
+            self.counters["requests"] += 1
+            draw = self._random.random()
+            if draw < self.rate_429:
+                self.counters["429"] += 1
+                return 429
+            if draw < self.rate_429 + self.rate_5xx:
+                self.counters["5xx"] += 1
+                return 503
+        return 0
+    
+    @staticmethod
+    def fact(index: int) -> Dict:
+        """Fact sintético determinístico para a posição `index`."""
+        text = f"Cat fact number {index}: cats sleep {12 + index % 7} hours a day."
+        return {"fact": text, "length": len(text)}
+    
+    def facts_page(self, page: int, limit: int) -> Dict:
+        """
+        Monta uma página no formato de `GET /facts`.
+        
+        Args:
+            page: Número da página (1-based)
+            limit: Facts por página (limitado a 100, como na API real)
+        
+        Returns:
+            Corpo JSON da página
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        last_page = max(1, -(-self.records // limit))
+        start = (page - 1) * limit
+        end = min(start + limit, self.records)
+        path = f"{self.base_url}/facts"
+        
+        return {
+            "current_page": page,
+            "data": [self.fact(i) for i in range(start, end)],
+            "first_page_url": f"{path}?page=1",
+            "from": start + 1 if start < end else None,
+            "last_page": last_page,
+            "last_page_url": f"{path}?page={last_page}",
+            "next_page_url": f"{path}?page={page + 1}" if page < last_page else None,
+            "path": path,
+            "per_page": limit,
+            "prev_page_url": f"{path}?page={page - 1}" if page > 1 else None,
+            "to": end if start < end else None,
+            "total": self.records,
+        }
+    
+    def start(self) -> "MockCatFactsServer":
+        """Inicia o servidor em uma thread de fundo."""
+        self._server = _Server((self.host, self.port), _Handler)
+        self._server.owner = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Encerra o servidor."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def main():
+    """Executa o servidor em primeiro plano."""
+    parser = argparse.ArgumentParser(description="Servidor catfact.ninja local para benchmarks")
+    parser.add_argument("--records", type=int, default=327, help="Total de facts")
+    parser.add_argument("--latency", type=float, default=0.0, help="Atraso por requisição (s)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fração de respostas 429")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="Fração de respostas 503")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After das respostas 429 (s)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    
+    server = MockCatFactsServer(
+        records=args.records,
+        latency=args.latency,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        retry_after=args.retry_after,
+        port=args.port
+    ).start()
+    print(f"Servidor em {server.base_url} ({args.records} facts). Ctrl+C para encerrar.")
+    
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Benchmark do pipeline de extração contra o servidor local (`mock_server.py`).
+
+Mede separadamente as três etapas do `CatFactsExtractor`:
+    - get_all_facts:           busca paginada na API (rede + JSON)
+    - _validate_and_transform: validação Pydantic e achatamento
+    - save_to_csv:             DataFrame pandas + escrita do CSV
+    - _transform_to_frame:     caminho colunar (DataFrame direto das páginas)
+    - save_to_csv_frame:       escrita do CSV a partir desse DataFrame
+
+para cada volume pedido (padrão: 1k, 100k e 1M registros) e grava o
+resultado em JSON, identificado pelo commit atual, para comparar execuções.
+
+Uso:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sizes 1000 100000 --latency 0.01 --rate-429 0.01
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARKS_DIR.parent))
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from mock_server import MAX_PAGE_SIZE, MockCatFactsServer  # noqa: E402
+
+
+def git_commit() -> Optional[str]:
+    """Retorna o hash curto do commit atual (None fora de um repositório git)."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARKS_DIR,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def timed(func, *args, **kwargs):
+    """Executa `func` e retorna (resultado, segundos)."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def stage_result(seconds: float, records: int) -> Dict:
+    """Monta o resultado de uma etapa."""
+    return {
+        "seconds": round(seconds, 4),
+        "records_per_sec": round(records / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def run_size(records: int, args: argparse.Namespace, work_dir: Path) -> Dict:
+    """
+    Executa uma rodada de benchmark para um volume de registros.
+    
+    Args:
+        records: Total de registros servidos pelo mock
+        args: Argumentos da linha de comando
+        work_dir: Diretório temporário para o CSV
+    
+    Returns:
+        Tempos por etapa (melhor de `args.repeat` execuções) e contadores HTTP
+    """
+    from src.extract_cat_facts import CatFactsExtractor
+    from src.utils.api_client import CatFactsAPIClient
+    
+    max_pages = -(-records // MAX_PAGE_SIZE)
+    best: Dict[str, float] = {}
+    
+    with MockCatFactsServer(
+        records=records,
+        latency=args.latency,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        retry_after=args.retry_after
+    ) as server:
+        for _ in range(args.repeat):
+            extractor = CatFactsExtractor()
+            extractor.api_client.close()
+            extractor.api_client = CatFactsAPIClient(
+                base_url=server.base_url,
+                concurrency=args.concurrency,
+                use_cache=False,
+                paginated=True
+            )
+            
+            try:
+                raw_facts, fetch_time = timed(extractor.api_client.get_all_facts, max_pages=max_pages)
+                validated, validate_time = timed(extractor._validate_and_transform, raw_facts)
+                output_path = work_dir / f"bench_{records}.csv"
+                _, write_time = timed(extractor.save_to_csv, validated, output_path)
+                frame, frame_time = timed(extractor._transform_to_frame, raw_facts)
+                _, frame_write_time = timed(extractor.save_to_csv, frame, output_path)
+                output_path.unlink(missing_ok=True)
+            finally:
+                extractor.api_client.close()
+            
+            for stage, seconds in (
+                ("get_all_facts", fetch_time),
+                ("_validate_and_transform", validate_time),
+                ("save_to_csv", write_time),
+                ("_transform_to_frame", frame_time),
+                ("save_to_csv_frame", frame_write_time),
+            ):
+                best[stage] = min(best.get(stage, seconds), seconds)
+        
+        counters = dict(server.counters)
+    
+    return {
+        "records": records,
+        "pages": max_pages,
+        "records_fetched": len(raw_facts),
+        "records_validated": len(validated),
+        "stages": {stage: stage_result(seconds, records) for stage, seconds in best.items()},
+        "http": counters,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Lê os argumentos da linha de comando."""
+    parser = argparse.ArgumentParser(description="Benchmark do pipeline contra um servidor catfact.ninja local")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000],
+                        help="Volumes de registros a medir")
+    parser.add_argument("--latency", type=float, default=0.0, help="Atraso por requisição no mock (s)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fração de respostas 429")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="Fração de respostas 503")
+    parser.add_argument("--retry-after", type=int, default=0, help="Retry-After das respostas 429 (s)")
+    parser.add_argument("--concurrency", type=int, default=None, help="API_CONCURRENCY do cliente")
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="API_RATE_LIMIT do cliente em req/s (padrão: sem limite)")
+    parser.add_argument("--repeat", type=int, default=1, help="Execuções por volume (vale a melhor)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Arquivo JSON de saída (padrão: benchmarks/results/<data>_<commit>.json)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Executa o benchmark e grava o JSON de resultados."""
+    args = parse_args(argv)
+    work_dir = Path(tempfile.mkdtemp(prefix="cat_facts_bench_"))
+    
+    # A configuração é lida do ambiente no primeiro acesso a src.config.Config
+    os.environ["OUTPUT_DIR"] = str(work_dir)
+    os.environ["API_RATE_LIMIT"] = str(args.rate_limit)
+    os.environ["API_RETRY_DELAY"] = "0"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    
+    from src.config import Config
+    args.concurrency = args.concurrency or Config.API_CONCURRENCY
+    
+    commit = git_commit()
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "latency": args.latency,
+            "rate_429": args.rate_429,
+            "rate_5xx": args.rate_5xx,
+            "retry_after": args.retry_after,
+            "concurrency": args.concurrency,
+            "rate_limit": args.rate_limit,
+            "repeat": args.repeat,
+        },
+        "results": [],
+    }
+    
+    for records in args.sizes:
+        print(f"Benchmark: {records:,} registros...", flush=True)
+        result = run_size(records, args, work_dir)
+        report["results"].append(result)
+        
+        for stage, timing in result["stages"].items():
+            print(f"  {stage:<25} {timing['seconds']:>9.3f}s  {timing['records_per_sec'] or 0:>12,.0f} reg/s")
+    
+    output = args.output or (
+        BENCHMARKS_DIR / "results"
+        / f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{commit or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Resultados gravados em {output}")
+
+
+if __name__ == "__main__":
+    main()
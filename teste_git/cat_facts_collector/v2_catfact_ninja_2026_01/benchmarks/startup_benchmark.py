@@ -0,0 +1,118 @@
+"""
+Benchmark do tempo de inicialização (cold start) dos entry points.
+
+Cada cenário roda em um processo Python novo, como quando o extrator é
+disparado por um agendador, e mede o tempo de parede até o processo
+terminar. Os cenários cobrem só a importação e o parse de argumentos, sem
+chamadas à API:
+    - import_config:    `import src.config` + leitura de uma configuração
+    - import_extractor: `import src.extract_cat_facts`
+    - cli_help:         `python src/extract_cat_facts.py --help`
+
+Uso:
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --repeat 20 --importtime
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+PROJECT_DIR = BENCHMARKS_DIR.parent
+sys.path.insert(0, str(BENCHMARKS_DIR))
+
+from run_benchmarks import git_commit  # noqa: E402
+
+
+SCENARIOS = {
+    "import_config": [sys.executable, "-c", "from src.config import Config; Config.API_BASE_URL"],
+    "import_extractor": [sys.executable, "-c", "import src.extract_cat_facts"],
+    "cli_help": [sys.executable, "src/extract_cat_facts.py", "--help"],
+}
+
+
+def run_once(command: List[str]) -> float:
+    """Executa o comando em um processo novo e retorna os segundos gastos."""
+    start = time.perf_counter()
+    subprocess.run(command, cwd=PROJECT_DIR, check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+def slowest_imports(command: List[str], top: int = 10) -> List[Dict]:
+    """
+    Lista os módulos mais caros de importar (`python -X importtime`).
+    
+    Args:
+        command: Comando do cenário (o primeiro item é o interpretador)
+        top: Quantidade de módulos a retornar
+    
+    Returns:
+        Módulos com o tempo acumulado de importação, do mais lento ao mais rápido
+    """
+    result = subprocess.run(
+        [command[0], "-X", "importtime", *command[1:]],
+        cwd=PROJECT_DIR,
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        modules.append({"module": module.strip(), "cumulative_ms": int(cumulative) / 1000})
+    return sorted(modules, key=lambda item: item["cumulative_ms"], reverse=True)[:top]
+
+
+def main(argv: Optional[List[str]] = None):
+    """Executa os cenários e grava o JSON de resultados."""
+    parser = argparse.ArgumentParser(description="Benchmark de cold start dos entry points")
+    parser.add_argument("--repeat", type=int, default=10, help="Execuções por cenário")
+    parser.add_argument("--importtime", action="store_true",
+                        help="Inclui os módulos mais lentos de cada cenário (python -X importtime)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Arquivo JSON de saída (padrão: benchmarks/results/startup_<data>_<commit>.json)")
+    args = parser.parse_args(argv)
+    
+    commit = git_commit()
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "scenarios": {},
+    }
+    
+    for name, command in SCENARIOS.items():
+        run_once(command)  # aquece o cache de bytecode (.pyc) e do sistema de arquivos
+        timings = [run_once(command) for _ in range(args.repeat)]
+        result = {
+            "min_seconds": round(min(timings), 4),
+            "median_seconds": round(statistics.median(timings), 4),
+        }
+        if args.importtime:
+            result["slowest_imports"] = slowest_imports(command)
+        report["scenarios"][name] = result
+        print(f"  {name:<18} min {result['min_seconds']:.3f}s  mediana {result['median_seconds']:.3f}s")
+    
+    output = args.output or (
+        BENCHMARKS_DIR / "results"
+        / f"startup_{datetime.now().strftime('%Y%m%dT%H%M%S')}_{commit or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Resultados gravados em {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compactação da saída particionada (`Config.FACTS_DIR`).
+
+Cada execução com `--partitioned` grava uma parte pequena em
+`facts/ingestion_date=YYYY-MM-DD/`. Este comando junta as partes de cada
+data em um único arquivo, sem tocar nas datas que já têm uma parte só.
+
+Uso:
+    python src/compact.py                       # todas as datas
+    python src/compact.py --date 2026-01-26     # uma data
+    python src/compact.py --min-parts 10        # só datas com 10+ partes
+"""
+
+import argparse
+import sys
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import Config
+from src.utils.logger import setup_logger
+from src.utils.partitioned_output import PartitionedOutput
+
+
+logger = setup_logger(__name__)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Compacta as partições da saída append-only."""
+    parser = argparse.ArgumentParser(description="Compacta as partes de FACTS_DIR por data de ingestão")
+    parser.add_argument("--date", type=date.fromisoformat, help="Data da partição (YYYY-MM-DD)")
+    parser.add_argument("--min-parts", type=int, default=2, help="Partes mínimas para compactar uma data")
+    parser.add_argument("--format", default=Config.OUTPUT_FORMAT, help="Formato das partes (csv, parquet, arrow)")
+    args = parser.parse_args(argv)
+    
+    try:
+        output = PartitionedOutput(output_format=args.format)
+        
+        if args.date:
+            partition = output.partition_dir(args.date)
+            if len(output.parts(partition)) < 2:
+                logger.info(f"{partition.name}: nada a compactar")
+            else:
+                output.compact(partition)
+        else:
+            output.compact_all(min_parts=args.min_parts)
+        
+        sys.exit(0)
+    
+    except Exception as e:
+        logger.error(f"Erro fatal na compactação: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,26 +7,106 @@ incluindo variáveis de ambiente, URLs da API e parâmetros de execução.
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Any, Callable, Dict
 
-# Carrega variáveis de ambiente do arquivo .env
-load_dotenv()
+# Valores já resolvidos (nome do atributo -> valor)
+_cache: Dict[str, Any] = {}
+_dotenv_loaded = False
+
+
+def _load_dotenv() -> None:
+    """Carrega o arquivo .env uma única vez, no primeiro acesso a uma configuração."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+class _Lazy:
+    """Atributo de classe calculado no primeiro acesso e mantido em cache."""
+    
+    def __init__(self, compute: Callable[[type], Any]):
+        self.compute = compute
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+    
+    def __get__(self, instance: Any, owner: type) -> Any:
+        try:
+            return _cache[self.name]
+        except KeyError:
+            _load_dotenv()
+            value = _cache[self.name] = self.compute(owner)
+            return value
+
+
+def _env(name: str, default: str, cast: Callable[[str], Any] = str) -> _Lazy:
+    """Configuração lida da variável de ambiente `name` (ou `default`) e convertida por `cast`."""
+    return _Lazy(lambda cls: cast(os.getenv(name, default)))
+
+
+def _as_bool(value: str) -> bool:
+    """Converte 'true', '1' ou 'yes' (sem diferenciar maiúsculas) em True."""
+    return value.lower() in ("true", "1", "yes")
 
 
 class Config:
-    """Classe de configuração centralizada."""
+    """
+    Classe de configuração centralizada.
+    
+    Os valores vindos do ambiente (e do `.env`) são resolvidos no primeiro
+    acesso e mantidos em cache, então importar este módulo não custa nada
+    e variáveis definidas antes do primeiro uso são respeitadas.
+    """
     
     # Diretórios do projeto
     BASE_DIR = Path(__file__).resolve().parent.parent
-    DATA_DIR = BASE_DIR / os.getenv("OUTPUT_DIR", "data")
+    DATA_DIR = _Lazy(lambda cls: cls.BASE_DIR / os.getenv("OUTPUT_DIR", "data"))
     LOGS_DIR = BASE_DIR / "logs"
     
+    # Camadas do pipeline (Medallion Architecture)
+    BRONZE_DIR = _Lazy(lambda cls: cls.DATA_DIR / "bronze")  # Respostas brutas da API (JSON)
+    SILVER_DIR = _Lazy(lambda cls: cls.DATA_DIR / "silver")  # Dados validados e deduplicados (Parquet)
+    GOLD_DIR = _Lazy(lambda cls: cls.DATA_DIR / "gold")  # Star schema fact_cat_facts (Parquet)
+    FACTS_DIR = _Lazy(lambda cls: cls.DATA_DIR / "facts")  # Saída append-only (ingestion_date=YYYY-MM-DD/part-N)
+    
     # API Configuration - V2: catfact.ninja (API alternativa - ONLINE)
-    API_BASE_URL = os.getenv("API_BASE_URL", "https://catfact.ninja")
-    API_TIMEOUT = int(os.getenv("API_TIMEOUT", "30"))
-    API_MAX_RETRIES = int(os.getenv("API_MAX_RETRIES", "3"))
-    API_RETRY_DELAY = int(os.getenv("API_RETRY_DELAY", "2"))
-    API_VERIFY_SSL = os.getenv("API_VERIFY_SSL", "False").lower() in ("true", "1", "yes")
+    API_BASE_URL = _env("API_BASE_URL", "https://catfact.ninja")
+    API_TIMEOUT = _env("API_TIMEOUT", "30", int)
+    API_MAX_RETRIES = _env("API_MAX_RETRIES", "3", int)
+    API_RETRY_DELAY = _env("API_RETRY_DELAY", "2", float)  # Teto da 1ª espera (backoff exponencial com jitter)
+    API_RETRY_MAX_DELAY = _env("API_RETRY_MAX_DELAY", "30", float)  # Teto de qualquer espera
+    API_RETRY_BUDGET = _env("API_RETRY_BUDGET", "60", float)  # Segundos por requisição, com retries (0 = sem limite)
+    API_CIRCUIT_FAILURES = _env("API_CIRCUIT_FAILURES", "5", int)  # Falhas seguidas que abrem o circuito do host (0 = desligado)
+    API_CIRCUIT_RESET = _env("API_CIRCUIT_RESET", "30", float)  # Segundos com o circuito aberto
+    API_VERIFY_SSL = _env("API_VERIFY_SSL", "False", _as_bool)
+    API_CONCURRENCY = _env("API_CONCURRENCY", "4", int)  # Páginas buscadas em paralelo
+    API_RATE_LIMIT = _env("API_RATE_LIMIT", "10", float)  # Requisições/segundo (0 = sem limite)
+    API_RATE_BURST = _env("API_RATE_BURST", "10", int)  # Rajada máxima do token bucket
+    API_PAGE_SIZE = _env("API_PAGE_SIZE", "100", int)  # limit do /facts paginado
+    
+    # HTTP Connection Pool Configuration (compartilhado pelas threads do cliente)
+    HTTP_POOL_CONNECTIONS = _env("HTTP_POOL_CONNECTIONS", "10", int)  # Hosts com pool em cache
+    HTTP_POOL_MAXSIZE = _env("HTTP_POOL_MAXSIZE", "16", int)  # Conexões por host (mínimo: concorrência)
+    HTTP_POOL_BLOCK = _env("HTTP_POOL_BLOCK", "True", _as_bool)  # Espera conexão livre em vez de abrir extra
+    HTTP_KEEP_ALIVE = _env("HTTP_KEEP_ALIVE", "True", _as_bool)  # Reutiliza conexões (TCP keep-alive)
+    HTTP_KEEPALIVE_TIMEOUT = _env("HTTP_KEEPALIVE_TIMEOUT", "30", int)  # Segundos ociosos (sonda TCP / aiohttp)
+    HTTP_COMPRESSION = _env("HTTP_COMPRESSION", "gzip,br")  # Accept-Encoding (br requer brotli); none = sem
+    JSON_CODEC = _env("JSON_CODEC", "auto", str.lower)  # auto | orjson | msgspec | stdlib
+    
+    # Adaptive Configuration (página e concorrência ajustadas durante o crawl)
+    API_ADAPTIVE = _env("API_ADAPTIVE", "False", _as_bool)
+    API_PAGE_SIZE_MIN = _env("API_PAGE_SIZE_MIN", "25", int)
+    API_PAGE_SIZE_MAX = _env("API_PAGE_SIZE_MAX", "100", int)
+    API_CONCURRENCY_MAX = _env("API_CONCURRENCY_MAX", "16", int)
+    API_TARGET_LATENCY = _env("API_TARGET_LATENCY", "1.0", float)  # Segundos; acima disso as páginas encolhem
+    API_MAX_PAGE_BYTES = _env("API_MAX_PAGE_BYTES", str(1024 * 1024), int)  # Tamanho máximo desejado por resposta
+    
+    # HTTP Cache Configuration (respostas GET em DATA_DIR/http_cache.db)
+    HTTP_CACHE_ENABLED = _env("HTTP_CACHE_ENABLED", "True", _as_bool)
+    HTTP_CACHE_TTL = _env("HTTP_CACHE_TTL", "0", int)  # Segundos sem revalidar (0 = sempre GET condicional)
+    HTTP_CACHE_MAX_BYTES = _env("HTTP_CACHE_MAX_BYTES", str(50 * 1024 * 1024), int)  # Limite LRU
     
     # API Endpoints - V2: catfact.ninja usa /facts com paginação
     @classmethod
@@ -39,15 +119,50 @@ class Config:
     RANDOM_FACT_ENDPOINT = "/fact"  # catfact.ninja: retorna fact aleatório (sem 's')
     
     # Output Configuration
-    OUTPUT_FILENAME = os.getenv("OUTPUT_FILENAME", "cat_facts.csv")
+    OUTPUT_FILENAME = _env("OUTPUT_FILENAME", "cat_facts.csv")
+    OUTPUT_FORMAT = _env("OUTPUT_FORMAT", "csv", str.lower)  # csv | parquet | arrow
+    OUTPUT_COMPRESSION = _env("OUTPUT_COMPRESSION", "zstd")  # parquet/arrow: zstd, lz4, snappy (só parquet), none
+    OUTPUT_ROW_GROUP_SIZE = _env("OUTPUT_ROW_GROUP_SIZE", "100000", int)
+    OUTPUT_PARTITIONED = _env("OUTPUT_PARTITIONED", "False", _as_bool)  # Delta em FACTS_DIR
+    
+    # Metrics Configuration (relatório de tempos e throughput ao final do run)
+    METRICS_FILENAME = _env("METRICS_FILENAME", "run_metrics.json")
+    METRICS_PROMETHEUS = _env("METRICS_PROMETHEUS", "False", _as_bool)  # Gera também .prom
     
     # Logging Configuration
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL = _env("LOG_LEVEL", "INFO")
     LOG_FILE = LOGS_DIR / "cat_facts_extraction.log"
     
     # Execution Configuration
-    BATCH_SIZE = int(os.getenv("BATCH_SIZE", "100"))
-    MAX_RECORDS = int(os.getenv("MAX_RECORDS", "1000"))
+    BATCH_SIZE = _env("BATCH_SIZE", "100", int)
+    MAX_RECORDS = _env("MAX_RECORDS", "1000", int)
+    VALIDATION_WORKERS = _env("VALIDATION_WORKERS", "0", int)  # Processos da validação paralela (0 = nº de CPUs)
+    VALIDATION_PARALLEL_THRESHOLD = _env("VALIDATION_PARALLEL_THRESHOLD", "200000", int)  # Registros (0 = nunca)
+    
+    # Incremental Configuration
+    INCREMENTAL_UNCHANGED_PAGES = _env("INCREMENTAL_UNCHANGED_PAGES", "1", int)  # Páginas inalteradas que encerram o crawl
+    
+    # Warehouse Configuration (star schema Gold em SQLite local, ver src/warehouse.py)
+    WAREHOUSE_DB = _env("WAREHOUSE_DB", "warehouse.db")
+    WAREHOUSE_BATCH_SIZE = _env("WAREHOUSE_BATCH_SIZE", "10000", int)  # Linhas por executemany
+    
+    # Dedup Configuration (hashes de conteúdo já gravados, entre execuções e APIs)
+    DEDUP_INDEX_ENABLED = _env("DEDUP_INDEX_ENABLED", "False", _as_bool)
+    DEDUP_INDEX_FILENAME = _env("DEDUP_INDEX_FILENAME", "dedup_index.db")
+    DEDUP_MEMORY_IDS = _env("DEDUP_MEMORY_IDS", "100000", int)  # Ids em memória por gravação antes do SQLite temporário
+    
+    # Bulk Configuration (API oficial Heroku, /facts/random)
+    BULK_TARGET_RECORDS = _env("BULK_TARGET_RECORDS", "500", int)  # Registros pedidos por execução
+    BULK_BATCH_SIZE = _env("BULK_BATCH_SIZE", "500", int)  # amount por requisição (máximo da API)
+    
+    # Sources Configuration (extração multi-fonte, src/orchestrator.py)
+    SOURCES_FILE = _env("SOURCES_FILE", "sources.json")  # Relativo a BASE_DIR
+    SOURCES_OUTPUT_FILENAME = _env("SOURCES_OUTPUT_FILENAME", "cat_facts_all_sources.csv")
+    
+    @classmethod
+    def reload(cls) -> None:
+        """Descarta os valores em cache; o próximo acesso relê o ambiente."""
+        _cache.clear()
     
     @classmethod
     def ensure_directories(cls):
@@ -57,8 +172,16 @@ class Config:
     
     @classmethod
     def get_output_path(cls) -> Path:
-        """Retorna o caminho completo do arquivo de saída."""
-        return cls.DATA_DIR / cls.OUTPUT_FILENAME
+        """Retorna o caminho completo do arquivo de saída (extensão conforme OUTPUT_FORMAT)."""
+        output_path = cls.DATA_DIR / cls.OUTPUT_FILENAME
+        if cls.OUTPUT_FORMAT != "csv":
+            output_path = output_path.with_suffix(f".{cls.OUTPUT_FORMAT}")
+        return output_path
+    
+    @classmethod
+    def get_metrics_path(cls) -> Path:
+        """Retorna o caminho do relatório JSON de métricas da execução."""
+        return cls.DATA_DIR / cls.METRICS_FILENAME
     
     @classmethod
     def display_config(cls):
@@ -67,7 +190,9 @@ class Config:
             "API_BASE_URL": cls.API_BASE_URL,
             "API_TIMEOUT": cls.API_TIMEOUT,
             "API_MAX_RETRIES": cls.API_MAX_RETRIES,
+            "API_CONCURRENCY": cls.API_CONCURRENCY,
             "OUTPUT_PATH": str(cls.get_output_path()),
+            "OUTPUT_FORMAT": cls.OUTPUT_FORMAT,
             "LOG_LEVEL": cls.LOG_LEVEL,
             "BATCH_SIZE": cls.BATCH_SIZE,
             "MAX_RECORDS": cls.MAX_RECORDS,
@@ -5,135 +5,367 @@ Este script extrai dados de fatos sobre gatos da Cat Facts API
 e salva em formato CSV para análise local.
 
 Uso:
-    python src/extract_cat_facts.py
+    python src/extract_cat_facts.py [--stream] [--resume] [--incremental] [--dedup] [--partitioned]
 
 Autor: UOLCatLovers Data Engineering Team
 Data: 2026-01-26
+
+Módulos pesados (pandas, pyarrow, pydantic, requests, aiohttp, asyncio) são
+importados só na etapa que os usa, para que execuções curtas agendadas (ex.: --incremental
+sem novidades) não paguem a importação de tudo.
 """
 
+from __future__ import annotations
+
+import argparse
+import csv
 import sys
+import time
 from pathlib import Path
-from typing import List, Dict
-from datetime import datetime
-
-import pandas as pd
-from pydantic import ValidationError
+from typing import TYPE_CHECKING, List, Dict, Iterable, Iterator, Optional, Union
+from datetime import datetime, timezone
 
 # Adiciona o diretório raiz ao path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from src.config import Config
 from src.utils.logger import setup_logger
-from src.utils.api_client import CatFactsAPIClient
-from src.models import CatFact
+from src.utils.checkpoint import ExtractionCheckpoint
+from src.utils.dedup_index import DedupIndex, SeenIds
+from src.utils.metrics import IteratorTimer, MetricsRegistry
+from src.utils.state_store import IncrementalStateStore
+
+if TYPE_CHECKING:
+    import pandas as pd
+    
+    from src.models import CatFact
+    from src.utils.async_api_client import AsyncCatFactsAPIClient
+
+
+# Configuração do logger (nível e arquivo do Config são aplicados por
+# `configure_logging`, para não ler o .env na importação)
+logger = setup_logger(name="cat_facts_extraction")
 
 
-# Configuração do logger
-logger = setup_logger(
-    name="cat_facts_extraction",
-    log_level=Config.LOG_LEVEL,
-    log_file=Config.LOG_FILE
-)
+def configure_logging() -> None:
+    """Aplica LOG_LEVEL e LOG_FILE ao logger do extrator."""
+    setup_logger(
+        name="cat_facts_extraction",
+        log_level=Config.LOG_LEVEL,
+        log_file=Config.LOG_FILE
+    )
 
 
 class CatFactsExtractor:
     """Classe responsável pela extração e processamento de Cat Facts."""
     
-    def __init__(self):
-        """Inicializa o extrator."""
-        self.api_client = CatFactsAPIClient()
-        self.facts: List[CatFact] = []
+    def __init__(self, resume: bool = False, dedup_index: Optional[DedupIndex] = None):
+        """
+        Inicializa o extrator.
+        
+        Args:
+            resume: Se True, retoma o crawl paginado a partir do checkpoint
+                salvo em vez de começar do zero
+            dedup_index: Índice persistente de deduplicação; quando
+                informado, registros já vistos são descartados antes da validação
+        """
+        from src.utils.api_client import CatFactsAPIClient
         
-    def extract(self) -> List[Dict]:
+        configure_logging()
+        self.metrics = MetricsRegistry()
+        self.api_client = CatFactsAPIClient(metrics=self.metrics)
+        self.checkpoint = ExtractionCheckpoint()
+        self.resume = resume
+        self.dedup_index = dedup_index
+        self.facts: List[CatFact] = []
+    
+    def _drop_seen(self, facts: List[Dict]) -> List[Dict]:
+        """Descarta os registros já presentes no índice de deduplicação (se houver)."""
+        if self.dedup_index is None:
+            return facts
+        return self.dedup_index.filter_new(facts)
+    
+    def _prepare_checkpoint(self) -> None:
+        """Descarta o checkpoint anterior ou anuncia a retomada, conforme `resume`."""
+        if not self.resume:
+            self.checkpoint.reset()
+        elif self.checkpoint.has_progress:
+            logger.info(
+                f"Modo resume: {self.checkpoint.records_fetched} de "
+                f"{self.checkpoint.target_records} registros já obtidos"
+            )
+        else:
+            logger.info("Modo resume: nenhum checkpoint encontrado, iniciando do zero")
+    
+    def _finalize_checkpoint(self) -> None:
+        """Remove o checkpoint se o crawl terminou; caso contrário, orienta a retomada."""
+        if self.checkpoint.is_complete:
+            self.checkpoint.clear()
+        elif self.checkpoint.has_progress:
+            logger.warning(
+                f"Extração incompleta: {self.checkpoint.records_fetched} "
+                f"de {self.checkpoint.target_records} registros. Execute novamente com --resume "
+                f"para buscar apenas as páginas restantes."
+            )
+    
+    def extract(self, as_frame: bool = False) -> Union[List[Dict], pd.DataFrame]:
         """
         Extrai os dados da API.
         
+        Args:
+            as_frame: Se True, monta direto o DataFrame coluna a coluna
+                (ver `_transform_to_frame`) em vez da lista de dicionários
+        
         Returns:
-            Lista de fatos em formato de dicionário
+            Lista de fatos em formato de dicionário (ou DataFrame)
         """
         logger.info("=" * 60)
         logger.info("INICIANDO EXTRAÇÃO DE CAT FACTS")
         logger.info("=" * 60)
         
+        self._prepare_checkpoint()
+        
         try:
             # Busca todos os fatos da API
-            raw_facts = self.api_client.get_all_facts(animal_type="cat")
+            fetch_start = time.perf_counter()
+            raw_facts = self.api_client.get_all_facts(animal_type="cat", checkpoint=self.checkpoint)
+            self.metrics.record_stage("fetch", time.perf_counter() - fetch_start, records=len(raw_facts))
             logger.info(f"Total de registros recebidos da API: {len(raw_facts)}")
             
+            raw_facts = self._drop_seen(raw_facts)
+            if self.dedup_index is not None:
+                logger.info(f"Registros inéditos segundo o índice de deduplicação: {len(raw_facts)}")
+            
             if not raw_facts:
                 logger.warning("Nenhum fato retornado pela API")
+                if as_frame:
+                    import pandas as pd
+                    return pd.DataFrame()
                 return []
             
             # Valida e transforma os dados
-            validated_facts = self._validate_and_transform(raw_facts)
+            if as_frame:
+                validated_facts = self._transform_to_frame(raw_facts)
+            else:
+                validated_facts = self._validate_and_transform(raw_facts)
             
             logger.info(f"Total de registros validados: {len(validated_facts)}")
             return validated_facts
+        
+        except Exception as e:
+            logger.error(f"Erro durante a extração: {e}", exc_info=True)
+            raise
+    
+    async def extract_async(self, client: Optional[AsyncCatFactsAPIClient] = None) -> List[Dict]:
+        """
+        Extrai os dados da API sem bloquear o event loop.
+        
+        Permite rodar várias extrações (ou outros endpoints) concorrentemente
+        com `asyncio.gather`, compartilhando o mesmo cliente assíncrono. A
+        validação, que é CPU-bound, roda no executor padrão do loop.
+        
+        Args:
+            client: Cliente assíncrono a reutilizar. Se omitido, um cliente
+                temporário é criado e fechado ao final.
+        
+        Returns:
+            Lista de fatos em formato de dicionário
+        """
+        logger.info("=" * 60)
+        logger.info("INICIANDO EXTRAÇÃO ASSÍNCRONA DE CAT FACTS")
+        logger.info("=" * 60)
+        
+        import asyncio
+        
+        owns_client = client is None
+        if owns_client:
+            from src.utils.async_api_client import AsyncCatFactsAPIClient
+            client = AsyncCatFactsAPIClient(metrics=self.metrics)
+        
+        try:
+            fetch_start = time.perf_counter()
+            raw_facts = await client.get_all_facts(animal_type="cat")
+            self.metrics.record_stage("fetch", time.perf_counter() - fetch_start, records=len(raw_facts))
+            logger.info(f"Total de registros recebidos da API: {len(raw_facts)}")
+            
+            if not raw_facts:
+                logger.warning("Nenhum fato retornado pela API")
+                return []
             
+            loop = asyncio.get_running_loop()
+            validated_facts = await loop.run_in_executor(None, self._validate_and_transform, raw_facts)
+            
+            logger.info(f"Total de registros validados: {len(validated_facts)}")
+            return validated_facts
+        
         except Exception as e:
             logger.error(f"Erro durante a extração: {e}", exc_info=True)
             raise
+        
+        finally:
+            if owns_client:
+                await client.close()
+    
+    def extract_stream(self) -> Iterator[Dict]:
+        """
+        Extrai os dados da API em modo streaming.
+        
+        Cada página é validada e entregue registro a registro assim que chega,
+        de modo que a memória fica limitada às páginas em voo, independente
+        do volume total extraído. O tempo de espera pelas páginas é
+        registrado na etapa 'fetch' das métricas.
+        
+        Yields:
+            Fatos validados em formato de dicionário
+        """
+        logger.info("=" * 60)
+        logger.info("INICIANDO EXTRAÇÃO DE CAT FACTS (STREAMING)")
+        logger.info("=" * 60)
+        
+        self._prepare_checkpoint()
+        
+        extraction_time = datetime.now(timezone.utc)
+        pages = IteratorTimer(self.api_client.iter_pages(animal_type="cat", checkpoint=self.checkpoint), size=len)
+        raw_facts = (fact_data for page in pages for fact_data in self._drop_seen(page))
+        
+        try:
+            yield from self._iter_validated(raw_facts, extraction_time)
+        finally:
+            self.metrics.record_stage("fetch", pages.seconds, records=pages.records)
+    
+    def extract_incremental(self, state: IncrementalStateStore) -> Iterator[Dict]:
+        """
+        Extrai apenas registros novos ou alterados desde a última execução.
+        
+        A paginação para ao encontrar páginas inalteradas (ver
+        `IncrementalStateStore.observe_page`) e cada página é filtrada pelos
+        hashes de conteúdo já vistos antes da validação.
+        
+        Args:
+            state: Store de estado incremental (confirmado pelo chamador
+                depois que a saída for gravada)
+        
+        Yields:
+            Fatos novos validados em formato de dicionário
+        """
+        logger.info("=" * 60)
+        logger.info("INICIANDO EXTRAÇÃO INCREMENTAL DE CAT FACTS")
+        logger.info("=" * 60)
+        
+        extraction_time = datetime.now(timezone.utc)
+        pages = IteratorTimer(self.api_client.iter_pages(animal_type="cat", stop_when=state.observe_page), size=len)
+        new_facts = (
+            fact_data for page in pages for fact_data in self._drop_seen(state.filter_new(page))
+        )
+        
+        try:
+            yield from self._iter_validated(new_facts, extraction_time)
+        finally:
+            self.metrics.record_stage("fetch", pages.seconds, records=pages.records)
     
     def _validate_and_transform(self, raw_facts: List[Dict]) -> List[Dict]:
         """
         Valida e transforma os dados brutos usando Pydantic.
         
+        Acima de `Config.VALIDATION_PARALLEL_THRESHOLD` registros a validação
+        é distribuída em vários processos (ver `src.transform.validate_parallel`).
+        
         Args:
             raw_facts: Lista de dicionários brutos da API
         
         Returns:
             Lista de dicionários validados e transformados
         """
+        from src.transform import ValidationStats, should_validate_in_parallel, validate_parallel
+        
         logger.info("Validando e transformando dados...")
         
         # Timestamp de extração (mesmo para todos os registros desta execução)
-        from datetime import datetime, timezone
         extraction_time = datetime.now(timezone.utc)
         
-        validated_facts = []
-        errors_count = 0
-        
-        for i, fact_data in enumerate(raw_facts, 1):
-            try:
-                # Valida usando o modelo Pydantic
-                fact = CatFact(**fact_data)
-                fact.extracted_at = extraction_time  # Adiciona timestamp de extração
-                validated_facts.append(fact.to_dict())
-                
-                if i % 100 == 0:
-                    logger.debug(f"Processados {i}/{len(raw_facts)} registros")
-                    
-            except ValidationError as e:
-                errors_count += 1
-                logger.warning(f"Erro de validação no registro {i}: {e}")
-                
-            except Exception as e:
-                errors_count += 1
-                logger.error(f"Erro inesperado no registro {i}: {e}")
-        
-        if errors_count > 0:
-            logger.warning(f"Total de registros com erro: {errors_count}")
+        if should_validate_in_parallel(len(raw_facts)):
+            stats = ValidationStats()
+            validated_facts = validate_parallel(raw_facts, extraction_time, stats)
+            self.metrics.record_stage("validate", stats.seconds, records=stats.processed)
+        else:
+            validated_facts = list(self._iter_validated(raw_facts, extraction_time))
         
         logger.info(f"Validação concluída: {len(validated_facts)} registros válidos")
         return validated_facts
     
-    def save_to_csv(self, facts: List[Dict], output_path: Path) -> None:
+    def _transform_to_frame(self, raw_facts: List[Dict]) -> pd.DataFrame:
+        """
+        Valida e transforma os dados brutos direto em colunas.
+        
+        Evita os dicionários por registro de `_validate_and_transform` (ver
+        `src.transform.facts_frame`); o resultado é o mesmo DataFrame.
+        
+        Args:
+            raw_facts: Lista de dicionários brutos da API
+        
+        Returns:
+            DataFrame validado e transformado
+        """
+        from src.transform import ValidationStats, facts_frame, facts_frame_parallel, should_validate_in_parallel
+        
+        logger.info("Validando e transformando dados (colunar)...")
+        
+        # Timestamp de extração (mesmo para todos os registros desta execução)
+        extraction_time = datetime.now(timezone.utc)
+        
+        stats = ValidationStats()
+        if should_validate_in_parallel(len(raw_facts)):
+            df = facts_frame_parallel(raw_facts, extraction_time, stats)
+        else:
+            df = facts_frame(raw_facts, extraction_time, stats)
+        self.metrics.record_stage("validate", stats.seconds, records=stats.processed)
+        
+        logger.info(f"Validação concluída: {len(df)} registros válidos")
+        return df
+    
+    def _iter_validated(self, raw_facts: Iterable[Dict], extraction_time: datetime) -> Iterator[Dict]:
+        """
+        Valida e achata os registros (ver `src.transform.iter_validated`).
+        
+        O tempo gasto na validação (sem a espera pelas páginas, no modo
+        streaming) é registrado na etapa 'validate' das métricas.
+        
+        Args:
+            raw_facts: Dicionários brutos da API (lista ou gerador)
+            extraction_time: Timestamp de extração compartilhado pelos registros
+        
+        Yields:
+            Dicionários validados e transformados
+        """
+        from src.transform import ValidationStats, iter_validated
+        
+        stats = ValidationStats()
+        try:
+            yield from iter_validated(raw_facts, extraction_time, stats)
+        finally:
+            self.metrics.record_stage("validate", stats.seconds, records=stats.processed)
+    
+    def save_to_csv(self, facts: Union[List[Dict], pd.DataFrame], output_path: Path) -> None:
         """
         Salva os dados em arquivo CSV.
         
         Args:
-            facts: Lista de fatos a serem salvos
+            facts: Lista de fatos (ou DataFrame já montado) a serem salvos
             output_path: Caminho do arquivo de saída
         """
-        if not facts:
+        if len(facts) == 0:
             logger.warning("Nenhum dado para salvar")
             return
         
+        import pandas as pd
+        
         logger.info(f"Salvando dados em CSV: {output_path}")
         
         try:
+            write_start = time.perf_counter()
+            
             # Cria DataFrame
-            df = pd.DataFrame(facts)
+            df = facts if isinstance(facts, pd.DataFrame) else pd.DataFrame(facts)
             
             # Remove duplicatas baseado no ID
             original_count = len(df)
@@ -149,23 +381,178 @@ class CatFactsExtractor:
             
             # Salva em CSV
             df.to_csv(output_path, index=False, encoding='utf-8')
+            self.metrics.record_stage(
+                "write",
+                time.perf_counter() - write_start,
+                records=len(df),
+                bytes_=output_path.stat().st_size
+            )
             
             logger.info(f"✓ Dados salvos com sucesso: {len(df)} registros")
             logger.info(f"✓ Arquivo: {output_path}")
             
             # Exibe estatísticas
-            self._display_statistics(df)
-            
+            self._display_statistics(df, output_path)
+        
+        except Exception as e:
+            logger.error(f"Erro ao salvar CSV: {e}", exc_info=True)
+            raise
+    
+    def save_to_csv_stream(self, facts: Iterable[Dict], output_path: Path, append: bool = False) -> int:
+        """
+        Salva os dados em CSV de forma incremental, linha a linha.
+        
+        Duplicatas são removidas pelo `id` à medida que os registros chegam
+        (`SeenIds`, com memória limitada); como não há DataFrame em memória,
+        o arquivo mantém a ordem de chegada.
+        O arquivo só é aberto quando o primeiro registro chega, então uma
+        execução sem dados não altera a saída existente. A etapa 'write' das
+        métricas desconta o tempo de espera pelos registros (busca e validação).
+        
+        Args:
+            facts: Fatos a serem salvos (lista ou gerador)
+            output_path: Caminho do arquivo de saída
+            append: Se True, acrescenta ao arquivo existente em vez de sobrescrevê-lo
+        
+        Returns:
+            Quantidade de registros gravados
+        """
+        logger.info(f"Salvando dados em CSV (streaming): {output_path}")
+        
+        source = IteratorTimer(facts)
+        seen_ids = SeenIds()
+        written = 0
+        duplicates_removed = 0
+        csv_file = None
+        writer = None
+        write_start = time.perf_counter()
+        
+        try:
+            for fact in source:
+                if not seen_ids.add(fact["id"]):
+                    duplicates_removed += 1
+                    continue
+                
+                if writer is None:
+                    has_header = append and output_path.exists() and output_path.stat().st_size > 0
+                    csv_file = open(output_path, "a" if append else "w", newline="", encoding="utf-8")
+                    writer = csv.DictWriter(csv_file, fieldnames=list(fact.keys()))
+                    if not has_header:
+                        writer.writeheader()
+                
+                writer.writerow(fact)
+                written += 1
+        
         except Exception as e:
             logger.error(f"Erro ao salvar CSV: {e}", exc_info=True)
             raise
+        
+        finally:
+            seen_ids.close()
+            if csv_file is not None:
+                csv_file.close()
+        
+        self.metrics.record_stage(
+            "write",
+            time.perf_counter() - write_start - source.seconds,
+            records=written,
+            bytes_=output_path.stat().st_size if written else 0
+        )
+        
+        if written == 0:
+            logger.warning("Nenhum dado para salvar")
+            return 0
+        
+        if duplicates_removed > 0:
+            logger.info(f"Removidas {duplicates_removed} duplicatas")
+        
+        logger.info(f"✓ Dados salvos com sucesso: {written} registros")
+        logger.info(f"✓ Arquivo: {output_path}")
+        logger.info(f"Tamanho do arquivo: {output_path.stat().st_size / 1024:.2f} KB")
+        return written
+    
+    def save_to_columnar(self, facts: Iterable[Dict], output_path: Path) -> int:
+        """
+        Salva os dados em Parquet ou Arrow IPC, conforme `Config.OUTPUT_FORMAT`.
+        
+        O tempo de escrita, sem a espera pelos registros, vai para a etapa
+        'write' das métricas.
+        
+        Args:
+            facts: Fatos a serem salvos (lista ou gerador)
+            output_path: Caminho do arquivo de saída
+        
+        Returns:
+            Quantidade de registros gravados
+        """
+        from src.utils.columnar_writer import ColumnarWriter
+        
+        logger.info(f"Salvando dados em {Config.OUTPUT_FORMAT}: {output_path}")
+        
+        source = IteratorTimer(facts)
+        
+        try:
+            write_start = time.perf_counter()
+            written = ColumnarWriter(output_path).write(source)
+        
+        except Exception as e:
+            logger.error(f"Erro ao salvar {Config.OUTPUT_FORMAT}: {e}", exc_info=True)
+            raise
+        
+        self.metrics.record_stage(
+            "write",
+            time.perf_counter() - write_start - source.seconds,
+            records=written,
+            bytes_=output_path.stat().st_size if written else 0
+        )
+        
+        if written == 0:
+            output_path.unlink(missing_ok=True)
+            logger.warning("Nenhum dado para salvar")
+            return 0
+        
+        logger.info(f"✓ Dados salvos com sucesso: {written} registros")
+        logger.info(f"✓ Arquivo: {output_path}")
+        logger.info(f"Tamanho do arquivo: {output_path.stat().st_size / 1024:.2f} KB")
+        return written
+    
+    def save_to_partition(self, facts: Iterable[Dict]) -> int:
+        """
+        Grava os dados como uma nova parte da partição de hoje em `Config.FACTS_DIR`.
+        
+        O tempo de escrita, sem a espera pelos registros, vai para a etapa
+        'write' das métricas.
+        
+        Args:
+            facts: Fatos a serem salvos (lista ou gerador)
+        
+        Returns:
+            Quantidade de registros gravados
+        """
+        from src.utils.partitioned_output import PartitionedOutput
+        
+        logger.info(f"Salvando delta particionado em {Config.FACTS_DIR}")
+        
+        source = IteratorTimer(facts)
+        
+        try:
+            write_start = time.perf_counter()
+            written = PartitionedOutput().write(source)
+            self.metrics.record_stage("write", time.perf_counter() - write_start - source.seconds, records=written)
+        
+        except Exception as e:
+            logger.error(f"Erro ao salvar partição: {e}", exc_info=True)
+            raise
+        
+        return written
     
-    def _display_statistics(self, df: pd.DataFrame) -> None:
+    def _display_statistics(self, df: pd.DataFrame, output_path: Path) -> None:
         """
         Exibe estatísticas sobre os dados extraídos.
         
         Args:
             df: DataFrame com os dados
+            output_path: Arquivo gravado
         """
         logger.info("")
         logger.info("=" * 60)
@@ -174,7 +561,7 @@ class CatFactsExtractor:
         
         logger.info(f"Total de registros: {len(df)}")
         logger.info(f"Total de colunas: {len(df.columns)}")
-        logger.info(f"Tamanho do arquivo: {Config.get_output_path().stat().st_size / 1024:.2f} KB")
+        logger.info(f"Tamanho do arquivo: {output_path.stat().st_size / 1024:.2f} KB")
         
         if 'type' in df.columns:
             logger.info(f"\nDistribuição por tipo:")
@@ -183,6 +570,7 @@ class CatFactsExtractor:
         
         if 'created_at' in df.columns and df['created_at'].notna().any():
             try:
+                import pandas as pd
                 df['created_date'] = pd.to_datetime(df['created_at'])
                 min_date = df['created_date'].min()
                 max_date = df['created_date'].max()
@@ -201,8 +589,22 @@ class CatFactsExtractor:
         
         logger.info("=" * 60)
     
-    def run(self) -> None:
-        """Executa o fluxo completo de extração."""
+    def run(self, stream: bool = False, incremental: bool = False, partitioned: bool = False) -> None:
+        """
+        Executa o fluxo completo de extração.
+        
+        Com `dedup_index` configurado, a saída CSV recebe apenas registros
+        inéditos e é acrescentada (não sobrescrita); o índice só é
+        confirmado depois que a gravação termina.
+        
+        Args:
+            stream: Se True, processa página a página (memória limitada)
+                em vez de materializar o dataset inteiro
+            incremental: Se True, busca e acrescenta à saída apenas os
+                registros novos ou alterados desde a última execução
+            partitioned: Se True, grava só o delta da execução como nova
+                parte em `Config.FACTS_DIR` (usa o índice de deduplicação)
+        """
         start_time = datetime.now()
         
         try:
@@ -215,44 +617,165 @@ class CatFactsExtractor:
                 logger.info(f"  {key}: {value}")
             logger.info("")
             
-            # Extrai os dados
-            facts = self.extract()
-            
-            # Salva em CSV
             output_path = Config.get_output_path()
-            self.save_to_csv(facts, output_path)
+            
+            if partitioned and self.dedup_index is None:
+                # O delta de cada execução é o que o índice ainda não viu
+                self.dedup_index = DedupIndex()
+            
+            if not partitioned and incremental and Config.OUTPUT_FORMAT != "csv":
+                raise ValueError("O modo incremental acrescenta ao CSV e requer OUTPUT_FORMAT=csv")
+            
+            if not partitioned and self.dedup_index is not None and Config.OUTPUT_FORMAT != "csv":
+                raise ValueError("O índice de deduplicação acrescenta ao CSV e requer OUTPUT_FORMAT=csv")
+            
+            if partitioned:
+                # Uma nova parte por execução; nada do histórico é reescrito
+                state = IncrementalStateStore() if incremental else None
+                try:
+                    self.save_to_partition(self.extract_incremental(state) if state else self.extract_stream())
+                    if state is not None:
+                        state.commit()
+                    else:
+                        self._finalize_checkpoint()
+                finally:
+                    if state is not None:
+                        state.close()
+            elif incremental:
+                # Acrescenta apenas o delta e só então confirma o estado
+                state = IncrementalStateStore()
+                try:
+                    self.save_to_csv_stream(self.extract_incremental(state), output_path, append=True)
+                    state.commit()
+                finally:
+                    state.close()
+            elif self.dedup_index is not None:
+                # Acrescenta apenas os registros inéditos, página a página
+                self.save_to_csv_stream(self.extract_stream(), output_path, append=True)
+                self._finalize_checkpoint()
+            elif Config.OUTPUT_FORMAT != "csv":
+                # Parquet/Arrow já gravam em row groups à medida que os registros chegam
+                facts = self.extract_stream() if stream else self.extract()
+                self.save_to_columnar(facts, output_path)
+                self._finalize_checkpoint()
+            elif stream:
+                # Extrai, valida e grava registro a registro
+                self.save_to_csv_stream(self.extract_stream(), output_path)
+                self._finalize_checkpoint()
+            else:
+                # Extrai os dados (DataFrame montado coluna a coluna)
+                facts = self.extract(as_frame=True)
+                
+                # Salva em CSV
+                self.save_to_csv(facts, output_path)
+                self._finalize_checkpoint()
             
             # Tempo de execução
+            if self.dedup_index is not None:
+                self.dedup_index.commit()
+            
             elapsed_time = datetime.now() - start_time
+            self.metrics.record_stage("total", elapsed_time.total_seconds())
             logger.info("")
             logger.info("=" * 60)
             logger.info(f"✓ EXTRAÇÃO CONCLUÍDA COM SUCESSO")
             logger.info(f"✓ Tempo de execução: {elapsed_time}")
             logger.info("=" * 60)
-            
+        
         except Exception as e:
             logger.error("")
             logger.error("=" * 60)
             logger.error(f"✗ FALHA NA EXTRAÇÃO: {e}")
             logger.error("=" * 60)
             raise
-            
+        
         finally:
             # Fecha o cliente da API
             self.api_client.close()
+            if self.dedup_index is not None:
+                self.dedup_index.close()
+            self._export_metrics()
+    
+    def _export_metrics(self) -> None:
+        """Resume as métricas no log e grava o relatório (JSON e, opcionalmente, Prometheus)."""
+        report = self.metrics.to_dict()
+        
+        logger.info("Métricas por etapa:")
+        for stage, totals in report["stages"].items():
+            throughput = f" ({totals['records_per_sec']:,.0f} registros/s)" if totals["records_per_sec"] else ""
+            logger.info(f"  - {stage}: {totals['seconds']:.3f}s{throughput}")
+        logger.info(
+            f"  - HTTP: {self.metrics.counter_value('http_requests_total'):.0f} requisições, "
+            f"{self.metrics.counter_value('http_response_bytes_total') / 1024:.1f} KB, "
+            f"{self.metrics.counter_value('http_retries_total'):.0f} retries, "
+            f"{self.metrics.counter_value('http_rate_limited_total'):.0f} respostas 429"
+        )
+        
+        metrics_path = Config.get_metrics_path()
+        prometheus_path = metrics_path.with_suffix(".prom") if Config.METRICS_PROMETHEUS else None
+        
+        try:
+            self.metrics.write_report(metrics_path, prometheus_path)
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar as métricas: {e}")
 
 
-def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Lê os argumentos de linha de comando.
+    
+    Args:
+        argv: Argumentos (padrão: sys.argv)
+    
+    Returns:
+        Argumentos parseados
+    """
+    parser = argparse.ArgumentParser(description="Extração de Cat Facts para CSV")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Processa página a página, sem carregar o dataset inteiro em memória"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Retoma um crawl interrompido a partir do checkpoint em DATA_DIR"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Busca e acrescenta à saída apenas registros novos ou alterados"
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        default=Config.DEDUP_INDEX_ENABLED,
+        help="Descarta registros já gravados em execuções anteriores (de qualquer API) "
+             "usando o índice persistente em DATA_DIR"
+    )
+    parser.add_argument(
+        "--partitioned",
+        action="store_true",
+        default=Config.OUTPUT_PARTITIONED,
+        help="Grava só o delta da execução em DATA_DIR/facts/ingestion_date=YYYY-MM-DD/part-N"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Função principal."""
+    args = parse_args(argv)
+    
     try:
-        extractor = CatFactsExtractor()
-        extractor.run()
+        dedup_index = DedupIndex() if args.dedup else None
+        extractor = CatFactsExtractor(resume=args.resume, dedup_index=dedup_index)
+        extractor.run(stream=args.stream, incremental=args.incremental, partitioned=args.partitioned)
         sys.exit(0)
-        
+    
     except KeyboardInterrupt:
         logger.warning("\nExtração interrompida pelo usuário")
         sys.exit(1)
-        
+    
     except Exception as e:
         logger.error(f"Erro fatal: {e}", exc_info=True)
         sys.exit(1)
@@ -0,0 +1,304 @@
+"""
+Estágio Bronze do pipeline: ingestão das respostas brutas da API.
+
+Cada resposta da API é gravada com o corpo exatamente como veio, sem
+nenhuma transformação, em `Config.BRONZE_DIR`, junto com um manifesto que
+descreve a execução (inclusive se o crawl terminou completo). O manifesto é o contrato de entrada do estágio Silver
+(`src/transform.py`), que pode ser reexecutado a partir do Bronze sem
+chamar a API novamente.
+
+Layout:
+    bronze/ingestion_date=YYYY-MM-DD/run_id=<run_id>/page_00001.json
+    bronze/ingestion_date=YYYY-MM-DD/run_id=<run_id>/_manifest.json
+
+Uso:
+    python src/ingestion.py [--print-run-id]
+"""
+
+import argparse
+import json
+import sys
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import Config
+from src.utils import json_codec
+from src.utils.api_client import CatFactsAPIClient
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+MANIFEST_FILENAME = "_manifest.json"
+
+
+def new_run_id(now: Optional[datetime] = None) -> str:
+    """
+    Gera o identificador de uma execução do pipeline (`pipeline_execution_id`).
+    
+    O prefixo de timestamp faz com que a ordem lexicográfica seja cronológica.
+    
+    Args:
+        now: Momento da execução (padrão: agora, em UTC)
+    
+    Returns:
+        Identificador no formato YYYYMMDDTHHMMSSZ-xxxxxxxx
+    """
+    now = now or datetime.now(timezone.utc)
+    return f"{now.strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:8]}"
+
+
+def source_api_name(base_url: str) -> str:
+    """
+    Retorna o nome da fonte (`source_api`) conforme SCHEMA_DOCUMENTATION.md.
+    
+    Args:
+        base_url: URL base da API
+    
+    Returns:
+        'catfact.ninja' ou 'catfacts-api.herokuapp.com'
+    """
+    if "catfact.ninja" in base_url:
+        return "catfact.ninja"
+    return "catfacts-api.herokuapp.com"
+
+
+@dataclass
+class BronzeBatch:
+    """Resultado do estágio Bronze: uma execução de ingestão gravada em disco."""
+    
+    run_id: str
+    source_api: str
+    base_url: str
+    ingestion_timestamp: datetime
+    run_dir: Path
+    page_files: List[str] = field(default_factory=list)
+    record_count: int = 0
+    expected_records: Optional[int] = None
+    error: Optional[str] = None
+    
+    @property
+    def complete(self) -> bool:
+        """Se o crawl terminou sem erro e com todos os registros esperados."""
+        if self.error is not None:
+            return False
+        return self.expected_records is None or self.record_count >= self.expected_records
+    
+    @property
+    def manifest_path(self) -> Path:
+        """Caminho do manifesto da execução."""
+        return self.run_dir / MANIFEST_FILENAME
+    
+    def save_manifest(self) -> None:
+        """Grava o manifesto da execução."""
+        manifest = {
+            "run_id": self.run_id,
+            "source_api": self.source_api,
+            "base_url": self.base_url,
+            "ingestion_timestamp": self.ingestion_timestamp.isoformat(),
+            "page_files": self.page_files,
+            "record_count": self.record_count,
+            "expected_records": self.expected_records,
+            "complete": self.complete,
+            "error": self.error,
+        }
+        self.manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    
+    @classmethod
+    def from_manifest(cls, manifest_path: Path) -> "BronzeBatch":
+        """
+        Reconstrói um lote Bronze a partir do manifesto.
+        
+        Args:
+            manifest_path: Caminho do `_manifest.json`
+        
+        Returns:
+            Lote Bronze
+        """
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        return cls(
+            run_id=manifest["run_id"],
+            source_api=manifest["source_api"],
+            base_url=manifest["base_url"],
+            ingestion_timestamp=datetime.fromisoformat(manifest["ingestion_timestamp"]),
+            run_dir=manifest_path.parent,
+            page_files=manifest["page_files"],
+            record_count=manifest["record_count"],
+            expected_records=manifest["expected_records"],
+            error=manifest["error"],
+        )
+    
+    def iter_responses(self) -> Iterator[Any]:
+        """
+        Lê as respostas brutas gravadas, uma página por vez.
+        
+        Yields:
+            Resposta JSON de cada página, na ordem de ingestão
+        """
+        for page_file in self.page_files:
+            yield json_codec.loads((self.run_dir / page_file).read_bytes())
+
+
+def records_from_response(response: Any) -> List[Dict]:
+    """
+    Extrai a lista de registros de uma resposta bruta da API.
+    
+    Args:
+        response: Página paginada ({"data": [...]}), lista bulk ou objeto único
+    
+    Returns:
+        Registros brutos
+    """
+    if isinstance(response, dict) and "data" in response:
+        return response["data"]
+    if isinstance(response, list):
+        return response
+    if isinstance(response, dict):
+        return [response]
+    return []
+
+
+def expected_records(client: CatFactsAPIClient, first_response: Any, max_pages: int) -> Optional[int]:
+    """
+    Registros que um crawl completo deve trazer.
+    
+    Args:
+        client: Cliente usado na ingestão
+        first_response: Primeira resposta recebida
+        max_pages: Limite de páginas do crawl (de API_PAGE_SIZE registros)
+    
+    Returns:
+        Total esperado, ou None se a API não informa o total
+    """
+    if not client.paginated:
+        return Config.BULK_TARGET_RECORDS
+    if isinstance(first_response, dict) and "total" in first_response:
+        return min(first_response["total"], max_pages * client.page_size)
+    return None
+
+
+def ingest(client: Optional[CatFactsAPIClient] = None, max_pages: int = 10) -> BronzeBatch:
+    """
+    Executa o estágio Bronze: busca as respostas da API e grava como vieram.
+    
+    Cada página (ou lote bulk de `/facts/random`) vira um arquivo com o
+    corpo da resposta, sem decodificar nem deduplicar (a deduplicação é
+    do estágio Silver). `source_api` e `base_url` do manifesto vêm do
+    cliente usado.
+    
+    O manifesto registra os registros esperados e se o crawl terminou
+    completo: uma página que falha encerra o crawl antes do fim, e um erro
+    é gravado no manifesto antes de ser propagado. O estágio Silver recusa
+    lotes incompletos.
+    
+    Args:
+        client: Cliente da API (padrão: um cliente novo, fechado ao final)
+        max_pages: Número máximo de páginas a buscar (para APIs com paginação)
+    
+    Returns:
+        Lote Bronze gravado
+    """
+    ingestion_timestamp = datetime.now(timezone.utc)
+    run_id = new_run_id(ingestion_timestamp)
+    run_dir = (
+        Config.BRONZE_DIR
+        / f"ingestion_date={ingestion_timestamp.date().isoformat()}"
+        / f"run_id={run_id}"
+    )
+    run_dir.mkdir(parents=True, exist_ok=True)
+    
+    owns_client = client is None
+    client = client or CatFactsAPIClient()
+    
+    batch = BronzeBatch(
+        run_id=run_id,
+        source_api=source_api_name(client.base_url),
+        base_url=client.base_url,
+        ingestion_timestamp=ingestion_timestamp,
+        run_dir=run_dir,
+    )
+    
+    logger.info(f"Bronze: iniciando ingestão {run_id}")
+    
+    try:
+        for page_number, (response, body) in enumerate(client.iter_responses(max_pages=max_pages), 1):
+            if page_number == 1:
+                batch.expected_records = expected_records(client, response, max_pages)
+            
+            page_file = f"page_{page_number:05d}.json"
+            (run_dir / page_file).write_bytes(body)
+            
+            batch.page_files.append(page_file)
+            batch.record_count += len(records_from_response(response))
+    
+    except Exception as e:
+        batch.error = f"{type(e).__name__}: {e}"
+        batch.save_manifest()
+        raise
+    
+    finally:
+        if owns_client:
+            client.close()
+    
+    batch.save_manifest()
+    logger.info(f"Bronze: {len(batch.page_files)} páginas, {batch.record_count} registros em {run_dir}")
+    if not batch.complete:
+        logger.warning(
+            f"Bronze: lote {run_id} incompleto ({batch.record_count} de "
+            f"{batch.expected_records} registros esperados)"
+        )
+    return batch
+
+
+def find_bronze_batch(run_id: Optional[str] = None) -> BronzeBatch:
+    """
+    Localiza um lote Bronze já gravado.
+    
+    Args:
+        run_id: Execução desejada (padrão: a mais recente)
+    
+    Returns:
+        Lote Bronze
+    
+    Raises:
+        FileNotFoundError: Nenhum lote encontrado
+    """
+    pattern = f"ingestion_date=*/run_id={run_id or '*'}/{MANIFEST_FILENAME}"
+    manifests = sorted(Config.BRONZE_DIR.glob(pattern), key=lambda path: path.parent.name)
+    
+    if not manifests:
+        raise FileNotFoundError(f"Nenhum lote Bronze encontrado em {Config.BRONZE_DIR} ({pattern})")
+    
+    return BronzeBatch.from_manifest(manifests[-1])
+
+
+def main(argv: Optional[List[str]] = None):
+    """Executa apenas o estágio Bronze."""
+    parser = argparse.ArgumentParser(description="Estágio Bronze: respostas brutas da API")
+    parser.add_argument(
+        "--print-run-id",
+        action="store_true",
+        help="Escreve o run_id do lote gravado na saída padrão (para encadear estágios)"
+    )
+    args = parser.parse_args(argv)
+    
+    try:
+        batch = ingest()
+        logger.info(f"Bronze: lote {batch.run_id} gravado")
+        if args.print_run_id:
+            print(batch.run_id)
+        sys.exit(0)
+    
+    except Exception as e:
+        logger.error(f"Erro fatal na ingestão: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
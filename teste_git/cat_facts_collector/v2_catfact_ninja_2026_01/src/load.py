@@ -0,0 +1,327 @@
+"""
+Estágio Gold do pipeline: star schema `fact_cat_facts`.
+
+Lê o Parquet de um lote Silver (`src/transform.py`) e monta o modelo
+dimensional descrito em `bigquery_schema/DIMENSIONAL_MODEL.md`: a tabela
+fato `fact_cat_facts` e as dimensões `dim_source`, `dim_date`, `dim_time`
+e `dim_quality`, gravadas em Parquet em `Config.GOLD_DIR`.
+
+Layout:
+    gold/fact_cat_facts/ingestion_date=YYYY-MM-DD/run_id=<run_id>.parquet
+    gold/dim_source.parquet, gold/dim_date.parquet, ...
+
+Uso:
+    python src/load.py [--run-id RUN_ID] [--print-run-id]
+"""
+
+import argparse
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import Config
+from src.transform import SilverBatch, find_silver_batch
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+# dim_source (SCD Tipo 1) - fontes conhecidas
+DIM_SOURCE_ROWS = [
+    {
+        "source_key": 1,
+        "source_id": "catfact-ninja",
+        "source_name": "catfact.ninja",
+        "source_type": "primary",
+        "is_active": True,
+        "api_endpoint": "https://catfact.ninja/facts",
+        "effective_date": "2024-01-01",
+    },
+    {
+        "source_key": 2,
+        "source_id": "catfacts-api-heroku",
+        "source_name": "catfacts-api.herokuapp.com",
+        "source_type": "alternative",
+        "is_active": False,
+        "api_endpoint": "https://cat-fact.herokuapp.com/facts",
+        "effective_date": "2024-01-01",
+    },
+]
+
+# dim_quality (SCD Tipo 1) - tiers de qualidade
+DIM_QUALITY_ROWS = [
+    {"quality_key": 1, "quality_tier": "Excelente", "min_score": 90.0, "max_score": 100.0,
+     "tier_description": "Alta qualidade, verificados e únicos"},
+    {"quality_key": 2, "quality_tier": "Bom", "min_score": 70.0, "max_score": 89.9,
+     "tier_description": "Boa qualidade, pequenas inconsistências"},
+    {"quality_key": 3, "quality_tier": "Razoável", "min_score": 50.0, "max_score": 69.9,
+     "tier_description": "Qualidade aceitável, requer atenção"},
+    {"quality_key": 4, "quality_tier": "Ruim", "min_score": 0.0, "max_score": 49.9,
+     "tier_description": "Baixa qualidade, revisar ou descartar"},
+]
+
+DAY_NAMES = ["Segunda-feira", "Terça-feira", "Quarta-feira", "Quinta-feira", "Sexta-feira", "Sábado", "Domingo"]
+MONTH_NAMES = [
+    "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho",
+    "Julho", "Agosto", "Setembro", "Outubro", "Novembro", "Dezembro",
+]
+
+
+def quality_scores(facts: pd.DataFrame) -> pd.Series:
+    """
+    Calcula o `data_quality_score` (0-100) de cada registro.
+    
+    Mesma regra de `calculate_quality_score` em SCHEMA_DOCUMENTATION.md,
+    aplicada de forma vetorizada. Registros Silver já são deduplicados,
+    então a penalidade de duplicata não se aplica.
+    
+    Args:
+        facts: DataFrame Silver
+    
+    Returns:
+        Série com os scores
+    """
+    text = facts["text"].fillna("")
+    score = pd.Series(100.0, index=facts.index)
+    
+    score -= (text == "") * 50
+    score -= (text.str.len() < 10) * 20
+    score -= (facts["length"].fillna(0) == 0) * 10
+    score += (facts["upvotes"].fillna(0) > 5) * 10
+    score += facts["created_at"].notna() * 5
+    
+    return score.clip(0, 100)
+
+
+def quality_keys(scores: pd.Series) -> pd.Series:
+    """
+    Mapeia cada score para a `quality_key` do seu tier em `dim_quality`.
+    
+    Args:
+        scores: Scores de qualidade
+    
+    Returns:
+        Série com as quality_keys
+    """
+    keys = pd.Series(4, index=scores.index)
+    keys[scores >= 50.0] = 3
+    keys[scores >= 70.0] = 2
+    keys[scores >= 90.0] = 1
+    return keys
+
+
+def time_period(hours: pd.Series) -> pd.Series:
+    """
+    Classifica a hora no período do dia de `dim_time`.
+    
+    Args:
+        hours: Horas (0-23)
+    
+    Returns:
+        Série com Madrugada, Manhã, Tarde ou Noite
+    """
+    return pd.cut(
+        hours,
+        bins=[-1, 5, 11, 17, 23],
+        labels=["Madrugada", "Manhã", "Tarde", "Noite"]
+    ).astype(str)
+
+
+def fact_keys(run_id: str, fact_ids: pd.Series) -> pd.Series:
+    """
+    Surrogate keys da tabela fato, derivadas de (run_id, fact_id).
+    
+    O mesmo fact coletado em execuções diferentes gera linhas diferentes
+    (o grão de `fact_cat_facts` é uma linha por coleta); recarregar o mesmo
+    lote gera as mesmas chaves.
+    
+    Args:
+        run_id: Execução do lote
+        fact_ids: IDs de negócio dos facts
+    
+    Returns:
+        Chaves inteiras não negativas, uma por fact
+    """
+    pairs = pd.DataFrame({"run_id": run_id, "fact_id": fact_ids.to_numpy()})
+    return pd.util.hash_pandas_object(pairs, index=False).astype("int64").abs()
+
+
+def build_fact_table(facts: pd.DataFrame, silver: SilverBatch) -> pd.DataFrame:
+    """
+    Monta a tabela fato `fact_cat_facts` a partir dos dados Silver.
+    
+    Args:
+        facts: DataFrame Silver
+        silver: Lote Silver (fonte e timestamp de ingestão)
+    
+    Returns:
+        DataFrame no layout de `fact_cat_facts`
+    """
+    source_keys = {row["source_name"]: row["source_key"] for row in DIM_SOURCE_ROWS}
+    ingestion_timestamp = silver.ingestion_timestamp
+    scores = quality_scores(facts)
+    
+    return pd.DataFrame({
+        # Surrogate key estável: uma linha por coleta (lote + ID de negócio)
+        "fact_key": fact_keys(silver.run_id, facts["id"]),
+        "fact_id": facts["id"],
+        "fact_text": facts["text"],
+        "fact_length": facts["length"],
+        "upvotes_count": facts["upvotes"],
+        "quality_score": scores,
+        "source_key": source_keys.get(silver.source_api, 0),
+        "date_key": int(ingestion_timestamp.strftime("%Y%m%d")),
+        "time_key": int(ingestion_timestamp.strftime("%H%M%S")),
+        "quality_key": quality_keys(scores),
+        "fact_type": facts["type"],
+        "is_verified": True,  # Passou pela validação Silver
+        # ingestion_date vem da partição (ingestion_date=YYYY-MM-DD)
+    })
+
+
+def build_dim_date(date_keys: pd.Series) -> pd.DataFrame:
+    """
+    Monta as linhas de `dim_date` para as datas informadas.
+    
+    Args:
+        date_keys: date_keys no formato YYYYMMDD
+    
+    Returns:
+        DataFrame no layout de `dim_date`
+    """
+    dates = pd.to_datetime(date_keys.drop_duplicates().astype(str), format="%Y%m%d")
+    
+    return pd.DataFrame({
+        "date_key": dates.dt.strftime("%Y%m%d").astype("int64"),
+        "full_date": dates.dt.date,
+        "day_of_week": dates.dt.dayofweek + 1,
+        "day_name": dates.dt.dayofweek.map(lambda day: DAY_NAMES[day]),
+        "month": dates.dt.month,
+        "month_name": dates.dt.month.map(lambda month: MONTH_NAMES[month - 1]),
+        "quarter": dates.dt.quarter,
+        "year": dates.dt.year,
+        "is_weekend": dates.dt.dayofweek >= 5,
+    })
+
+
+def build_dim_time(time_keys: pd.Series) -> pd.DataFrame:
+    """
+    Monta as linhas de `dim_time` para os horários informados.
+    
+    Args:
+        time_keys: time_keys no formato HHMMSS
+    
+    Returns:
+        DataFrame no layout de `dim_time`
+    """
+    time_keys = time_keys.drop_duplicates().astype("int64")
+    hours = time_keys // 10000
+    
+    return pd.DataFrame({
+        "time_key": time_keys,
+        "hour": hours,
+        "minute": time_keys // 100 % 100,
+        "second": time_keys % 100,
+        "period": time_period(hours),
+    })
+
+
+def _merge_dimension(new_rows: pd.DataFrame, path: Path, key: str) -> None:
+    """
+    Acrescenta linhas novas a uma dimensão conforme (SCD Tipo 0) em disco.
+    
+    Args:
+        new_rows: Linhas da execução atual
+        path: Parquet da dimensão
+        key: Chave primária da dimensão
+    """
+    if path.exists():
+        new_rows = pd.concat([pd.read_parquet(path), new_rows], ignore_index=True)
+    
+    new_rows.drop_duplicates(subset=[key], keep="first").sort_values(key).to_parquet(path, index=False)
+
+
+@dataclass
+class GoldBatch:
+    """Resultado do estágio Gold: star schema de uma execução."""
+    
+    run_id: str
+    fact_path: Path
+    fact_count: int
+    dimension_paths: Dict[str, Path] = field(default_factory=dict)
+
+
+def load(silver: SilverBatch) -> GoldBatch:
+    """
+    Executa o estágio Gold a partir de um lote Silver.
+    
+    A partição da execução na tabela fato é sobrescrita, então reexecutar
+    o estágio para o mesmo lote é idempotente.
+    
+    Args:
+        silver: Lote Silver de entrada
+    
+    Returns:
+        Lote Gold gravado
+    """
+    logger.info(f"Gold: carregando lote Silver {silver.run_id}")
+    
+    facts = pq.read_table(silver.data_path).to_pandas()
+    fact_table = build_fact_table(facts, silver)
+    
+    fact_dir = Config.GOLD_DIR / "fact_cat_facts" / f"ingestion_date={silver.ingestion_timestamp.date().isoformat()}"
+    fact_dir.mkdir(parents=True, exist_ok=True)
+    fact_path = fact_dir / f"run_id={silver.run_id}.parquet"
+    fact_table.to_parquet(fact_path, index=False)
+    
+    dimension_paths = {
+        name: Config.GOLD_DIR / f"{name}.parquet"
+        for name in ("dim_source", "dim_date", "dim_time", "dim_quality")
+    }
+    pd.DataFrame(DIM_SOURCE_ROWS).to_parquet(dimension_paths["dim_source"], index=False)
+    pd.DataFrame(DIM_QUALITY_ROWS).to_parquet(dimension_paths["dim_quality"], index=False)
+    _merge_dimension(build_dim_date(fact_table["date_key"]), dimension_paths["dim_date"], "date_key")
+    _merge_dimension(build_dim_time(fact_table["time_key"]), dimension_paths["dim_time"], "time_key")
+    
+    logger.info(f"Gold: {len(fact_table)} fatos em {fact_path}")
+    return GoldBatch(
+        run_id=silver.run_id,
+        fact_path=fact_path,
+        fact_count=len(fact_table),
+        dimension_paths=dimension_paths,
+    )
+
+
+def main(argv: Optional[List[str]] = None):
+    """Reexecuta apenas o estágio Gold a partir de um lote Silver."""
+    parser = argparse.ArgumentParser(description="Estágio Gold: Silver -> star schema")
+    parser.add_argument("--run-id", help="Lote Silver a carregar (padrão: o mais recente)")
+    parser.add_argument(
+        "--print-run-id",
+        action="store_true",
+        help="Escreve o run_id do lote gravado na saída padrão (para encadear estágios)"
+    )
+    args = parser.parse_args(argv)
+    
+    try:
+        gold = load(find_silver_batch(args.run_id))
+        logger.info(f"Gold: lote {gold.run_id} gravado")
+        if args.print_run_id:
+            print(gold.run_id)
+        sys.exit(0)
+    
+    except Exception as e:
+        logger.error(f"Erro fatal na carga: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
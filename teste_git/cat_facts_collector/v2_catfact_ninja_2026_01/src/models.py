@@ -5,8 +5,11 @@ Define a estrutura esperada dos dados da API Cat Facts.
 """
 
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, ConfigDict, Field, StrictStr, TypeAdapter, validator
+from typing_extensions import Annotated, TypedDict
+
+from src.utils.hashing import content_id
 
 
 class User(BaseModel):
@@ -74,8 +77,8 @@ class CatFact(BaseModel):
         # Usa 'fact' ou 'text' como texto do fato
         fact_text = self.fact or self.text
         
-        # Gera um ID se não houver
-        fact_id = self.id or str(hash(fact_text))[:16] if fact_text else "unknown"
+        # Gera um ID estável (prefixo do hash_content) se não houver
+        fact_id = self.id or content_id(fact_text) if fact_text else "unknown"
         
         return {
             "id": fact_id,
@@ -94,3 +97,50 @@ class CatFact(BaseModel):
             "length": self.length or (len(fact_text) if fact_text else None),
             "extracted_at": self.extracted_at.isoformat() if self.extracted_at else datetime.now(timezone.utc).isoformat(),
         }
+
+
+class NinjaFact(TypedDict):
+    """Formato conhecido de um registro da API catfact.ninja (`fact`, `length`)."""
+    
+    __pydantic_config__ = ConfigDict(extra="forbid")
+    
+    fact: Annotated[StrictStr, Field(min_length=1)]
+    length: int
+
+
+# Valida uma página inteira de registros catfact.ninja em uma única chamada
+NINJA_FACTS_ADAPTER = TypeAdapter(List[NinjaFact])
+
+
+def ninja_fact_to_dict(fact: Dict[str, Any], extracted_at: str) -> Dict[str, Any]:
+    """
+    Achata um registro catfact.ninja já validado, sem construir um `CatFact`.
+    
+    Produz exatamente o mesmo dicionário que `CatFact(**fact).to_dict()`.
+    
+    Args:
+        fact: Registro validado por `NINJA_FACTS_ADAPTER`
+        extracted_at: Timestamp de extração já formatado em ISO 8601
+    
+    Returns:
+        Dicionário com os dados do fato
+    """
+    fact_text = fact["fact"]
+    
+    return {
+        "id": content_id(fact_text),
+        "text": fact_text,
+        "type": None,
+        "user_id": None,
+        "user_name": None,
+        "upvotes": 0,
+        "user_upvoted": None,
+        "created_at": None,
+        "updated_at": None,
+        "deleted": False,
+        "source": None,
+        "used": None,
+        "sent_count": None,
+        "length": fact["length"] or len(fact_text),
+        "extracted_at": extracted_at,
+    }
@@ -0,0 +1,353 @@
+"""
+Extração simultânea de várias APIs de fatos para um dataset unificado.
+
+Cada fonte é descrita por uma `SourceDefinition` (URL base, estratégia
+`paginated` ou `bulk`, endpoint e mapeamento de campos), lida de
+`Config.SOURCES_FILE` (JSON) ou, se o arquivo não existir, de
+`DEFAULT_SOURCES` (catfact.ninja e a API oficial Heroku). As fontes rodam
+em paralelo, cada uma com seu próprio cliente e rate limiter; a falha de
+uma fonte é registrada e não interrompe as demais.
+
+Os registros validados recebem a coluna `source_api` e são gravados em um
+único arquivo (`Config.SOURCES_OUTPUT_FILENAME`, no formato de
+`OUTPUT_FORMAT`). Um mesmo texto vindo de mais de uma fonte é mantido uma
+vez só, na primeira fonte da lista.
+
+Uso:
+    python src/orchestrator.py
+    python src/orchestrator.py --sources sources.json --only catfact.ninja
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import Config
+from src.transform import ValidationStats, iter_validated
+from src.utils.api_client import CatFactsAPIClient
+from src.utils.hashing import content_id
+from src.utils.logger import setup_logger
+from src.utils.metrics import MetricsRegistry
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+logger = setup_logger(__name__)
+
+STRATEGIES = ("paginated", "bulk")
+
+
+@dataclass
+class SourceDefinition:
+    """Uma API de origem e como extrair dela."""
+    
+    name: str  # Valor gravado em `source_api`
+    base_url: str
+    strategy: str = "paginated"  # paginated (limit/page) | bulk (amount)
+    endpoint: Optional[str] = None  # Padrão: FACTS_ENDPOINT / RANDOM_FACT_ENDPOINT
+    mapping: Dict[str, str] = field(default_factory=dict)  # Campo do CatFact -> campo da resposta
+    max_pages: int = 10
+    target_records: Optional[int] = None  # bulk: registros pedidos (padrão: BULK_TARGET_RECORDS)
+    rate_limit: Optional[float] = None  # Requisições/segundo (padrão: API_RATE_LIMIT; 0 = sem limite)
+    rate_burst: Optional[int] = None  # Padrão: API_RATE_BURST
+    concurrency: Optional[int] = None  # Padrão: API_CONCURRENCY
+    enabled: bool = True
+    
+    def __post_init__(self):
+        if self.strategy not in STRATEGIES:
+            raise ValueError(f"Estratégia desconhecida para a fonte {self.name}: {self.strategy}")
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "SourceDefinition":
+        """
+        Cria a definição a partir de um item do arquivo de fontes.
+        
+        Args:
+            data: Dicionário com os campos da dataclass (`name` e `base_url` obrigatórios)
+        
+        Returns:
+            Definição da fonte
+        
+        Raises:
+            ValueError: Campo desconhecido, ausente ou estratégia inválida
+        """
+        try:
+            return cls(**data)
+        except TypeError as e:
+            raise ValueError(f"Definição de fonte inválida {data}: {e}") from e
+
+
+DEFAULT_SOURCES = [
+    SourceDefinition(name="catfact.ninja", base_url="https://catfact.ninja", strategy="paginated"),
+    SourceDefinition(
+        name="catfacts-api.herokuapp.com",
+        base_url="https://cat-fact.herokuapp.com",
+        strategy="bulk",
+        endpoint="/facts/random"
+    ),
+]
+
+
+def load_sources(path: Optional[Path] = None) -> List[SourceDefinition]:
+    """
+    Lê as definições de fonte habilitadas.
+    
+    Args:
+        path: Arquivo JSON com uma lista de fontes (padrão: Config.SOURCES_FILE)
+    
+    Returns:
+        Fontes habilitadas, na ordem do arquivo (ou `DEFAULT_SOURCES`, se ele não existir)
+    """
+    path = path or Config.BASE_DIR / Config.SOURCES_FILE
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            sources = [SourceDefinition.from_dict(item) for item in json.load(f)]
+    else:
+        logger.info(f"{path} não encontrado - usando as fontes padrão")
+        sources = DEFAULT_SOURCES
+    
+    names = [source.name for source in sources]
+    if len(names) != len(set(names)):
+        raise ValueError(f"Nomes de fonte repetidos: {names}")
+    
+    return [source for source in sources if source.enabled]
+
+
+def apply_mapping(record: Dict, mapping: Dict[str, str]) -> Dict:
+    """
+    Renomeia os campos de um registro bruto para os nomes do `CatFact`.
+    
+    Args:
+        record: Registro bruto da API
+        mapping: Campo do `CatFact` -> campo correspondente na resposta
+    
+    Returns:
+        Cópia do registro com os campos renomeados (o próprio registro, sem mapeamento)
+    """
+    if not mapping or not isinstance(record, dict):
+        return record
+    
+    mapped = dict(record)
+    for target, source_field in mapping.items():
+        if source_field in mapped:
+            mapped[target] = mapped.pop(source_field)
+    return mapped
+
+
+@dataclass
+class SourceResult:
+    """Resultado da extração de uma fonte."""
+    
+    source: str
+    records: List[Dict] = field(default_factory=list)
+    raw_count: int = 0
+    validation_errors: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _client(source: SourceDefinition, metrics: MetricsRegistry) -> CatFactsAPIClient:
+    """Cria o cliente da fonte, com um rate limiter só dela."""
+    rate = Config.API_RATE_LIMIT if source.rate_limit is None else source.rate_limit
+    burst = Config.API_RATE_BURST if source.rate_burst is None else source.rate_burst
+    
+    return CatFactsAPIClient(
+        base_url=source.base_url,
+        concurrency=source.concurrency or Config.API_CONCURRENCY,
+        rate_limiter=TokenBucketRateLimiter(rate, burst) if rate > 0 else None,
+        paginated=source.strategy == "paginated",
+        metrics=metrics,
+        endpoint=source.endpoint
+    )
+
+
+def extract_source(
+    source: SourceDefinition,
+    extraction_time: datetime,
+    metrics: Optional[MetricsRegistry] = None
+) -> SourceResult:
+    """
+    Extrai e valida os registros de uma fonte, sem propagar falhas.
+    
+    Args:
+        source: Definição da fonte
+        extraction_time: Timestamp de extração compartilhado pelos registros
+        metrics: Registro de métricas (pode ser compartilhado entre fontes)
+    
+    Returns:
+        Registros validados com `source_api`, ou o erro que interrompeu a fonte
+    """
+    metrics = metrics or MetricsRegistry()
+    result = SourceResult(source=source.name)
+    start = time.perf_counter()
+    
+    try:
+        with _client(source, metrics) as client:
+            raw_facts = client.get_all_facts(max_pages=source.max_pages, target=source.target_records)
+        result.raw_count = len(raw_facts)
+        
+        # Os clientes devolvem lista vazia quando a API falha
+        if not raw_facts:
+            raise RuntimeError("nenhum registro obtido")
+        
+        stats = ValidationStats()
+        mapped = (apply_mapping(fact, source.mapping) for fact in raw_facts)
+        for record in iter_validated(mapped, extraction_time, stats):
+            record["source_api"] = source.name
+            result.records.append(record)
+        result.validation_errors = stats.errors
+    
+    except Exception as e:
+        result.error = str(e) or type(e).__name__
+        logger.error(f"Fonte {source.name} falhou: {result.error}")
+    
+    result.seconds = time.perf_counter() - start
+    metrics.record_stage(f"fetch:{source.name}", result.seconds, records=len(result.records))
+    return result
+
+
+def run_sources(
+    sources: List[SourceDefinition],
+    metrics: Optional[MetricsRegistry] = None
+) -> List[SourceResult]:
+    """
+    Extrai todas as fontes ao mesmo tempo, uma thread por fonte.
+    
+    Args:
+        sources: Fontes a extrair
+        metrics: Registro de métricas compartilhado
+    
+    Returns:
+        Um resultado por fonte, na ordem de `sources`
+    """
+    if not sources:
+        return []
+    
+    metrics = metrics or MetricsRegistry()
+    extraction_time = datetime.now(timezone.utc)
+    
+    with ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="source") as executor:
+        futures = [
+            executor.submit(extract_source, source, extraction_time, metrics)
+            for source in sources
+        ]
+        return [future.result() for future in futures]
+
+
+def unify(results: Iterable[SourceResult]) -> Iterator[Dict]:
+    """
+    Concatena os registros das fontes, mantendo cada texto uma vez só.
+    
+    Args:
+        results: Resultados por fonte, em ordem de prioridade
+    
+    Yields:
+        Registros com `source_api`
+    """
+    seen = set()
+    for result in results:
+        for record in result.records:
+            key = content_id(record["text"])
+            if key in seen:
+                continue
+            seen.add(key)
+            yield record
+
+
+def output_path(output_format: Optional[str] = None) -> Path:
+    """Caminho do dataset unificado (extensão conforme o formato)."""
+    output_format = Config.OUTPUT_FORMAT if output_format is None else output_format
+    path = Config.DATA_DIR / Config.SOURCES_OUTPUT_FILENAME
+    return path if output_format == "csv" else path.with_suffix(f".{output_format}")
+
+
+def save_unified(records: Iterable[Dict], path: Path, output_format: Optional[str] = None) -> int:
+    """
+    Grava o dataset unificado.
+    
+    Args:
+        records: Registros com `source_api`
+        path: Arquivo de saída
+        output_format: 'csv', 'parquet' ou 'arrow'
+    
+    Returns:
+        Quantidade de registros gravados
+    """
+    output_format = Config.OUTPUT_FORMAT if output_format is None else output_format
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if output_format != "csv":
+        from src.utils.columnar_writer import SOURCE_FACT_SCHEMA, ColumnarWriter
+        return ColumnarWriter(path, output_format=output_format, schema=SOURCE_FACT_SCHEMA).write(records)
+    
+    written = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = None
+        for record in records:
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(record.keys()))
+                writer.writeheader()
+            writer.writerow(record)
+            written += 1
+    return written
+
+
+def main(argv: Optional[List[str]] = None):
+    """Extrai as fontes configuradas e grava o dataset unificado."""
+    parser = argparse.ArgumentParser(description="Extração paralela de várias APIs para um dataset unificado")
+    parser.add_argument("--sources", type=Path, help="Arquivo JSON de fontes (padrão: SOURCES_FILE)")
+    parser.add_argument("--only", action="append", metavar="NAME", help="Extrai apenas a fonte NAME (repetível)")
+    parser.add_argument("--format", default=Config.OUTPUT_FORMAT, choices=("csv", "parquet", "arrow"),
+                        help="Formato do dataset unificado")
+    args = parser.parse_args(argv)
+    
+    try:
+        Config.ensure_directories()
+        sources = load_sources(args.sources)
+        if args.only:
+            sources = [source for source in sources if source.name in args.only]
+        if not sources:
+            raise ValueError("Nenhuma fonte habilitada para extrair")
+        
+        logger.info(f"Extraindo {len(sources)} fontes: {', '.join(source.name for source in sources)}")
+        metrics = MetricsRegistry()
+        results = run_sources(sources, metrics)
+        
+        for result in results:
+            status = "OK" if result.ok else f"FALHOU ({result.error})"
+            logger.info(
+                f"  - {result.source}: {status} - {result.raw_count} brutos, "
+                f"{len(result.records)} válidos, {result.validation_errors} erros, {result.seconds:.2f}s"
+            )
+        
+        if not any(result.ok for result in results):
+            raise RuntimeError("Todas as fontes falharam")
+        
+        path = output_path(args.format)
+        written = save_unified(unify(results), path, args.format)
+        logger.info(f"✓ Dataset unificado: {written} registros em {path}")
+        
+        sys.exit(0)
+    
+    except Exception as e:
+        logger.error(f"Erro fatal na extração multi-fonte: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
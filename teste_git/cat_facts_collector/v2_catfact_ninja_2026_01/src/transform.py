@@ -0,0 +1,599 @@
+"""
+Estágio Silver do pipeline: validação, deduplicação e escrita colunar.
+
+Lê as respostas brutas de um lote Bronze (`src/ingestion.py`), valida cada
+registro (caminho rápido catfact.ninja com fallback para o modelo
+`CatFact`), remove duplicatas e grava um Parquet com o schema fixo de
+`FACT_SCHEMA` em `Config.SILVER_DIR`. Pode ser reexecutado a partir do
+Bronze quantas vezes for preciso, sem chamar a API.
+
+Layout:
+    silver/ingestion_date=YYYY-MM-DD/run_id=<run_id>/facts.parquet
+    silver/ingestion_date=YYYY-MM-DD/run_id=<run_id>/_manifest.json
+
+Uso:
+    python src/transform.py [--run-id RUN_ID] [--allow-incomplete] [--print-run-id]
+
+pandas e pyarrow só são importados pelos caminhos colunares; a validação
+linha a linha (`iter_validated`) usada pelo extrator não depende deles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice, repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import Config
+from src.ingestion import MANIFEST_FILENAME, BronzeBatch, find_bronze_batch, records_from_response
+from src.models import CatFact, NINJA_FACTS_ADAPTER, ninja_fact_to_dict
+from src.utils.hashing import content_id_batch
+from src.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class ValidationStats:
+    """Contadores acumulados durante a validação."""
+    
+    processed: int = 0
+    errors: int = 0
+    seconds: float = 0.0  # Tempo gasto validando (sem contar a espera pelos dados)
+
+
+def validate_batch(
+    raw_facts: List[Dict],
+    extraction_time: datetime,
+    offset: int = 0
+) -> Tuple[List[Dict], int]:
+    """
+    Valida um lote inteiro de uma vez pelo caminho rápido catfact.ninja.
+    
+    O lote é validado com um único `TypeAdapter` para o formato conhecido
+    (`fact`, `length`); apenas os registros que não se encaixam nele
+    passam pelo modelo completo `CatFact`.
+    
+    Args:
+        raw_facts: Lote de dicionários brutos da API
+        extraction_time: Timestamp de extração compartilhado pelos registros
+        offset: Posição do lote no total (para mensagens de erro)
+    
+    Returns:
+        Tupla (registros validados na ordem original, quantidade de erros)
+    """
+    extracted_at = extraction_time.isoformat()
+    
+    try:
+        fast_facts = NINJA_FACTS_ADAPTER.validate_python(raw_facts)
+        return [ninja_fact_to_dict(fact, extracted_at) for fact in fast_facts], 0
+    
+    except ValidationError as e:
+        slow_indices = {error["loc"][0] for error in e.errors()}
+    
+    fast_indices = [i for i in range(len(raw_facts)) if i not in slow_indices]
+    fast_facts = NINJA_FACTS_ADAPTER.validate_python([raw_facts[i] for i in fast_indices])
+    records_by_index = {
+        i: ninja_fact_to_dict(fact, extracted_at)
+        for i, fact in zip(fast_indices, fast_facts)
+    }
+    
+    errors_count = 0
+    for i in sorted(slow_indices):
+        record_number = offset + i + 1
+        try:
+            # Valida usando o modelo Pydantic
+            fact = CatFact(**raw_facts[i])
+            fact.extracted_at = extraction_time  # Adiciona timestamp de extração
+            records_by_index[i] = fact.to_dict()
+        
+        except ValidationError as e:
+            errors_count += 1
+            logger.warning(f"Erro de validação no registro {record_number}: {e}")
+        
+        except Exception as e:
+            errors_count += 1
+            logger.error(f"Erro inesperado no registro {record_number}: {e}")
+    
+    return [records_by_index[i] for i in sorted(records_by_index)], errors_count
+
+
+def iter_validated(
+    raw_facts: Iterable[Dict],
+    extraction_time: datetime,
+    stats: Optional[ValidationStats] = None
+) -> Iterator[Dict]:
+    """
+    Valida e achata os registros em lotes de `Config.BATCH_SIZE`.
+    
+    Args:
+        raw_facts: Dicionários brutos da API (lista ou gerador)
+        extraction_time: Timestamp de extração compartilhado pelos registros
+        stats: Contadores a atualizar (opcional)
+    
+    Yields:
+        Dicionários validados e transformados
+    """
+    stats = stats if stats is not None else ValidationStats()
+    raw_facts = iter(raw_facts)
+    errors_start = stats.errors
+    
+    while True:
+        batch = list(islice(raw_facts, Config.BATCH_SIZE))
+        if not batch:
+            break
+        
+        batch_start = time.perf_counter()
+        records, batch_errors = validate_batch(batch, extraction_time, offset=stats.processed)
+        stats.seconds += time.perf_counter() - batch_start
+        stats.errors += batch_errors
+        stats.processed += len(batch)
+        logger.debug(f"Processados {stats.processed} registros")
+        
+        yield from records
+    
+    if stats.errors > errors_start:
+        logger.warning(f"Total de registros com erro: {stats.errors - errors_start}")
+
+
+def validation_workers() -> int:
+    """
+    Retorna o número de processos da validação paralela.
+    
+    Returns:
+        `Config.VALIDATION_WORKERS`, ou o número de CPUs se não configurado
+    """
+    return Config.VALIDATION_WORKERS or os.cpu_count() or 1
+
+
+def should_validate_in_parallel(record_count: int) -> bool:
+    """
+    Indica se vale a pena validar em vários processos.
+    
+    Abaixo de `Config.VALIDATION_PARALLEL_THRESHOLD` registros o custo de
+    iniciar os processos e serializar os lotes supera o ganho.
+    
+    Args:
+        record_count: Quantidade de registros a validar
+    
+    Returns:
+        True se a validação deve usar o pool de processos
+    """
+    return (
+        Config.VALIDATION_PARALLEL_THRESHOLD > 0
+        and record_count >= Config.VALIDATION_PARALLEL_THRESHOLD
+        and validation_workers() > 1
+    )
+
+
+def _split(raw_facts: List[Dict], workers: int) -> Tuple[int, range, Iterator[List[Dict]]]:
+    """
+    Divide os registros em fatias contíguas para o pool de processos.
+    
+    Algumas fatias por processo equilibram a carga sem multiplicar o overhead.
+    
+    Returns:
+        Tupla (tamanho da fatia, offsets, gerador de fatias)
+    """
+    chunk_size = max(Config.BATCH_SIZE, -(-len(raw_facts) // (workers * 4)))
+    offsets = range(0, len(raw_facts), chunk_size)
+    return chunk_size, offsets, (raw_facts[offset:offset + chunk_size] for offset in offsets)
+
+
+def validate_parallel(
+    raw_facts: List[Dict],
+    extraction_time: datetime,
+    stats: Optional[ValidationStats] = None,
+    workers: Optional[int] = None
+) -> List[Dict]:
+    """
+    Valida os registros em um pool de processos, preservando a ordem.
+    
+    A lista é dividida em fatias contíguas, validadas com `validate_batch`
+    em processos separados (todas com o mesmo `extraction_time`) e
+    concatenadas na ordem original.
+    
+    Args:
+        raw_facts: Dicionários brutos da API
+        extraction_time: Timestamp de extração compartilhado pelos registros
+        stats: Contadores a atualizar (opcional)
+        workers: Número de processos (padrão: `validation_workers()`)
+    
+    Returns:
+        Registros validados na ordem original
+    """
+    stats = stats if stats is not None else ValidationStats()
+    workers = workers or validation_workers()
+    chunk_size, offsets, chunks = _split(raw_facts, workers)
+    
+    logger.info(f"Validando {len(raw_facts)} registros em {workers} processos (lotes de {chunk_size})")
+    
+    start = time.perf_counter()
+    validated = []
+    errors_count = 0
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for records, batch_errors in executor.map(validate_batch, chunks, repeat(extraction_time), offsets):
+            validated.extend(records)
+            errors_count += batch_errors
+    
+    stats.seconds += time.perf_counter() - start
+    stats.processed += len(raw_facts)
+    stats.errors += errors_count
+    
+    if errors_count:
+        logger.warning(f"Total de registros com erro: {errors_count}")
+    
+    return validated
+
+
+# Colunas que o formato catfact.ninja não traz: valor fixo, igual a ninja_fact_to_dict
+_NINJA_CONSTANT_COLUMNS = {
+    "type": None,
+    "user_id": None,
+    "user_name": None,
+    "upvotes": 0,
+    "user_upvoted": None,
+    "created_at": None,
+    "updated_at": None,
+    "deleted": False,
+    "source": None,
+    "used": None,
+    "sent_count": None,
+}
+
+
+_NINJA_KEYS = {"fact", "length"}
+
+
+def _ninja_schema() -> pa.Schema:
+    """Schema Arrow de um registro catfact.ninja."""
+    import pyarrow as pa
+    
+    return pa.schema([("fact", pa.string()), ("length", pa.int64())])
+
+
+def _ninja_columns(raw_facts: List[Dict]) -> Optional[pa.Table]:
+    """
+    Converte o lote em colunas Arrow, se ele estiver todo no formato catfact.ninja.
+    
+    Todo registro precisa ter exatamente as chaves `fact` e `length` (o
+    `from_pylist` só olharia as do primeiro e descartaria as demais); a
+    conversão para colunas é feita pelo pyarrow (em C++) com o schema fixo,
+    e as regras de `NinjaFact` são então checadas por coluna.
+    
+    Args:
+        raw_facts: Dicionários brutos da API
+    
+    Returns:
+        Tabela com as colunas `fact` e `length`, ou None se algum registro
+        não se encaixar no formato (campos faltando ou extras, tipos
+        diferentes, vazios)
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    if not all(type(fact) is dict and fact.keys() == _NINJA_KEYS for fact in raw_facts):
+        return None
+    # bool é subclasse de int, mas não é um `length` válido para o pyarrow
+    if any(type(fact["length"]) is not int for fact in raw_facts):
+        return None
+    
+    try:
+        table = pa.Table.from_pylist(raw_facts, schema=_ninja_schema())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    
+    if table.column("fact").null_count or table.column("length").null_count:
+        return None
+    if pc.any(pc.equal(pc.utf8_length(table.column("fact")), 0)).as_py():
+        return None
+    
+    return table
+
+
+def facts_frame(
+    raw_facts: List[Dict],
+    extraction_time: datetime,
+    stats: Optional[ValidationStats] = None
+) -> pd.DataFrame:
+    """
+    Monta o DataFrame final coluna a coluna, sem dicionários por registro.
+    
+    Para lotes no formato catfact.ninja, `text`, `length`, `id` e
+    `extracted_at` são construídos como arrays inteiros a partir do payload
+    das páginas, e os campos derivados são calculados de forma vetorizada.
+    Qualquer outro formato cai no caminho linha a linha (`validate_batch`),
+    com o mesmo resultado.
+    
+    Args:
+        raw_facts: Dicionários brutos da API
+        extraction_time: Timestamp de extração compartilhado pelos registros
+        stats: Contadores a atualizar (opcional)
+    
+    Returns:
+        DataFrame com as colunas de `CatFact.to_dict()`
+    """
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    
+    stats = stats if stats is not None else ValidationStats()
+    start = time.perf_counter()
+    
+    table = _ninja_columns(raw_facts)
+    if table is None:
+        records = list(iter_validated(raw_facts, extraction_time, stats))
+        return pd.DataFrame(records)
+    
+    text = table.column("fact")
+    length = table.column("length").cast(pa.int64())
+    # length 0 -> tamanho do texto, como em ninja_fact_to_dict
+    length = pc.if_else(pc.equal(length, 0), pc.utf8_length(text).cast(pa.int64()), length)
+    texts = text.to_pylist()
+    row_count = len(texts)
+    
+    columns = {"id": content_id_batch(texts), "text": texts}
+    columns.update({name: [value] * row_count for name, value in _NINJA_CONSTANT_COLUMNS.items()})
+    columns["length"] = length.to_numpy()
+    columns["extracted_at"] = [extraction_time.isoformat()] * row_count
+    
+    stats.processed += row_count
+    stats.seconds += time.perf_counter() - start
+    logger.debug(f"Processados {stats.processed} registros (colunar)")
+    
+    return pd.DataFrame(columns)
+
+
+def _facts_frame_chunk(raw_facts: List[Dict], extraction_time: datetime) -> Tuple[pd.DataFrame, int]:
+    """Executa `facts_frame` em um processo do pool, devolvendo também os erros."""
+    stats = ValidationStats()
+    return facts_frame(raw_facts, extraction_time, stats), stats.errors
+
+
+def facts_frame_parallel(
+    raw_facts: List[Dict],
+    extraction_time: datetime,
+    stats: Optional[ValidationStats] = None,
+    workers: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Versão de `facts_frame` distribuída em um pool de processos.
+    
+    Cada processo devolve um DataFrame (barato de serializar, por ser
+    colunar), concatenado na ordem original.
+    
+    Args:
+        raw_facts: Dicionários brutos da API
+        extraction_time: Timestamp de extração compartilhado pelos registros
+        stats: Contadores a atualizar (opcional)
+        workers: Número de processos (padrão: `validation_workers()`)
+    
+    Returns:
+        DataFrame com as colunas de `CatFact.to_dict()`
+    """
+    import pandas as pd
+    
+    stats = stats if stats is not None else ValidationStats()
+    workers = workers or validation_workers()
+    chunk_size, _, chunks = _split(raw_facts, workers)
+    
+    logger.info(f"Transformando {len(raw_facts)} registros em {workers} processos (lotes de {chunk_size})")
+    
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_facts_frame_chunk, chunks, repeat(extraction_time)))
+    
+    df = pd.concat([frame for frame, _ in results], ignore_index=True)
+    stats.seconds += time.perf_counter() - start
+    stats.processed += len(raw_facts)
+    stats.errors += sum(errors for _, errors in results)
+    
+    return df
+
+
+@dataclass
+class SilverBatch:
+    """Resultado do estágio Silver: dados validados e deduplicados de uma execução."""
+    
+    run_id: str
+    source_api: str
+    ingestion_timestamp: datetime
+    run_dir: Path
+    data_file: str
+    record_count: int
+    errors_count: int
+    duplicates_removed: int
+    
+    @property
+    def data_path(self) -> Path:
+        """Caminho do Parquet da execução."""
+        return self.run_dir / self.data_file
+    
+    @property
+    def manifest_path(self) -> Path:
+        """Caminho do manifesto da execução."""
+        return self.run_dir / MANIFEST_FILENAME
+    
+    def save_manifest(self) -> None:
+        """Grava o manifesto da execução."""
+        manifest = {
+            "run_id": self.run_id,
+            "source_api": self.source_api,
+            "ingestion_timestamp": self.ingestion_timestamp.isoformat(),
+            "data_file": self.data_file,
+            "record_count": self.record_count,
+            "errors_count": self.errors_count,
+            "duplicates_removed": self.duplicates_removed,
+        }
+        self.manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    
+    @classmethod
+    def from_manifest(cls, manifest_path: Path) -> "SilverBatch":
+        """
+        Reconstrói um lote Silver a partir do manifesto.
+        
+        Args:
+            manifest_path: Caminho do `_manifest.json`
+        
+        Returns:
+            Lote Silver
+        """
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        return cls(
+            run_id=manifest["run_id"],
+            source_api=manifest["source_api"],
+            ingestion_timestamp=datetime.fromisoformat(manifest["ingestion_timestamp"]),
+            run_dir=manifest_path.parent,
+            data_file=manifest["data_file"],
+            record_count=manifest["record_count"],
+            errors_count=manifest["errors_count"],
+            duplicates_removed=manifest["duplicates_removed"],
+        )
+
+
+def transform(bronze: BronzeBatch, allow_incomplete: bool = False) -> SilverBatch:
+    """
+    Executa o estágio Silver a partir de um lote Bronze.
+    
+    O timestamp de ingestão do Bronze é usado como `extracted_at`, então
+    reprocessar o mesmo lote produz o mesmo resultado. Um lote sem registros
+    válidos gera um Parquet vazio com `FACT_SCHEMA`, para o estágio Gold
+    sempre encontrar o arquivo do manifesto.
+    
+    Args:
+        bronze: Lote Bronze de entrada
+        allow_incomplete: Se True, transforma mesmo um lote cujo crawl não
+            terminou (só registra um aviso)
+    
+    Returns:
+        Lote Silver gravado
+    
+    Raises:
+        ValueError: Lote Bronze incompleto e `allow_incomplete` falso
+    """
+    import pyarrow.parquet as pq
+    
+    from src.utils.columnar_writer import FACT_SCHEMA, ColumnarWriter
+    
+    if not bronze.complete:
+        detail = bronze.error or f"{bronze.record_count} de {bronze.expected_records} registros"
+        if not allow_incomplete:
+            raise ValueError(
+                f"Lote Bronze {bronze.run_id} incompleto ({detail}); "
+                f"reexecute a ingestão ou use --allow-incomplete"
+            )
+        logger.warning(f"Silver: transformando lote Bronze incompleto {bronze.run_id} ({detail})")
+    
+    run_dir = (
+        Config.SILVER_DIR
+        / f"ingestion_date={bronze.ingestion_timestamp.date().isoformat()}"
+        / f"run_id={bronze.run_id}"
+    )
+    run_dir.mkdir(parents=True, exist_ok=True)
+    
+    logger.info(f"Silver: transformando lote Bronze {bronze.run_id}")
+    
+    stats = ValidationStats()
+    raw_facts = (
+        fact_data
+        for response in bronze.iter_responses()
+        for fact_data in records_from_response(response)
+    )
+    records = iter_validated(raw_facts, bronze.ingestion_timestamp, stats)
+    
+    data_file = "facts.parquet"
+    written = ColumnarWriter(run_dir / data_file, output_format="parquet").write(records)
+    if written == 0:
+        # O writer só cria o arquivo no primeiro registro
+        pq.write_table(FACT_SCHEMA.empty_table(), run_dir / data_file)
+    
+    silver = SilverBatch(
+        run_id=bronze.run_id,
+        source_api=bronze.source_api,
+        ingestion_timestamp=bronze.ingestion_timestamp,
+        run_dir=run_dir,
+        data_file=data_file,
+        record_count=written,
+        errors_count=stats.errors,
+        duplicates_removed=stats.processed - stats.errors - written,
+    )
+    silver.save_manifest()
+    
+    logger.info(
+        f"Silver: {written} registros válidos ({silver.errors_count} erros, "
+        f"{silver.duplicates_removed} duplicatas) em {silver.data_path}"
+    )
+    return silver
+
+
+def find_silver_batch(run_id: Optional[str] = None) -> SilverBatch:
+    """
+    Localiza um lote Silver já gravado.
+    
+    Args:
+        run_id: Execução desejada (padrão: a mais recente)
+    
+    Returns:
+        Lote Silver
+    
+    Raises:
+        FileNotFoundError: Nenhum lote encontrado
+    """
+    pattern = f"ingestion_date=*/run_id={run_id or '*'}/{MANIFEST_FILENAME}"
+    manifests = sorted(Config.SILVER_DIR.glob(pattern), key=lambda path: path.parent.name)
+    
+    if not manifests:
+        raise FileNotFoundError(f"Nenhum lote Silver encontrado em {Config.SILVER_DIR} ({pattern})")
+    
+    return SilverBatch.from_manifest(manifests[-1])
+
+
+def main(argv: Optional[List[str]] = None):
+    """Reexecuta apenas o estágio Silver a partir de um lote Bronze."""
+    parser = argparse.ArgumentParser(description="Estágio Silver: Bronze -> Parquet validado")
+    parser.add_argument("--run-id", help="Lote Bronze a transformar (padrão: o mais recente)")
+    parser.add_argument(
+        "--allow-incomplete",
+        action="store_true",
+        help="Transforma mesmo um lote Bronze cujo crawl não terminou"
+    )
+    parser.add_argument(
+        "--print-run-id",
+        action="store_true",
+        help="Escreve o run_id do lote gravado na saída padrão (para encadear estágios)"
+    )
+    args = parser.parse_args(argv)
+    
+    try:
+        silver = transform(find_bronze_batch(args.run_id), allow_incomplete=args.allow_incomplete)
+        logger.info(f"Silver: lote {silver.run_id} gravado")
+        if args.print_run_id:
+            print(silver.run_id)
+        sys.exit(0)
+    
+    except Exception as e:
+        logger.error(f"Erro fatal na transformação: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Controle adaptativo do tamanho de página e da concorrência do crawl paginado.
+
+O `AdaptiveController` recebe a latência, o tamanho e o status de cada
+resposta (via `CatFactsAPIClient._record_response`) e, a cada janela de
+respostas, ajusta:
+    - concorrência: +1 enquanto a API responde rápido e sem erros; metade
+      ao primeiro 429, 5xx ou falha de conexão (AIMD, como no TCP)
+    - tamanho de página: dobra quando as respostas são rápidas e pequenas;
+      cai pela metade quando ficam lentas, grandes demais ou com erros
+
+Os tamanhos de página ficam numa escada de potências de 2 a partir de
+`API_PAGE_SIZE` (ex.: 25, 50, 100), então qualquer tamanho menor divide o
+maior e o crawl consegue trocar de tamanho sem pular nem repetir registros
+(ver `page_size_at`). O teto `API_PAGE_SIZE_MAX` não deve passar do maior
+`limit` aceito pela API (100 na catfact.ninja); o cliente interrompe o crawl
+se o servidor devolver um `per_page` diferente do pedido.
+"""
+
+import threading
+from typing import List, Optional
+
+from src.config import Config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class AdaptiveController:
+    """Ajusta página e concorrência a partir das respostas observadas (thread-safe)."""
+    
+    def __init__(
+        self,
+        page_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        min_page_size: Optional[int] = None,
+        max_page_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        target_latency: Optional[float] = None,
+        max_page_bytes: Optional[int] = None
+    ):
+        """
+        Inicializa o controlador nos valores iniciais.
+        
+        Args:
+            page_size: Tamanho de página inicial (base da escada de tamanhos)
+            concurrency: Requisições simultâneas iniciais
+            min_page_size: Menor tamanho de página permitido
+            max_page_size: Maior tamanho de página permitido
+            max_concurrency: Maior concorrência permitida
+            target_latency: Latência (s) acima da qual as páginas encolhem
+            max_page_bytes: Tamanho máximo desejado de uma resposta
+        """
+        page_size = Config.API_PAGE_SIZE if page_size is None else page_size
+        concurrency = Config.API_CONCURRENCY if concurrency is None else concurrency
+        min_page_size = Config.API_PAGE_SIZE_MIN if min_page_size is None else min_page_size
+        max_page_size = Config.API_PAGE_SIZE_MAX if max_page_size is None else max_page_size
+        max_concurrency = Config.API_CONCURRENCY_MAX if max_concurrency is None else max_concurrency
+        target_latency = Config.API_TARGET_LATENCY if target_latency is None else target_latency
+        max_page_bytes = Config.API_MAX_PAGE_BYTES if max_page_bytes is None else max_page_bytes
+        
+        page_size = max(1, page_size)
+        sizes = [page_size]
+        while sizes[0] % 2 == 0 and sizes[0] // 2 >= min_page_size:
+            sizes.insert(0, sizes[0] // 2)
+        while sizes[-1] * 2 <= max_page_size:
+            sizes.append(sizes[-1] * 2)
+        
+        self.page_sizes: List[int] = sizes
+        self.max_concurrency = max(1, max_concurrency, concurrency)
+        self.target_latency = target_latency
+        self.max_page_bytes = max_page_bytes
+        
+        self._size_index = sizes.index(page_size)
+        self._concurrency = max(1, concurrency)
+        self._lock = threading.Lock()
+        self._reset_window()
+    
+    def _reset_window(self) -> None:
+        """Zera as observações da janela atual."""
+        self._responses = 0
+        self._errors = 0
+        self._rate_limited = 0
+        self._latency = 0.0
+        self._bytes = 0
+    
+    @property
+    def page_size(self) -> int:
+        """Tamanho de página atual."""
+        return self.page_sizes[self._size_index]
+    
+    @property
+    def concurrency(self) -> int:
+        """Requisições simultâneas permitidas agora."""
+        return self._concurrency
+    
+    def page_size_at(self, offset: int) -> int:
+        """
+        Maior tamanho de página, até o atual, alinhado a `offset`.
+        
+        Com `limit` dividindo o offset, a página `offset // limit + 1`
+        começa exatamente no próximo registro a buscar.
+        
+        Args:
+            offset: Quantidade de registros já pedidos
+        
+        Returns:
+            Tamanho de página a usar na próxima requisição
+        """
+        index = self._size_index
+        while index > 0 and offset % self.page_sizes[index]:
+            index -= 1
+        return self.page_sizes[index]
+    
+    def observe(self, latency: float, payload_bytes: int, status: int) -> None:
+        """
+        Registra uma resposta e reavalia os parâmetros ao fim da janela.
+        
+        Args:
+            latency: Duração da requisição em segundos
+            payload_bytes: Tamanho do corpo da resposta
+            status: Status HTTP
+        """
+        with self._lock:
+            self._responses += 1
+            if status == 429:
+                self._rate_limited += 1
+            elif status >= 500:
+                self._errors += 1
+            else:
+                self._latency += latency
+                self._bytes += payload_bytes
+            self._maybe_adjust()
+    
+    def observe_failure(self) -> None:
+        """Registra uma requisição sem resposta (timeout ou erro de conexão)."""
+        with self._lock:
+            self._responses += 1
+            self._errors += 1
+            self._maybe_adjust()
+    
+    def _maybe_adjust(self) -> None:
+        """Aplica as regras de ajuste; chamado com o lock adquirido."""
+        # Reage ao primeiro erro; sem erros, espera uma janela de respostas
+        if not (self._errors or self._rate_limited) and self._responses < max(4, self._concurrency):
+            return
+        
+        ok_responses = self._responses - self._errors - self._rate_limited
+        latency = self._latency / ok_responses if ok_responses else float("inf")
+        payload = self._bytes / ok_responses if ok_responses else 0
+        concurrency, size_index = self._concurrency, self._size_index
+        
+        if self._rate_limited:
+            # Muitas requisições: menos em paralelo, páginas maiores
+            concurrency = max(1, concurrency // 2)
+            if payload * 2 <= self.max_page_bytes:
+                size_index += 1
+        elif self._errors:
+            concurrency = max(1, concurrency // 2)
+            size_index -= 1
+        elif latency > self.target_latency or payload > self.max_page_bytes:
+            concurrency -= 1
+            size_index -= 1
+        elif latency < self.target_latency / 2:
+            concurrency += 1
+            if payload * 2 <= self.max_page_bytes:
+                size_index += 1
+        
+        concurrency = min(max(1, concurrency), self.max_concurrency)
+        size_index = min(max(0, size_index), len(self.page_sizes) - 1)
+        
+        if (concurrency, size_index) != (self._concurrency, self._size_index):
+            logger.info(
+                f"Ajuste adaptativo: concorrência {self._concurrency} -> {concurrency}, "
+                f"página {self.page_size} -> {self.page_sizes[size_index]} "
+                f"(latência média {latency:.2f}s, {self._errors} erros, {self._rate_limited} 429)"
+            )
+            self._concurrency, self._size_index = concurrency, size_index
+        
+        self._reset_window()
@@ -4,18 +4,28 @@ Cliente HTTP para interação com a Cat Facts API.
 Implementa retry logic, tratamento de erros e validação de respostas.
 """
 
+import math
 import time
 import warnings
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urljoin
 
 import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
 from urllib3.exceptions import InsecureRequestWarning
 
 from src.config import Config
+from src.utils.adaptive import AdaptiveController
+from src.utils.bulk import as_fact_list, merge_unique, split_amounts
+from src.utils.checkpoint import ExtractionCheckpoint
+from src.utils.http_cache import HTTPResponseCache
+from src.utils import json_codec
+from src.utils.http_pool import PooledHTTPAdapter, ThreadLocalSessions
 from src.utils.logger import setup_logger
+from src.utils.metrics import MetricsRegistry
+from src.utils.rate_limiter import TokenBucketRateLimiter, parse_delay
+from src.utils.retry_policy import RETRY_STATUSES, RetryPolicy, RetryState, circuit_breaker_for
 
 
 logger = setup_logger(__name__)
@@ -29,11 +39,20 @@ class CatFactsAPIClient:
     
     def __init__(
         self,
-        base_url: str = Config.API_BASE_URL,
-        timeout: int = Config.API_TIMEOUT,
-        max_retries: int = Config.API_MAX_RETRIES,
-        retry_delay: int = Config.API_RETRY_DELAY,
-        verify_ssl: bool = Config.API_VERIFY_SSL
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        verify_ssl: Optional[bool] = None,
+        concurrency: Optional[int] = None,
+        use_cache: Optional[bool] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        paginated: Optional[bool] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        endpoint: Optional[str] = None,
+        page_size: Optional[int] = None,
+        adaptive: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None
     ):
         """
         Inicializa o cliente da API.
@@ -41,122 +60,249 @@ class CatFactsAPIClient:
         Args:
             base_url: URL base da API
             timeout: Timeout das requisições em segundos
-            max_retries: Número máximo de tentativas
-            retry_delay: Delay entre tentativas em segundos
+            max_retries: Número máximo de tentativas por requisição
+            retry_delay: Teto da primeira espera entre tentativas, em segundos
+                (dobra a cada tentativa, com jitter)
             verify_ssl: Se deve verificar certificados SSL
+            concurrency: Número máximo de páginas buscadas em paralelo
+            use_cache: Se deve usar o cache HTTP local (ETag/Last-Modified)
+            rate_limiter: Token bucket a usar (padrão: um novo, conforme
+                API_RATE_LIMIT/API_RATE_BURST; pode ser compartilhado entre clientes)
+            paginated: Se a API usa /facts paginado (padrão: detectado pela base_url)
+            metrics: Registro de métricas (padrão: um novo, exposto em `self.metrics`)
+            endpoint: Endpoint dos fatos (padrão: FACTS_ENDPOINT se paginado,
+                RANDOM_FACT_ENDPOINT se bulk)
+            page_size: Fatos por página (`limit`) no crawl paginado
+            adaptive: Se página e concorrência são ajustadas durante o crawl
+                (`self.controller`, ver `src/utils/adaptive.py`)
+            retry_policy: Política de retry (padrão: uma nova com `max_retries`,
+                `retry_delay` e API_RETRY_MAX_DELAY/API_RETRY_BUDGET)
         """
+        base_url = Config.API_BASE_URL if base_url is None else base_url
+        timeout = Config.API_TIMEOUT if timeout is None else timeout
+        max_retries = Config.API_MAX_RETRIES if max_retries is None else max_retries
+        retry_delay = Config.API_RETRY_DELAY if retry_delay is None else retry_delay
+        verify_ssl = Config.API_VERIFY_SSL if verify_ssl is None else verify_ssl
+        concurrency = Config.API_CONCURRENCY if concurrency is None else concurrency
+        use_cache = Config.HTTP_CACHE_ENABLED if use_cache is None else use_cache
+        page_size = Config.API_PAGE_SIZE if page_size is None else page_size
+        adaptive = Config.API_ADAPTIVE if adaptive is None else adaptive
+        
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_policy = retry_policy or RetryPolicy(max_retries, retry_delay)
+        self.circuit = circuit_breaker_for(base_url)
         self.verify_ssl = verify_ssl
-        self.session = self._create_session()
+        self.concurrency = max(1, concurrency)
+        self.page_size = max(1, page_size)
+        self.controller = AdaptiveController(self.page_size, self.concurrency) if adaptive else None
+        self.paginated = "catfact.ninja" in base_url if paginated is None else paginated
+        self.endpoint = endpoint or (Config.FACTS_ENDPOINT if self.paginated else Config.RANDOM_FACT_ENDPOINT)
+        self.metrics = metrics or MetricsRegistry()
+        self._sessions = self._create_sessions()
+        self.cache = HTTPResponseCache() if use_cache else None
+        
+        if rate_limiter is None and Config.API_RATE_LIMIT > 0:
+            rate_limiter = TokenBucketRateLimiter()
+        self.rate_limiter = rate_limiter
         
         if not verify_ssl:
             logger.warning("⚠️  Verificação SSL desabilitada - use apenas em desenvolvimento!")
         logger.info(f"API Client inicializado: {base_url}")
     
-    def _create_session(self) -> requests.Session:
+    def _create_sessions(self) -> ThreadLocalSessions:
         """
-        Cria uma sessão HTTP com retry strategy.
+        Cria o pool de conexões compartilhado pelas threads.
+        
+        O pool mantém ao menos uma conexão por requisição que pode estar em
+        voo (`concurrency`, ou o máximo do controlador adaptativo). O adapter
+        não faz retries: todos passam pela `RetryPolicy` de `_make_request`.
         
         Returns:
-            Sessão configurada
+            Sessões por thread sobre um único `PooledHTTPAdapter`
         """
-        session = requests.Session()
-        
-        # Configuração de retry
-        retry_strategy = Retry(
-            total=self.max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-            backoff_factor=1
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-        
-        # Headers padrão
-        session.headers.update({
-            "User-Agent": "UOLCatLovers/1.0",
-            "Accept": "application/json"
-        })
-        
-        return session
+        in_flight = self.controller.max_concurrency if self.controller is not None else self.concurrency
+        adapter = PooledHTTPAdapter(pool_maxsize=max(Config.HTTP_POOL_MAXSIZE, in_flight))
+        return ThreadLocalSessions(adapter)
+    
+    @property
+    def session(self) -> requests.Session:
+        """Sessão HTTP da thread atual (o pool de conexões é compartilhado)."""
+        return self._sessions.get()
     
     def _make_request(
         self,
         endpoint: str,
         params: Optional[Dict] = None,
-        method: str = "GET"
+        method: str = "GET",
+        cacheable: bool = True
     ) -> Dict:
         """
-        Executa uma requisição HTTP com tratamento de erros.
+        Executa uma requisição HTTP (ver `_request_body`) e decodifica o JSON.
         
         Args:
             endpoint: Endpoint da API
             params: Parâmetros da query string
             method: Método HTTP
+            cacheable: Se a resposta pode ser cacheada (falso para endpoints aleatórios)
         
         Returns:
             Dados da resposta em JSON
+        """
+        return json_codec.loads(self._request_body(endpoint, params, method, cacheable))
+    
+    def _request_body(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        method: str = "GET",
+        cacheable: bool = True,
+        retry: Optional[RetryState] = None
+    ) -> bytes:
+        """
+        Executa uma requisição HTTP com tratamento de erros.
+        
+        Requisições GET cacheáveis passam pelo cache HTTP: dentro do TTL a
+        resposta vem do disco; fora dele é feito um GET condicional, e um
+        304 reaproveita o corpo guardado.
+        
+        Falhas transitórias (429, 5xx, timeout, conexão) são repetidas
+        conforme `self.retry_policy`, e o circuit breaker do host é avisado
+        de cada resultado.
+        
+        Args:
+            endpoint: Endpoint da API
+            params: Parâmetros da query string
+            method: Método HTTP
+            cacheable: Se a resposta pode ser cacheada (falso para endpoints aleatórios)
+            retry: Tentativas já em andamento da mesma requisição lógica, que
+                continuam contando (padrão: começa uma nova contagem)
+        
+        Returns:
+            Corpo da resposta, como veio do servidor (ou do cache)
         
         Raises:
             requests.exceptions.RequestException: Erro na requisição
+            CircuitOpenError: Circuito do host aberto
         """
         url = urljoin(self.base_url, endpoint)
         
-        for attempt in range(1, self.max_retries + 1):
+        cache_key = None
+        cached = None
+        if self.cache is not None and cacheable and method == "GET":
+            cache_key = self.cache.make_key(url, params)
+            cached = self.cache.get(cache_key)
+            
+            if cached is not None and cached.is_fresh(self.cache.ttl):
+                logger.debug(f"Cache HTTP (fresco): {cache_key}")
+                self.metrics.inc("http_cache_hits_total", endpoint=endpoint, result="fresh")
+                return cached.body.encode("utf-8")
+        
+        headers = cached.validator_headers() if cached is not None else None
+        retry = retry or self.retry_policy.start()
+        
+        while True:
+            self.circuit.before_request()
+            timeout = retry.begin_attempt(self.timeout)
+            logger.debug(f"Tentativa {retry.attempt}/{self.retry_policy.max_attempts} - {method} {url}")
+            if retry.attempt > 1:
+                self.metrics.inc("http_retries_total", endpoint=endpoint)
+            
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            
             try:
-                logger.debug(f"Tentativa {attempt}/{self.max_retries} - {method} {url}")
-                
+                request_start = time.perf_counter()
                 response = self.session.request(
                     method=method,
                     url=url,
                     params=params,
-                    timeout=self.timeout,
+                    headers=headers,
+                    timeout=timeout,
                     verify=self.verify_ssl
                 )
+            
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                is_timeout = isinstance(e, requests.exceptions.Timeout)
+                logger.error(f"{'Timeout na requisição' if is_timeout else 'Erro de conexão'}: {e}")
+                self.metrics.inc(
+                    "http_requests_total",
+                    endpoint=endpoint,
+                    status="timeout" if is_timeout else "connection_error"
+                )
+                if self.controller is not None:
+                    self.controller.observe_failure()
+                self.circuit.record_failure()
                 
-                response.raise_for_status()
-                
-                logger.debug(f"Requisição bem-sucedida: {url}")
-                return response.json()
-                
-            except requests.exceptions.HTTPError as e:
-                logger.error(f"HTTP Error {e.response.status_code}: {e}")
-                
-                if e.response.status_code == 429:  # Rate limit
-                    wait_time = self.retry_delay * attempt
-                    logger.warning(f"Rate limit atingido. Aguardando {wait_time}s...")
-                    time.sleep(wait_time)
-                    continue
-                
-                if attempt == self.max_retries:
+                delay = retry.next_delay()
+                if delay is None:
                     raise
-                    
-            except requests.exceptions.Timeout as e:
-                logger.error(f"Timeout na requisição: {e}")
-                if attempt == self.max_retries:
-                    raise
-                time.sleep(self.retry_delay)
+                time.sleep(delay)
+                continue
+            
+            self._record_response(endpoint, response, time.perf_counter() - request_start)
+            if response.status_code >= 500:
+                self.circuit.record_failure()
+            else:
+                self.circuit.record_success()
+            
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(response.headers)
+            
+            if response.status_code in RETRY_STATUSES:
+                logger.error(f"HTTP Error {response.status_code}: {url}")
+                retry_after = parse_delay(response.headers.get("Retry-After"))
+                if response.status_code == 429:
+                    self.metrics.inc("http_rate_limited_total", endpoint=endpoint)
                 
-            except requests.exceptions.ConnectionError as e:
-                logger.error(f"Erro de conexão: {e}")
-                if attempt == self.max_retries:
-                    raise
-                time.sleep(self.retry_delay)
+                delay = retry.next_delay(retry_after)
+                if delay is None:
+                    response.raise_for_status()
                 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Erro na requisição: {e}")
-                raise
+                if retry_after is not None and self.rate_limiter is not None:
+                    # O rate limiter já foi pausado pelo tempo pedido pelo servidor
+                    delay = 0.0
+                logger.warning(f"Nova tentativa em {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            
+            response.raise_for_status()
+            
+            if response.status_code == 304 and cached is not None:
+                logger.debug(f"Cache HTTP (304 Not Modified): {cache_key}")
+                self.metrics.inc("http_cache_hits_total", endpoint=endpoint, result="revalidated")
+                self.cache.refresh(cache_key, response.headers)
+                return cached.body.encode("utf-8")
+            
+            logger.debug(f"Requisição bem-sucedida: {url}")
+            if cache_key is not None:
+                self.cache.store(cache_key, response.text, response.headers)
+            return response.content
+    
+    def _record_response(self, endpoint: str, response: requests.Response, elapsed: float) -> None:
+        """
+        Registra latência, status e bytes de uma resposta.
         
-        raise requests.exceptions.RequestException(
-            f"Falha após {self.max_retries} tentativas"
-        )
+        Args:
+            endpoint: Endpoint da API (label das métricas)
+            response: Resposta recebida
+            elapsed: Duração da requisição em segundos
+        """
+        self.metrics.observe("http_request_duration_seconds", elapsed, endpoint=endpoint)
+        self.metrics.inc("http_requests_total", endpoint=endpoint, status=str(response.status_code))
+        self.metrics.inc("http_response_bytes_total", len(response.content), endpoint=endpoint)
+        if self.controller is not None:
+            self.controller.observe(elapsed, len(response.content), response.status_code)
     
-    def get_all_facts(self, animal_type: str = "cat", max_pages: int = 10) -> List[Dict]:
+    def get_all_facts(
+        self,
+        animal_type: str = "cat",
+        max_pages: int = 10,
+        checkpoint: Optional[ExtractionCheckpoint] = None,
+        target: Optional[int] = None
+    ) -> List[Dict]:
         """
         Busca todos os fatos disponíveis. Detecta automaticamente qual API está sendo usada.
         
@@ -166,102 +312,406 @@ class CatFactsAPIClient:
         Args:
             animal_type: Tipo de animal (padrão: 'cat')
             max_pages: Número máximo de páginas a buscar (para APIs com paginação)
+            checkpoint: Checkpoint para registrar/retomar o crawl paginado
+            target: Registros pedidos no modo bulk (padrão: BULK_TARGET_RECORDS)
         
         Returns:
             Lista de fatos
         """
-        is_catfact_ninja = "catfact.ninja" in Config.API_BASE_URL
-        
-        if is_catfact_ninja:
-            return self._get_facts_paginated(animal_type, max_pages)
+        if self.paginated:
+            return self._get_facts_paginated(animal_type, max_pages, checkpoint)
         else:
-            return self._get_facts_bulk(animal_type)
+            return self._get_facts_bulk(animal_type, target)
     
-    def _get_facts_bulk(self, animal_type: str = "cat") -> List[Dict]:
+    def _get_facts_bulk(self, animal_type: str = "cat", target: Optional[int] = None) -> List[Dict]:
         """
         Busca fatos em bulk da API oficial Heroku (endpoint /facts/random).
         
+        Os lotes vêm de `_fetch_bulk_responses`. Como a amostragem é
+        aleatória, o resultado é deduplicado pelo texto e pode ter menos
+        registros que o alvo.
+        
         Args:
             animal_type: Tipo de animal
-            
+            target: Total de registros pedidos (padrão: BULK_TARGET_RECORDS)
+        
         Returns:
             Lista de fatos
         """
         logger.info(f"Buscando fatos da API oficial cat-fact.herokuapp.com...")
         
-        try:
-            params = {
-                "animal_type": animal_type,
-                "amount": 500  # Máximo permitido pela API oficial
-            }
-            
-            data = self._make_request(Config.RANDOM_FACT_ENDPOINT, params=params)
+        responses = self._fetch_bulk_responses(animal_type, target)
+        all_facts = merge_unique(as_fact_list(data) for data, _ in responses)
+        
+        logger.info(f"Total de {len(all_facts)} fatos obtidos")
+        return all_facts
+    
+    def _fetch_bulk_responses(
+        self,
+        animal_type: str = "cat",
+        target: Optional[int] = None
+    ) -> List[Tuple[Any, bytes]]:
+        """
+        Busca os lotes bulk e devolve as respostas como vieram da API.
+        
+        O alvo é dividido em lotes de até `BULK_BATCH_SIZE` (`amount`),
+        buscados em paralelo, até `concurrency` por vez. Só os lotes que
+        falharam são repetidos, em novas rodadas; cada lote tem um único
+        `RetryState` de `self.retry_policy`, compartilhado pelas tentativas
+        de `_request_body` e pelas rodadas, então as tentativas, o orçamento
+        e o jitter são os de uma requisição comum. As rodadas param quando
+        nenhum lote tem mais tentativas ou quando o circuito do host abre;
+        os lotes obtidos são devolvidos mesmo assim.
+        
+        Args:
+            animal_type: Tipo de animal
+            target: Total de registros pedidos (padrão: BULK_TARGET_RECORDS)
+        
+        Returns:
+            (resposta decodificada, corpo bruto) de cada lote obtido, na ordem dos lotes
+        """
+        target = Config.BULK_TARGET_RECORDS if target is None else target
+        amounts = split_amounts(target, Config.BULK_BATCH_SIZE)
+        batches: Dict[int, Tuple[Any, bytes]] = {}
+        retries = {index: self.retry_policy.start() for index in range(len(amounts))}
+        # Lotes da próxima rodada e a espera (com jitter) antes de cada um
+        delays = dict.fromkeys(range(len(amounts)), 0.0)
+        
+        def fetch(index: int) -> Optional[Tuple[Any, bytes]]:
+            time.sleep(delays[index])
+            return self._fetch_bulk_batch(animal_type, amounts[index], retries[index])
+        
+        while delays:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(delays))) as executor:
+                results = list(executor.map(fetch, list(delays)))
             
-            # A API retorna um array direto quando amount > 1
-            if isinstance(data, list):
-                all_facts = data
-            elif isinstance(data, dict):
-                # Se retornar um único objeto, coloca em lista
-                all_facts = [data]
-            else:
-                logger.warning(f"Resposta inesperada da API: {type(data)}")
-                all_facts = []
+            for index, response in zip(list(delays), results):
+                if response is not None:
+                    batches[index] = response
+            pending = [index for index in delays if index not in batches]
             
-            logger.info(f"Total de {len(all_facts)} fatos obtidos")
-            return all_facts
+            if pending and self.circuit.is_open:
+                logger.warning(f"Circuito de {self.circuit.host} aberto: lotes com falha não serão repetidos")
+                break
             
+            delays = {}
+            for index in pending:
+                delay = retries[index].next_delay()
+                if delay is not None:
+                    delays[index] = delay
+            if delays:
+                logger.warning(f"Repetindo {len(delays)} de {len(amounts)} lotes com falha")
+        
+        pending = len(amounts) - len(batches)
+        if pending:
+            logger.error(
+                f"{pending} de {len(amounts)} lotes falharam; "
+                f"seguindo com os {len(batches)} lotes obtidos"
+            )
+        
+        return [batches[index] for index in sorted(batches)]
+    
+    def _fetch_bulk_batch(
+        self,
+        animal_type: str,
+        amount: int,
+        retry: Optional[RetryState] = None
+    ) -> Optional[Tuple[Any, bytes]]:
+        """
+        Busca um lote do endpoint /facts/random.
+        
+        Args:
+            animal_type: Tipo de animal
+            amount: Quantidade de fatos pedida
+            retry: Tentativas do lote nas rodadas anteriores (ver `_request_body`)
+        
+        Returns:
+            Resposta decodificada do lote (lista de fatos ou um único fato) e
+            o corpo bruto, ou None se falhou ou veio em formato inesperado
+        """
+        try:
+            params = {"animal_type": animal_type, "amount": amount}
+            body = self._request_body(self.endpoint, params=params, cacheable=False, retry=retry)
+            data = json_codec.loads(body)
+        
         except Exception as e:
-            logger.error(f"Erro ao buscar fatos: {str(e)}")
-            return []
+            logger.error(f"Erro ao buscar lote bulk (amount={amount}): {e}")
+            return None
+        
+        if as_fact_list(data) is None:
+            logger.warning(f"Resposta inesperada da API: {type(data)}")
+            return None
+        return data, body
+    
+    def iter_pages(
+        self,
+        animal_type: str = "cat",
+        max_pages: int = 10,
+        checkpoint: Optional[ExtractionCheckpoint] = None,
+        stop_when: Optional[Callable[[int, Dict], bool]] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Itera sobre os fatos página a página, sem acumular o dataset inteiro.
+        
+        Para a API catfact.ninja no máximo `concurrency` páginas ficam em
+        memória ao mesmo tempo; para a API Heroku os lotes bulk, já
+        juntos, são devolvidos como uma página.
+        
+        Args:
+            animal_type: Tipo de animal (padrão: 'cat')
+            max_pages: Número máximo de páginas a buscar (para APIs com paginação)
+            checkpoint: Checkpoint para registrar/retomar o crawl paginado
+            stop_when: Predicado `(página, resposta) -> bool` que encerra a
+                paginação antes de entregar a página (ex.: página inalterada)
+        
+        Yields:
+            Lista de fatos de cada página, na ordem das páginas
+        """
+        if self.paginated:
+            yield from self._iter_pages_paginated(max_pages, checkpoint, stop_when)
+        else:
+            facts = self._get_facts_bulk(animal_type)
+            if facts:
+                yield facts
+    
+    def iter_responses(self, animal_type: str = "cat", max_pages: int = 10) -> Iterator[Any]:
+        """
+        Itera sobre as respostas brutas da API, sem desembrulhar os fatos.
+        
+        Usado pela camada Bronze, que grava cada resposta como veio.
+        
+        Args:
+            animal_type: Tipo de animal (padrão: 'cat')
+            max_pages: Número máximo de páginas a buscar (para APIs com paginação)
+        
+        Yields:
+            (resposta decodificada, corpo bruto em bytes) de cada página
+            (catfact.ninja) ou de cada lote bulk (Heroku), sem a deduplicação
+            de `_get_facts_bulk`
+        """
+        if self.paginated:
+            yield from self._iter_pages_paginated(max_pages, raw=True)
+        else:
+            yield from self._fetch_bulk_responses(animal_type)
     
-    def _get_facts_paginated(self, animal_type: str = "cat", max_pages: int = 10) -> List[Dict]:
+    def _get_facts_paginated(
+        self,
+        animal_type: str = "cat",
+        max_pages: int = 10,
+        checkpoint: Optional[ExtractionCheckpoint] = None
+    ) -> List[Dict]:
         """
         Busca fatos com paginação da API catfact.ninja (endpoint /facts).
         
         Args:
             animal_type: Tipo de animal
             max_pages: Número máximo de páginas
-            
+            checkpoint: Checkpoint para registrar/retomar o crawl paginado
+        
         Returns:
             Lista de fatos
         """
+        all_facts = []
+        for facts in self._iter_pages_paginated(max_pages, checkpoint):
+            all_facts.extend(facts)
+        
+        logger.info(f"Total de {len(all_facts)} fatos obtidos")
+        return all_facts
+    
+    def _iter_pages_paginated(
+        self,
+        max_pages: int = 10,
+        checkpoint: Optional[ExtractionCheckpoint] = None,
+        stop_when: Optional[Callable[[int, Dict], bool]] = None,
+        raw: bool = False
+    ) -> Iterator[Any]:
+        """
+        Itera sobre as páginas do endpoint /facts da API catfact.ninja.
+        
+        A primeira página é buscada sozinha para descobrir `last_page`; as
+        demais são buscadas em paralelo numa janela deslizante de até
+        `concurrency` requisições e entregues na ordem das páginas. A
+        iteração para na primeira página com falha ou vazia, como na busca
+        sequencial.
+        
+        Com um checkpoint, cada página concluída é registrada em disco; se ele
+        já tiver progresso, os registros salvos são reemitidos e a busca
+        continua a partir do próximo registro, com qualquer tamanho de página.
+        Uma página com `per_page` diferente do `limit` pedido interrompe o
+        crawl com erro, em vez de deslocar os offsets seguintes.
+        
+        Args:
+            max_pages: Número máximo de páginas
+            checkpoint: Checkpoint para registrar/retomar o crawl
+            stop_when: Predicado `(página, resposta) -> bool`; quando True a
+                página não é entregue e as requisições pendentes são canceladas
+            raw: Se True, entrega a resposta decodificada de cada página e o
+                seu corpo bruto, em vez de apenas a lista `data`
+        
+        Yields:
+            Lista de fatos de cada página (ou `(resposta, corpo)`, se `raw`)
+        """
         logger.info(f"Buscando fatos da API catfact.ninja...")
         
-        all_facts = []
-        page = 1
+        next_offset = 0
+        if checkpoint is not None and checkpoint.has_progress:
+            logger.info(
+                f"Retomando do checkpoint: {checkpoint.records_fetched} "
+                f"de {checkpoint.target_records} registros"
+            )
+            for batch in checkpoint.iter_record_batches():
+                if raw:
+                    # Páginas retomadas não guardam o corpo original
+                    response = {"data": batch}
+                    yield response, json_codec.dumps(response)
+                else:
+                    yield batch
+            
+            if checkpoint.is_complete:
+                return
+            next_offset = checkpoint.records_fetched
         
-        while page <= max_pages:
+        # O crawl avança por offset de registros; com o controlador, o tamanho
+        # de página pode mudar (exceto com stop_when, que depende da numeração
+        # de API_PAGE_SIZE)
+        controller = self.controller
+        adapt_page_size = controller is not None and stop_when is None
+        
+        limit = self._page_limit(next_offset, adapt_page_size)
+        page = next_offset // limit + 1
+        fetched = self._fetch_page(page, limit)
+        if not fetched:
+            return
+        first_page, first_body = fetched
+        self._check_page_size(page, limit, first_page)
+        
+        # max_pages conta páginas de API_PAGE_SIZE, independente do tamanho usado
+        end_offset = max_pages * self.page_size
+        if "total" in first_page:
+            end_offset = min(end_offset, first_page["total"])
+        else:
+            end_offset = min(end_offset, first_page.get("last_page", page) * limit)
+        
+        logger.info(f"Página {page}/{first_page.get('last_page', '?')}: {len(first_page['data'])} fatos obtidos")
+        if stop_when is not None and stop_when(page, first_page):
+            return
+        if checkpoint is not None:
+            checkpoint.save_page(first_page["data"], end_offset)
+        yield (first_page, first_body) if raw else first_page["data"]
+        
+        next_offset += len(first_page["data"])
+        if next_offset >= end_offset:
+            return
+        
+        logger.info(
+            f"Buscando registros {next_offset + 1}-{end_offset} com concorrência {self.concurrency}"
+            + (" (adaptativa)" if controller is not None else "")
+        )
+        
+        max_workers = controller.max_concurrency if controller is not None else self.concurrency
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            
             try:
-                params = {"limit": 100, "page": page}
-                data = self._make_request(Config.FACTS_ENDPOINT, params=params)
-                
-                # catfact.ninja retorna: {"current_page": 1, "data": [...], "last_page": 4}
-                if isinstance(data, dict) and "data" in data:
-                    facts = data["data"]
+                while pending or next_offset < end_offset:
+                    # Mantém até `concurrency` páginas em voo
+                    window = controller.concurrency if controller is not None else self.concurrency
+                    while next_offset < end_offset and len(pending) < window:
+                        limit = self._page_limit(next_offset, adapt_page_size)
+                        page = next_offset // limit + 1
+                        pending.append((page, limit, executor.submit(self._fetch_page, page, limit)))
+                        next_offset += limit
                     
-                    if not facts:
-                        logger.info("Nenhum fato encontrado na página atual")
+                    page, limit, future = pending.popleft()
+                    fetched = future.result()
+                    if not fetched:
                         break
                     
-                    all_facts.extend(facts)
-                    logger.info(f"Página {page}/{data.get('last_page', '?')}: {len(facts)} fatos obtidos")
-                    
-                    # Verifica se chegou na última página
-                    if "last_page" in data and page >= data["last_page"]:
+                    data, body = fetched
+                    if stop_when is not None and stop_when(page, data):
                         break
                     
-                    page += 1
+                    # O offset das próximas páginas já assumiu `limit` registros nesta
+                    self._check_page_size(page, limit, data)
                     
-                else:
-                    logger.warning(f"Formato de resposta inesperado: {type(data)}")
-                    break
-                
-            except Exception as e:
-                logger.error(f"Erro ao buscar página {page}: {e}")
-                break
+                    logger.info(f"Página {page}/{data.get('last_page', '?')}: {len(data['data'])} fatos obtidos")
+                    if checkpoint is not None:
+                        checkpoint.save_page(data["data"], end_offset)
+                    yield (data, body) if raw else data["data"]
+            
+            finally:
+                for _, _, remaining in pending:
+                    remaining.cancel()
+    
+    def _page_limit(self, offset: int, adapt: bool) -> int:
+        """
+        Tamanho de página para buscar a partir de `offset`.
         
-        logger.info(f"Total de {len(all_facts)} fatos obtidos")
-        return all_facts
+        O `limit` sempre divide o offset, para que a página
+        `offset // limit + 1` comece exatamente no próximo registro (inclusive
+        ao retomar um checkpoint gravado com outro tamanho de página).
+        
+        Args:
+            offset: Registros já obtidos
+            adapt: Se o tamanho vem do controlador adaptativo
+        
+        Returns:
+            Valor de `limit` da próxima requisição
+        """
+        size = self.controller.page_size_at(offset) if adapt else self.page_size
+        return math.gcd(offset, size) or size
+    
+    @staticmethod
+    def _check_page_size(page: int, limit: int, data: Dict) -> None:
+        """
+        Garante que o servidor respeitou o `limit` pedido.
+        
+        Se ele limitar o tamanho da página (a catfact.ninja aceita no máximo
+        100), os offsets das páginas seguintes ficariam errados e registros
+        seriam pulados ou repetidos sem aviso.
+        
+        Raises:
+            RuntimeError: `per_page` diferente do pedido ou página maior que `limit`
+        """
+        per_page = data.get("per_page", limit)
+        if int(per_page) != limit or len(data["data"]) > limit:
+            raise RuntimeError(
+                f"Página {page}: pedido limit={limit}, servidor usou per_page={per_page} "
+                f"({len(data['data'])} registros). Reduza API_PAGE_SIZE/API_PAGE_SIZE_MAX "
+                f"ao máximo aceito pela API."
+            )
+    
+    def _fetch_page(self, page: int, limit: Optional[int] = None) -> Optional[Tuple[Dict, bytes]]:
+        """
+        Busca uma única página do endpoint /facts.
+        
+        Args:
+            page: Número da página
+            limit: Quantidade de fatos por página (padrão: API_PAGE_SIZE)
+        
+        Returns:
+            Resposta decodificada da página e o corpo bruto, ou None se
+            falhou ou veio vazia
+        """
+        try:
+            params = {"limit": limit or self.page_size, "page": page}
+            body = self._request_body(self.endpoint, params=params)
+            data = json_codec.loads(body)
+        
+        except Exception as e:
+            logger.error(f"Erro ao buscar página {page}: {e}")
+            return None
+        
+        # catfact.ninja retorna: {"current_page": 1, "data": [...], "last_page": 4}
+        if not isinstance(data, dict) or "data" not in data:
+            logger.warning(f"Formato de resposta inesperado: {type(data)}")
+            return None
+        
+        if not data["data"]:
+            logger.info(f"Nenhum fato encontrado na página {page}")
+            return None
+        
+        return data, body
     
     def get_random_fact(self, animal_type: str = "cat") -> Dict:
         """
@@ -276,13 +726,15 @@ class CatFactsAPIClient:
         logger.info(f"Buscando fato aleatório de {animal_type}...")
         
         params = {"animal_type": animal_type}
-        data = self._make_request(Config.RANDOM_FACT_ENDPOINT, params=params)
+        data = self._make_request(Config.RANDOM_FACT_ENDPOINT, params=params, cacheable=False)
         
         return data
     
     def close(self):
-        """Fecha a sessão HTTP."""
-        self.session.close()
+        """Fecha o pool de conexões HTTP e o cache."""
+        self._sessions.close()
+        if self.cache is not None:
+            self.cache.close()
         logger.info("API Client encerrado")
     
     def __enter__(self):
@@ -0,0 +1,433 @@
+"""
+Cliente HTTP assíncrono (asyncio) para a Cat Facts API.
+
+Contraparte não bloqueante do `CatFactsAPIClient`: usa a mesma política de
+retry (`src/utils/retry_policy.py`) e o mesmo rate limit (429), mas usa
+`aiohttp` com um pool de conexões compartilhado, permitindo buscar
+vários endpoints ao mesmo tempo em um único event loop.
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+import aiohttp
+
+from src.config import Config
+from src.utils import json_codec
+from src.utils.bulk import as_fact_list, merge_unique, split_amounts
+from src.utils.http_pool import accept_encoding
+from src.utils.logger import setup_logger
+from src.utils.metrics import MetricsRegistry
+from src.utils.rate_limiter import TokenBucketRateLimiter, parse_delay
+from src.utils.retry_policy import RETRY_STATUSES, RetryPolicy, RetryState, circuit_breaker_for
+
+
+logger = setup_logger(__name__)
+
+
+class AsyncCatFactsAPIClient:
+    """Cliente assíncrono para a Cat Facts API com retry logic e tratamento de erros."""
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        verify_ssl: Optional[bool] = None,
+        concurrency: Optional[int] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        paginated: Optional[bool] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        endpoint: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Inicializa o cliente assíncrono da API.
+        
+        A sessão HTTP é criada sob demanda, dentro do event loop em execução.
+        
+        Args:
+            base_url: URL base da API
+            timeout: Timeout das requisições em segundos
+            max_retries: Número máximo de tentativas por requisição
+            retry_delay: Teto da primeira espera entre tentativas, em segundos
+                (dobra a cada tentativa, com jitter)
+            verify_ssl: Se deve verificar certificados SSL
+            concurrency: Número máximo de requisições simultâneas
+            rate_limiter: Token bucket a usar (padrão: um novo, conforme
+                API_RATE_LIMIT/API_RATE_BURST; pode ser compartilhado entre clientes)
+            paginated: Se a API usa /facts paginado (padrão: detectado pela base_url)
+            metrics: Registro de métricas (padrão: um novo, exposto em `self.metrics`)
+            endpoint: Endpoint dos fatos (padrão: FACTS_ENDPOINT se paginado,
+                RANDOM_FACT_ENDPOINT se bulk)
+            retry_policy: Política de retry (padrão: uma nova com `max_retries`,
+                `retry_delay` e API_RETRY_MAX_DELAY/API_RETRY_BUDGET)
+        """
+        base_url = Config.API_BASE_URL if base_url is None else base_url
+        timeout = Config.API_TIMEOUT if timeout is None else timeout
+        max_retries = Config.API_MAX_RETRIES if max_retries is None else max_retries
+        retry_delay = Config.API_RETRY_DELAY if retry_delay is None else retry_delay
+        verify_ssl = Config.API_VERIFY_SSL if verify_ssl is None else verify_ssl
+        concurrency = Config.API_CONCURRENCY if concurrency is None else concurrency
+        
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.retry_policy = retry_policy or RetryPolicy(max_retries, retry_delay)
+        self.circuit = circuit_breaker_for(base_url)
+        self.verify_ssl = verify_ssl
+        self.concurrency = max(1, concurrency)
+        self.paginated = "catfact.ninja" in base_url if paginated is None else paginated
+        self.endpoint = endpoint or (Config.FACTS_ENDPOINT if self.paginated else Config.RANDOM_FACT_ENDPOINT)
+        self.metrics = metrics or MetricsRegistry()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        
+        if rate_limiter is None and Config.API_RATE_LIMIT > 0:
+            rate_limiter = TokenBucketRateLimiter()
+        self.rate_limiter = rate_limiter
+        
+        if not verify_ssl:
+            logger.warning("⚠️  Verificação SSL desabilitada - use apenas em desenvolvimento!")
+        logger.info(f"Async API Client inicializado: {base_url}")
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Retorna a sessão HTTP compartilhada, criando-a na primeira chamada.
+        
+        Returns:
+            Sessão configurada com pool de conexões limitado a `concurrency`
+        """
+        if self._session is None or self._session.closed:
+            if Config.HTTP_KEEP_ALIVE:
+                keep_alive = {"keepalive_timeout": Config.HTTP_KEEPALIVE_TIMEOUT}
+            else:
+                keep_alive = {"force_close": True}
+            connector = aiohttp.TCPConnector(
+                limit=self.concurrency,
+                ssl=None if self.verify_ssl else False,
+                **keep_alive
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    "User-Agent": "UOLCatLovers/1.0",
+                    "Accept": "application/json",
+                    "Accept-Encoding": accept_encoding()
+                }
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        
+        return self._session
+    
+    async def _make_request(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        method: str = "GET",
+        retry: Optional[RetryState] = None
+    ) -> Dict:
+        """
+        Executa uma requisição HTTP assíncrona com tratamento de erros.
+        
+        Usa a mesma `RetryPolicy` e o mesmo circuit breaker por host do
+        cliente síncrono.
+        
+        Args:
+            endpoint: Endpoint da API
+            params: Parâmetros da query string
+            method: Método HTTP
+            retry: Tentativas já em andamento da mesma requisição lógica, que
+                continuam contando (padrão: começa uma nova contagem)
+        
+        Returns:
+            Dados da resposta em JSON
+        
+        Raises:
+            aiohttp.ClientError: Erro na requisição
+            CircuitOpenError: Circuito do host aberto
+        """
+        url = urljoin(self.base_url, endpoint)
+        session = self._get_session()
+        
+        retry = retry or self.retry_policy.start()
+        
+        while True:
+            self.circuit.before_request()
+            timeout = aiohttp.ClientTimeout(total=retry.begin_attempt(self.timeout))
+            logger.debug(f"Tentativa {retry.attempt}/{self.retry_policy.max_attempts} - {method} {url}")
+            if retry.attempt > 1:
+                self.metrics.inc("http_retries_total", endpoint=endpoint)
+            
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.reserve())
+            
+            try:
+                async with self._semaphore:
+                    request_start = time.perf_counter()
+                    async with session.request(method, url, params=params, timeout=timeout) as response:
+                        body = await response.read()
+                        elapsed = time.perf_counter() - request_start
+                        status, headers = response.status, response.headers
+            
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                is_timeout = isinstance(e, asyncio.TimeoutError)
+                logger.error(f"{'Timeout na requisição' if is_timeout else 'Erro de conexão'}: {e}")
+                self.metrics.inc(
+                    "http_requests_total",
+                    endpoint=endpoint,
+                    status="timeout" if is_timeout else "connection_error"
+                )
+                self.circuit.record_failure()
+                
+                delay = retry.next_delay()
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                continue
+            
+            self.metrics.observe("http_request_duration_seconds", elapsed, endpoint=endpoint)
+            self.metrics.inc("http_requests_total", endpoint=endpoint, status=str(status))
+            self.metrics.inc("http_response_bytes_total", len(body), endpoint=endpoint)
+            if status >= 500:
+                self.circuit.record_failure()
+            else:
+                self.circuit.record_success()
+            
+            if self.rate_limiter is not None:
+                self.rate_limiter.update_from_headers(headers)
+            
+            if status in RETRY_STATUSES:
+                logger.error(f"HTTP Error {status}: {url}")
+                retry_after = parse_delay(headers.get("Retry-After"))
+                if status == 429:
+                    self.metrics.inc("http_rate_limited_total", endpoint=endpoint)
+                
+                delay = retry.next_delay(retry_after)
+                if delay is None:
+                    response.raise_for_status()
+                
+                if retry_after is not None and self.rate_limiter is not None:
+                    # O rate limiter já foi pausado pelo tempo pedido pelo servidor
+                    delay = 0.0
+                logger.warning(f"Nova tentativa em {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            
+            response.raise_for_status()
+            logger.debug(f"Requisição bem-sucedida: {url}")
+            return json_codec.loads(body)
+    
+    async def get_all_facts(
+        self,
+        animal_type: str = "cat",
+        max_pages: int = 10,
+        target: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Busca todos os fatos disponíveis. Detecta automaticamente qual API está sendo usada.
+        
+        Args:
+            animal_type: Tipo de animal (padrão: 'cat')
+            max_pages: Número máximo de páginas a buscar (para APIs com paginação)
+            target: Registros pedidos no modo bulk (padrão: BULK_TARGET_RECORDS)
+        
+        Returns:
+            Lista de fatos
+        """
+        if self.paginated:
+            return await self._get_facts_paginated(animal_type, max_pages)
+        else:
+            return await self._get_facts_bulk(animal_type, target)
+    
+    async def _get_facts_bulk(self, animal_type: str = "cat", target: Optional[int] = None) -> List[Dict]:
+        """
+        Busca fatos em bulk da API oficial Heroku (endpoint /facts/random).
+        
+        Mesma estratégia de `CatFactsAPIClient._get_facts_bulk`: lotes de até
+        `BULK_BATCH_SIZE` buscados concorrentemente, só os que falharam são
+        repetidos, com um `RetryState` por lote compartilhado pelas tentativas
+        e pelas rodadas (que param quando o circuito do host abre), e o
+        resultado, possivelmente parcial, é deduplicado pelo texto.
+        
+        Args:
+            animal_type: Tipo de animal
+            target: Total de registros pedidos (padrão: BULK_TARGET_RECORDS)
+        
+        Returns:
+            Lista de fatos
+        """
+        logger.info(f"Buscando fatos da API oficial cat-fact.herokuapp.com...")
+        
+        target = Config.BULK_TARGET_RECORDS if target is None else target
+        amounts = split_amounts(target, Config.BULK_BATCH_SIZE)
+        batches: Dict[int, List[Dict]] = {}
+        retries = {index: self.retry_policy.start() for index in range(len(amounts))}
+        # Lotes da próxima rodada e a espera (com jitter) antes de cada um
+        delays = dict.fromkeys(range(len(amounts)), 0.0)
+        
+        async def fetch(index: int) -> Optional[List[Dict]]:
+            await asyncio.sleep(delays[index])
+            return await self._fetch_bulk_batch(animal_type, amounts[index], retries[index])
+        
+        while delays:
+            results = await asyncio.gather(*(fetch(index) for index in delays))
+            for index, facts in zip(list(delays), results):
+                if facts is not None:
+                    batches[index] = facts
+            pending = [index for index in delays if index not in batches]
+            
+            if pending and self.circuit.is_open:
+                logger.warning(f"Circuito de {self.circuit.host} aberto: lotes com falha não serão repetidos")
+                break
+            
+            delays = {}
+            for index in pending:
+                delay = retries[index].next_delay()
+                if delay is not None:
+                    delays[index] = delay
+            if delays:
+                logger.warning(f"Repetindo {len(delays)} de {len(amounts)} lotes com falha")
+        
+        all_facts = merge_unique(batches[index] for index in sorted(batches))
+        pending = len(amounts) - len(batches)
+        if pending:
+            logger.error(
+                f"{pending} de {len(amounts)} lotes falharam; "
+                f"seguindo com {len(all_facts)} fatos parciais"
+            )
+        
+        logger.info(f"Total de {len(all_facts)} fatos obtidos")
+        return all_facts
+    
+    async def _fetch_bulk_batch(
+        self,
+        animal_type: str,
+        amount: int,
+        retry: Optional[RetryState] = None
+    ) -> Optional[List[Dict]]:
+        """
+        Busca um lote do endpoint /facts/random.
+        
+        Args:
+            animal_type: Tipo de animal
+            amount: Quantidade de fatos pedida
+            retry: Tentativas do lote nas rodadas anteriores (ver `_make_request`)
+        
+        Returns:
+            Fatos do lote, ou None se falhou
+        """
+        try:
+            params = {"animal_type": animal_type, "amount": amount}
+            data = await self._make_request(self.endpoint, params=params, retry=retry)
+        
+        except Exception as e:
+            logger.error(f"Erro ao buscar lote bulk (amount={amount}): {e}")
+            return None
+        
+        facts = as_fact_list(data)
+        if facts is None:
+            logger.warning(f"Resposta inesperada da API: {type(data)}")
+        return facts
+    
+    async def _get_facts_paginated(self, animal_type: str = "cat", max_pages: int = 10) -> List[Dict]:
+        """
+        Busca fatos com paginação da API catfact.ninja (endpoint /facts).
+        
+        A primeira página define `last_page`; as demais são buscadas
+        concorrentemente e devolvidas na ordem das páginas.
+        
+        Args:
+            animal_type: Tipo de animal
+            max_pages: Número máximo de páginas
+        
+        Returns:
+            Lista de fatos
+        """
+        logger.info(f"Buscando fatos da API catfact.ninja...")
+        
+        first_page = await self._fetch_page(1)
+        if not first_page:
+            logger.info("Total de 0 fatos obtidos")
+            return []
+        
+        all_facts = list(first_page["data"])
+        last_page = min(first_page.get("last_page", 1), max_pages)
+        logger.info(f"Página 1/{first_page.get('last_page', '?')}: {len(all_facts)} fatos obtidos")
+        
+        remaining_pages = range(2, last_page + 1)
+        pages = await asyncio.gather(*(self._fetch_page(page) for page in remaining_pages))
+        
+        for page, data in zip(remaining_pages, pages):
+            if not data:
+                # Mantém apenas o prefixo contíguo de páginas, como na busca sequencial
+                break
+            
+            all_facts.extend(data["data"])
+            logger.info(f"Página {page}/{data.get('last_page', '?')}: {len(data['data'])} fatos obtidos")
+        
+        logger.info(f"Total de {len(all_facts)} fatos obtidos")
+        return all_facts
+    
+    async def _fetch_page(self, page: int, limit: Optional[int] = None) -> Optional[Dict]:
+        """
+        Busca uma única página do endpoint /facts.
+        
+        Args:
+            page: Número da página
+            limit: Quantidade de fatos por página (padrão: API_PAGE_SIZE)
+        
+        Returns:
+            Resposta da página, ou None se falhou ou veio vazia
+        """
+        try:
+            params = {"limit": limit or Config.API_PAGE_SIZE, "page": page}
+            data = await self._make_request(self.endpoint, params=params)
+        
+        except Exception as e:
+            logger.error(f"Erro ao buscar página {page}: {e}")
+            return None
+        
+        if not isinstance(data, dict) or "data" not in data:
+            logger.warning(f"Formato de resposta inesperado: {type(data)}")
+            return None
+        
+        if not data["data"]:
+            logger.info(f"Nenhum fato encontrado na página {page}")
+            return None
+        
+        return data
+    
+    async def get_random_fact(self, animal_type: str = "cat") -> Dict:
+        """
+        Busca um fato aleatório.
+        
+        Args:
+            animal_type: Tipo de animal (padrão: 'cat')
+        
+        Returns:
+            Fato aleatório
+        """
+        logger.info(f"Buscando fato aleatório de {animal_type}...")
+        
+        params = {"animal_type": animal_type}
+        return await self._make_request(Config.RANDOM_FACT_ENDPOINT, params=params)
+    
+    async def close(self):
+        """Fecha a sessão HTTP."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        logger.info("Async API Client encerrado")
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
@@ -0,0 +1,71 @@
+"""
+Divisão e junção dos lotes do modo bulk (API oficial Heroku, `/facts/random`).
+
+A API devolve no máximo `amount` fatos aleatórios por chamada. Para chegar
+a um alvo maior, o alvo é dividido em lotes buscados em paralelo pelos
+clientes (`CatFactsAPIClient` e `AsyncCatFactsAPIClient`); como a amostragem
+é aleatória, lotes diferentes podem repetir fatos, então a junção
+deduplica pelo conteúdo.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def split_amounts(target: int, batch_size: int) -> List[int]:
+    """
+    Divide o alvo de registros em valores de `amount` por requisição.
+    
+    Args:
+        target: Total de registros desejado
+        batch_size: `amount` máximo por requisição
+    
+    Returns:
+        Lista de `amount`s (o último pode ser menor), vazia se o alvo não for positivo
+    """
+    batch_size = max(1, batch_size)
+    return [min(batch_size, target - start) for start in range(0, max(0, target), batch_size)]
+
+
+def as_fact_list(data: Any) -> Optional[List[Dict]]:
+    """
+    Normaliza a resposta de `/facts/random`.
+    
+    A API retorna um array quando `amount > 1` e um único objeto quando
+    `amount == 1`.
+    
+    Args:
+        data: JSON da resposta
+    
+    Returns:
+        Lista de fatos, ou None se o formato for inesperado
+    """
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        return [data]
+    return None
+
+
+def merge_unique(batches: Iterable[List[Dict]]) -> List[Dict]:
+    """
+    Junta os lotes na ordem dada, mantendo a primeira ocorrência de cada texto.
+    
+    Registros sem texto passam direto, para a validação rejeitá-los.
+    
+    Args:
+        batches: Listas de fatos brutos
+    
+    Returns:
+        Fatos sem textos repetidos
+    """
+    seen = set()
+    merged = []
+    for batch in batches:
+        for fact in batch:
+            text = fact.get("fact") or fact.get("text") if isinstance(fact, dict) else None
+            if isinstance(text, str) and text:
+                if text in seen:
+                    continue
+                seen.add(text)
+            merged.append(fact)
+    return merged
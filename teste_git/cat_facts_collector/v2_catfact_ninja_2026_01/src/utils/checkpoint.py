@@ -0,0 +1,149 @@
+"""
+Checkpoint de extração paginada.
+
+Registra, a cada página concluída, os registros brutos obtidos até ali e
+quantos são (o offset do crawl). Assim, uma execução que falhou no meio
+do crawl pode ser retomada buscando apenas os registros que faltam, com
+qualquer tamanho de página (ver `CatFactsAPIClient._iter_pages_paginated`).
+
+Layout em disco (dentro de `Config.DATA_DIR`):
+    extraction_checkpoint.json   -> metadados (registros obtidos, alvo)
+    extraction_checkpoint.jsonl  -> registros brutos, um JSON por linha
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from src.config import Config
+from src.utils import json_codec
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class ExtractionCheckpoint:
+    """Persistência do progresso de um crawl paginado."""
+    
+    def __init__(self, base_url: Optional[str] = None, data_dir: Optional[Path] = None):
+        """
+        Inicializa o checkpoint e carrega o estado salvo, se houver.
+        
+        Args:
+            base_url: URL base da API (checkpoints de outra API são ignorados)
+            data_dir: Diretório dos arquivos de checkpoint (padrão: Config.DATA_DIR)
+        """
+        base_url = Config.API_BASE_URL if base_url is None else base_url
+        data_dir = data_dir or Config.DATA_DIR
+        self.base_url = base_url
+        self.state_path = data_dir / "extraction_checkpoint.json"
+        self.records_path = data_dir / "extraction_checkpoint.jsonl"
+        self.records_fetched = 0
+        self.target_records: Optional[int] = None
+        self.records_bytes = 0
+        self._load()
+    
+    def _load(self) -> None:
+        """Carrega os metadados do checkpoint do disco."""
+        if not self.state_path.exists():
+            return
+        
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Checkpoint ilegível, ignorando: {e}")
+            return
+        
+        if state.get("base_url") != self.base_url:
+            logger.warning(f"Checkpoint pertence a outra API ({state.get('base_url')}), ignorando")
+            return
+        
+        self.records_fetched = state.get("records_fetched", 0)
+        self.target_records = state.get("target_records")
+        self.records_bytes = state.get("records_bytes", 0)
+    
+    @property
+    def has_progress(self) -> bool:
+        """Indica se há registros obtidos a retomar."""
+        return self.records_fetched > 0
+    
+    @property
+    def is_complete(self) -> bool:
+        """Indica se todos os registros-alvo do crawl foram obtidos."""
+        return self.target_records is not None and self.records_fetched >= self.target_records
+    
+    def reset(self) -> None:
+        """Descarta o progresso salvo e começa um checkpoint novo."""
+        self.records_fetched = 0
+        self.target_records = None
+        self.records_bytes = 0
+        self.state_path.unlink(missing_ok=True)
+        self.records_path.unlink(missing_ok=True)
+    
+    def clear(self) -> None:
+        """Remove os arquivos de checkpoint (crawl concluído com sucesso)."""
+        self.reset()
+        logger.info("Checkpoint removido")
+    
+    def save_page(self, facts: List[Dict], target_records: int) -> None:
+        """
+        Registra uma página concluída (as páginas chegam em ordem).
+        
+        Os registros são anexados ao arquivo JSONL antes dos metadados serem
+        gravados (de forma atômica); em caso de queda entre as duas escritas,
+        o arquivo é truncado para o último tamanho confirmado na próxima
+        página salva.
+        
+        Args:
+            facts: Registros brutos da página
+            target_records: Total de registros que o crawl pretende buscar
+        """
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(self.records_path, "a+b") as records_file:
+            records_file.truncate(self.records_bytes)
+            for fact in facts:
+                records_file.write(json_codec.dumps(fact) + b"\n")
+            self.records_bytes = records_file.tell()
+        
+        self.target_records = target_records
+        self.records_fetched += len(facts)
+        
+        state = {
+            "base_url": self.base_url,
+            "endpoint": Config.FACTS_ENDPOINT,
+            "records_fetched": self.records_fetched,
+            "target_records": self.target_records,
+            "records_bytes": self.records_bytes,
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+        
+        tmp_path = self.state_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.state_path)
+    
+    def iter_record_batches(self, batch_size: Optional[int] = None) -> Iterator[List[Dict]]:
+        """
+        Lê os registros já salvos em lotes, sem carregar o arquivo inteiro.
+        
+        Args:
+            batch_size: Quantidade de registros por lote
+        
+        Yields:
+            Lotes de registros brutos, na ordem em que foram obtidos
+        """
+        batch_size = Config.BATCH_SIZE if batch_size is None else batch_size
+        if not self.has_progress:
+            return
+        
+        with open(self.records_path, encoding="utf-8") as records_file:
+            lines = islice(records_file, self.records_fetched)
+            while True:
+                batch = [json_codec.loads(line) for line in islice(lines, batch_size)]
+                if not batch:
+                    break
+                yield batch
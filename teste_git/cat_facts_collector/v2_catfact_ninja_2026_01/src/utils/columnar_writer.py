@@ -0,0 +1,206 @@
+"""
+Escrita de saída em formatos colunares (Parquet e Arrow IPC).
+
+Usa um schema fixo derivado de `CatFact.to_dict()`, para que todas as
+execuções gerem arquivos com os mesmos tipos (camada Silver), e grava em
+row groups de tamanho configurável à medida que os registros chegam.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.config import Config
+from src.utils.dedup_index import SeenIds
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+# Schema fixo, na mesma ordem de colunas de CatFact.to_dict()
+FACT_SCHEMA = pa.schema([
+    pa.field("id", pa.string(), nullable=False),
+    pa.field("text", pa.string()),
+    pa.field("type", pa.string()),
+    pa.field("user_id", pa.string()),
+    pa.field("user_name", pa.string()),
+    pa.field("upvotes", pa.int64()),
+    pa.field("user_upvoted", pa.bool_()),
+    pa.field("created_at", pa.timestamp("us", tz="UTC")),
+    pa.field("updated_at", pa.timestamp("us", tz="UTC")),
+    pa.field("deleted", pa.bool_()),
+    pa.field("source", pa.string()),
+    pa.field("used", pa.bool_()),
+    pa.field("sent_count", pa.int64()),
+    pa.field("length", pa.int64()),
+    pa.field("extracted_at", pa.timestamp("us", tz="UTC")),
+])
+
+# FACT_SCHEMA com a API de origem de cada registro (saída unificada de src/orchestrator.py)
+SOURCE_FACT_SCHEMA = FACT_SCHEMA.append(pa.field("source_api", pa.string(), nullable=False))
+
+
+def _raw_schema(schema: pa.Schema) -> pa.Schema:
+    """Mesmo schema, com os timestamps ainda como string ISO 8601 (como vêm de to_dict)."""
+    return pa.schema([
+        pa.field(field.name, pa.string()) if pa.types.is_timestamp(field.type) else field
+        for field in schema
+    ])
+
+
+_RAW_SCHEMA = _raw_schema(FACT_SCHEMA)
+
+
+def records_to_table(records: List[Dict], schema: pa.Schema = FACT_SCHEMA) -> pa.Table:
+    """
+    Converte registros achatados em uma tabela Arrow com o schema fixo.
+    
+    Args:
+        records: Dicionários no formato de `CatFact.to_dict()`
+        schema: Schema de destino (padrão: `FACT_SCHEMA`)
+    
+    Returns:
+        Tabela Arrow com `schema`
+    """
+    raw_schema = _RAW_SCHEMA if schema is FACT_SCHEMA else _raw_schema(schema)
+    return pa.Table.from_pylist(records, schema=raw_schema).cast(schema)
+
+
+class ColumnarWriter:
+    """Gravador incremental de Parquet ou Arrow IPC com row groups fixos."""
+    
+    def __init__(
+        self,
+        output_path: Path,
+        output_format: Optional[str] = None,
+        compression: Optional[str] = None,
+        row_group_size: Optional[int] = None,
+        schema: pa.Schema = FACT_SCHEMA
+    ):
+        """
+        Inicializa o gravador.
+        
+        Args:
+            output_path: Caminho do arquivo de saída
+            output_format: 'parquet' ou 'arrow'
+            compression: Codec de compressão (ex.: 'snappy', 'zstd', 'lz4', 'none')
+            row_group_size: Registros por row group (Parquet) ou record batch (Arrow)
+            schema: Schema do arquivo (padrão: `FACT_SCHEMA`)
+        
+        Raises:
+            ValueError: Formato não suportado
+        """
+        output_format = Config.OUTPUT_FORMAT if output_format is None else output_format
+        compression = Config.OUTPUT_COMPRESSION if compression is None else compression
+        row_group_size = Config.OUTPUT_ROW_GROUP_SIZE if row_group_size is None else row_group_size
+        
+        if output_format not in ("parquet", "arrow"):
+            raise ValueError(f"Formato colunar não suportado: {output_format}")
+        
+        self.output_path = output_path
+        self.output_format = output_format
+        self.compression = None if compression.lower() == "none" else compression.lower()
+        self.row_group_size = max(1, row_group_size)
+        self.schema = schema
+        self._writer: Optional[object] = None
+        self._sink: Optional[pa.OSFile] = None
+    
+    def _open(self) -> None:
+        """Abre o arquivo de saída no formato escolhido."""
+        if self.output_format == "parquet":
+            self._writer = pq.ParquetWriter(
+                self.output_path,
+                self.schema,
+                compression=self.compression or "none"
+            )
+        else:
+            self._sink = pa.OSFile(str(self.output_path), "wb")
+            options = pa.ipc.IpcWriteOptions(compression=self.compression)
+            self._writer = pa.ipc.new_file(self._sink, self.schema, options=options)
+    
+    def _write_batch(self, records: List[Dict]) -> None:
+        """Grava um row group / record batch."""
+        self._write_table(records_to_table(records, self.schema))
+    
+    def _write_table(self, table: pa.Table) -> None:
+        """Grava uma tabela já no schema do arquivo, em row groups / record batches."""
+        if self._writer is None:
+            self._open()
+        
+        if self.output_format == "parquet":
+            self._writer.write_table(table, row_group_size=self.row_group_size)
+        else:
+            self._writer.write_table(table, max_chunksize=self.row_group_size)
+    
+    def write(self, records: Iterable[Dict]) -> int:
+        """
+        Grava os registros, bufferizando `row_group_size` por vez.
+        
+        Duplicatas são removidas pelo `id` à medida que os registros chegam
+        (`SeenIds`, com memória limitada).
+        
+        Args:
+            records: Dicionários no formato de `CatFact.to_dict()`
+        
+        Returns:
+            Quantidade de registros gravados
+        """
+        seen_ids = SeenIds()
+        buffer = []
+        written = 0
+        
+        try:
+            for record in records:
+                if not seen_ids.add(record["id"]):
+                    continue
+                
+                buffer.append(record)
+                if len(buffer) >= self.row_group_size:
+                    self._write_batch(buffer)
+                    written += len(buffer)
+                    buffer = []
+            
+            if buffer:
+                self._write_batch(buffer)
+                written += len(buffer)
+        
+        finally:
+            seen_ids.close()
+            self.close()
+        
+        return written
+    
+    def write_tables(self, tables: Iterable[pa.Table]) -> int:
+        """
+        Grava tabelas Arrow compatíveis com o schema (ex.: lidas de outras partes).
+        
+        Args:
+            tables: Tabelas a concatenar no arquivo de saída
+        
+        Returns:
+            Quantidade de registros gravados
+        """
+        written = 0
+        
+        try:
+            for table in tables:
+                if table.num_rows:
+                    self._write_table(table.cast(self.schema))
+                    written += table.num_rows
+        
+        finally:
+            self.close()
+        
+        return written
+    
+    def close(self) -> None:
+        """Fecha o arquivo, finalizando o rodapé Parquet/Arrow."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
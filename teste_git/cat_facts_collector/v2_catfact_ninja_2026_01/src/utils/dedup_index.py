@@ -0,0 +1,251 @@
+"""
+Índice persistente de deduplicação por conteúdo.
+
+Guarda em SQLite (dentro de `Config.DATA_DIR`) o `hash_content` de todo
+registro já gravado, de qualquer API (Heroku ou catfact.ninja). O extrator
+consulta o índice página a página, antes da validação, e descarta o que já
+foi visto em execuções anteriores sem precisar reler o histórico de saída.
+
+`ContentHashTable` é a consulta/registro de hashes em lote usada tanto
+por `DedupIndex` quanto pelo estado incremental (`state_store.py`).
+
+`SeenIds` cobre a deduplicação por `id` dentro de uma única gravação: até
+`Config.DEDUP_MEMORY_IDS` ids ficam num set em memória; acima disso passam
+para um SQLite temporário, e a memória fica limitada ao cache de páginas.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.config import Config
+from src.utils.hashing import hash_content_batch
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+# Hashes por consulta `IN (...)` (abaixo do limite de variáveis do SQLite)
+LOOKUP_CHUNK_SIZE = 500
+
+# Cache de páginas do SQLite temporário de `SeenIds`, em KiB
+SEEN_IDS_CACHE_KIB = 2048
+
+
+class ContentHashTable:
+    """Hashes de conteúdo já vistos, guardados numa tabela SQLite."""
+    
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        scope: Optional[Dict[str, str]] = None,
+        extra: Optional[Dict[str, str]] = None,
+        column: str = "hash_content"
+    ):
+        """
+        Prepara a consulta e o insert sobre uma tabela existente.
+        
+        Args:
+            conn: Conexão do banco (o commit fica a cargo de quem a abriu)
+            table: Tabela dos hashes
+            scope: Colunas fixas que restringem a consulta e são gravadas nos
+                hashes novos (ex.: `base_url`, para um estado por API)
+            extra: Colunas fixas só gravadas nos hashes novos (ex.: `source`)
+            column: Coluna do hash
+        """
+        scope = scope or {}
+        extra = extra or {}
+        
+        self._conn = conn
+        self._select = f"SELECT {column} FROM {table} WHERE " + "".join(
+            f"{name} = ? AND " for name in scope
+        ) + f"{column} IN "
+        self._scope_params = list(scope.values())
+        
+        columns = [*scope, *extra, column, "first_seen_at"]
+        self._insert = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        self._fixed_values = (*scope.values(), *extra.values())
+    
+    def known(self, hashes: List[str]) -> set:
+        """Subconjunto de `hashes` já presente na tabela."""
+        known = set()
+        for start in range(0, len(hashes), LOOKUP_CHUNK_SIZE):
+            chunk = hashes[start:start + LOOKUP_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(
+                row[0] for row in self._conn.execute(
+                    f"{self._select}({placeholders})",
+                    self._scope_params + chunk
+                )
+            )
+        return known
+    
+    def filter_new(self, facts: List[Dict]) -> List[Dict]:
+        """
+        Mantém apenas os registros cujo conteúdo ainda não foi visto.
+        
+        Os hashes dos registros devolvidos são marcados como vistos (pendente
+        até o commit da conexão), o que também descarta repetições dentro da
+        execução. Registros sem texto passam direto, para a validação
+        rejeitá-los.
+        
+        Args:
+            facts: Registros brutos de uma página
+        
+        Returns:
+            Registros inéditos, na ordem original
+        """
+        texts, with_text = [], []
+        for fact in facts:
+            text = fact.get("fact") or fact.get("text")
+            if isinstance(text, str) and text:
+                texts.append(text)
+                with_text.append(fact)
+        
+        if not texts:
+            return list(facts)
+        
+        hashes = hash_content_batch(texts)
+        known = self.known(hashes)
+        
+        now = datetime.now(timezone.utc).isoformat()
+        dropped = set()
+        new_rows = []
+        for content_hash, fact in zip(hashes, with_text):
+            if content_hash in known:
+                dropped.add(id(fact))
+                continue
+            known.add(content_hash)
+            new_rows.append((*self._fixed_values, content_hash, now))
+        
+        self._conn.executemany(self._insert, new_rows)
+        return [fact for fact in facts if id(fact) not in dropped]
+
+
+class SeenIds:
+    """Conjunto de ids já gravados em uma saída, com memória limitada."""
+    
+    def __init__(self, max_in_memory: Optional[int] = None):
+        """
+        Inicializa o conjunto vazio.
+        
+        Args:
+            max_in_memory: Ids mantidos no set antes de passar para o SQLite
+                temporário (padrão: Config.DEDUP_MEMORY_IDS)
+        """
+        max_in_memory = Config.DEDUP_MEMORY_IDS if max_in_memory is None else max_in_memory
+        self.max_in_memory = max(0, max_in_memory)
+        self._ids = set()
+        self._conn: Optional[sqlite3.Connection] = None
+    
+    def add(self, record_id: str) -> bool:
+        """
+        Registra um id.
+        
+        Args:
+            record_id: Id do registro
+        
+        Returns:
+            True se o id ainda não tinha sido visto
+        """
+        if self._conn is not None:
+            return self._conn.execute(
+                "INSERT OR IGNORE INTO seen_ids (id) VALUES (?)", (record_id,)
+            ).rowcount == 1
+        
+        if record_id in self._ids:
+            return False
+        self._ids.add(record_id)
+        if len(self._ids) > self.max_in_memory:
+            self._spill()
+        return True
+    
+    def _spill(self) -> None:
+        """Move os ids do set para um SQLite temporário (apagado ao fechar)."""
+        # Caminho vazio: banco temporário em disco, só o cache fica em memória
+        self._conn = sqlite3.connect("")
+        self._conn.executescript(f"""
+            PRAGMA cache_size = -{SEEN_IDS_CACHE_KIB};
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            CREATE TABLE seen_ids (id TEXT PRIMARY KEY) WITHOUT ROWID;
+        """)
+        self._conn.executemany("INSERT INTO seen_ids (id) VALUES (?)", ((i,) for i in self._ids))
+        logger.debug(f"Deduplicação por id: {len(self._ids)} ids movidos para SQLite temporário")
+        self._ids = set()
+    
+    def close(self) -> None:
+        """Libera o set e o banco temporário."""
+        self._ids = set()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class DedupIndex:
+    """Índice de hashes de conteúdo compartilhado entre execuções e fontes."""
+    
+    def __init__(self, db_path: Optional[Path] = None, source: Optional[str] = None):
+        """
+        Abre (ou cria) o índice.
+        
+        Os hashes novos ficam numa transação aberta até `commit()`, de modo
+        que uma execução que falhe antes de gravar a saída não marca
+        registros como já vistos.
+        
+        Args:
+            db_path: Caminho do banco SQLite (padrão: DATA_DIR/dedup_index.db)
+            source: API de origem registrada junto aos hashes novos
+        """
+        source = Config.API_BASE_URL if source is None else source
+        self.db_path = db_path or Config.DATA_DIR / Config.DEDUP_INDEX_FILENAME
+        self.source = source
+        self.duplicates = 0
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS content_hashes (
+                hash_content TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                first_seen_at TEXT NOT NULL
+            ) WITHOUT ROWID;
+        """)
+        self._conn.commit()
+        self._hashes = ContentHashTable(self._conn, "content_hashes", extra={"source": source})
+    
+    def __len__(self) -> int:
+        """Quantidade de hashes no índice (incluindo os pendentes)."""
+        return self._conn.execute("SELECT COUNT(*) FROM content_hashes").fetchone()[0]
+    
+    def filter_new(self, facts: List[Dict]) -> List[Dict]:
+        """
+        Mantém apenas os registros cujo conteúdo nunca foi visto.
+        
+        Ver `ContentHashTable.filter_new`; os descartados entram em
+        `self.duplicates`.
+        
+        Args:
+            facts: Registros brutos de uma página
+        
+        Returns:
+            Registros inéditos, na ordem original
+        """
+        new_facts = self._hashes.filter_new(facts)
+        self.duplicates += len(facts) - len(new_facts)
+        return new_facts
+    
+    def commit(self) -> None:
+        """Confirma os hashes registrados nesta execução."""
+        self._conn.commit()
+        if self.duplicates:
+            logger.info(f"Índice de deduplicação: {self.duplicates} registros já vistos descartados")
+    
+    def close(self) -> None:
+        """Fecha o banco, descartando alterações não confirmadas."""
+        self._conn.close()
@@ -0,0 +1,71 @@
+"""
+Hashes de conteúdo determinísticos para IDs e deduplicação.
+
+O `hash()` embutido do Python é randomizado por processo (PYTHONHASHSEED),
+então não serve para gerar IDs: o mesmo fact recebia um ID diferente a cada
+execução. Aqui o hash é o `hash_content` descrito em
+`bigquery_schema/SCHEMA_DOCUMENTATION.md` (SHA256 do texto em UTF-8) e o ID
+de um fact é o prefixo desse hash, estável entre execuções, processos e
+máquinas.
+"""
+
+import hashlib
+from typing import Iterable, List
+
+
+# Tamanho (em caracteres hexadecimais) do ID derivado do hash de conteúdo
+CONTENT_ID_LENGTH = 16
+
+
+def hash_content(text: str) -> str:
+    """
+    Calcula o hash de conteúdo de um fact.
+    
+    Args:
+        text: Texto do fact
+    
+    Returns:
+        SHA256 em hexadecimal
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def hash_content_batch(texts: Iterable[str]) -> List[str]:
+    """
+    Calcula o `hash_content` de uma coluna inteira de textos.
+    
+    Args:
+        texts: Textos dos facts (lista, Series ou array Arrow convertido)
+    
+    Returns:
+        Hashes SHA256 em hexadecimal, na mesma ordem
+    """
+    sha256 = hashlib.sha256
+    return [sha256(text.encode("utf-8")).hexdigest() for text in texts]
+
+
+def content_id(text: str) -> str:
+    """
+    Gera o ID estável de um fact a partir do seu texto.
+    
+    Args:
+        text: Texto do fact
+    
+    Returns:
+        Os primeiros `CONTENT_ID_LENGTH` caracteres do `hash_content`
+    """
+    return hash_content(text)[:CONTENT_ID_LENGTH]
+
+
+def content_id_batch(texts: Iterable[str]) -> List[str]:
+    """
+    Gera os IDs estáveis de uma coluna inteira de textos.
+    
+    Args:
+        texts: Textos dos facts
+    
+    Returns:
+        IDs na mesma ordem dos textos
+    """
+    sha256 = hashlib.sha256
+    return [sha256(text.encode("utf-8")).hexdigest()[:CONTENT_ID_LENGTH] for text in texts]
@@ -0,0 +1,250 @@
+"""
+Cache HTTP local em disco para as respostas da API.
+
+Guarda em SQLite (dentro de `Config.DATA_DIR`) o corpo das respostas GET
+junto com os validadores `ETag`/`Last-Modified`. Enquanto a entrada está
+dentro do TTL ela é servida sem acessar a rede; depois disso é revalidada
+com um GET condicional (`If-None-Match`/`If-Modified-Since`), e um 304
+reaproveita o corpo guardado. O tamanho total é limitado por remoção LRU.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from src.config import Config
+from src.utils import json_codec
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class CachedResponse:
+    """Entrada do cache: corpo JSON e validadores da resposta original."""
+    
+    def __init__(
+        self,
+        body: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        stored_at: float
+    ):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+    
+    def is_fresh(self, ttl: int) -> bool:
+        """Indica se a entrada ainda está dentro do TTL."""
+        return time.time() - self.stored_at < ttl
+    
+    def validator_headers(self) -> Dict[str, str]:
+        """Headers do GET condicional para revalidar a entrada."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+    
+    def json(self) -> Dict:
+        """Corpo da resposta decodificado."""
+        return json_codec.loads(self.body)
+
+
+class HTTPResponseCache:
+    """Cache de respostas GET com TTL, revalidação condicional e LRU."""
+    
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl: Optional[int] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        Abre (ou cria) o cache.
+        
+        A conexão é compartilhada entre as threads do cliente, protegida
+        por um lock. O total de bytes guardados é lido uma vez aqui e
+        mantido em memória, para a remoção LRU não somar a tabela a cada
+        gravação.
+        
+        Args:
+            db_path: Caminho do banco SQLite (padrão: DATA_DIR/http_cache.db)
+            ttl: Segundos em que uma resposta é servida sem revalidar
+            max_bytes: Tamanho máximo dos corpos guardados (remoção LRU)
+        """
+        ttl = Config.HTTP_CACHE_TTL if ttl is None else ttl
+        max_bytes = Config.HTTP_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        
+        self.db_path = db_path or Config.DATA_DIR / "http_cache.db"
+        self.ttl = max(0, ttl)
+        self.max_bytes = max(0, max_bytes)
+        self._lock = threading.Lock()
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+    
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict] = None) -> str:
+        """
+        Monta a chave do cache a partir da URL e dos parâmetros.
+        
+        Args:
+            url: URL completa da requisição
+            params: Parâmetros da query string
+        
+        Returns:
+            Chave normalizada (parâmetros ordenados)
+        """
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+    
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Busca uma resposta no cache, marcando-a como usada (LRU).
+        
+        Args:
+            key: Chave gerada por `make_key`
+        
+        Returns:
+            Entrada do cache ou None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE cache_key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE cache_key = ?",
+                (time.time(), key)
+            )
+            self._conn.commit()
+        
+        return CachedResponse(*row)
+    
+    def store(self, key: str, body: str, headers: Dict[str, str]) -> None:
+        """
+        Guarda uma resposta 200, a menos que o servidor proíba (`no-store`).
+        
+        Com TTL 0 uma entrada só é útil para o GET condicional, então
+        respostas sem `ETag` nem `Last-Modified` não são guardadas.
+        
+        Args:
+            key: Chave gerada por `make_key`
+            body: Corpo JSON da resposta
+            headers: Headers da resposta
+        """
+        if "no-store" in headers.get("Cache-Control", ""):
+            return
+        etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+        if self.ttl == 0 and not (etag or last_modified):
+            return
+        
+        now = time.time()
+        size = len(body.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE cache_key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, now, now, size)
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+    
+    def refresh(self, key: str, headers: Dict[str, str]) -> None:
+        """
+        Renova uma entrada após um 304 (novo TTL e validadores, se vierem).
+        
+        Args:
+            key: Chave gerada por `make_key`
+            headers: Headers da resposta 304
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                UPDATE responses
+                SET stored_at = ?, accessed_at = ?,
+                    etag = COALESCE(?, etag),
+                    last_modified = COALESCE(?, last_modified)
+                WHERE cache_key = ?
+                """,
+                (now, now, headers.get("ETag"), headers.get("Last-Modified"), key)
+            )
+            self._conn.commit()
+    
+    def _evict(self) -> None:
+        """Remove as entradas menos usadas até caber em `max_bytes`."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        
+        evicted = 0
+        while self._total_bytes > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT cache_key, size FROM responses ORDER BY accessed_at LIMIT 1"
+            ).fetchone()
+            if row is None:
+                self._total_bytes = 0
+                break
+            self._conn.execute("DELETE FROM responses WHERE cache_key = ?", (row[0],))
+            self._total_bytes -= row[1]
+            evicted += 1
+        
+        logger.debug(f"Cache HTTP: {evicted} entradas removidas (LRU)")
+    
+    def stats(self) -> Tuple[int, int]:
+        """
+        Retorna o tamanho atual do cache.
+        
+        Returns:
+            Tupla (entradas, bytes)
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+    
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+    
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        with self._lock:
+            self._conn.close()
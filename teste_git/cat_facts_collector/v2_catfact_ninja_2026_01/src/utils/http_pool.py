@@ -0,0 +1,166 @@
+"""
+Pool de conexões HTTP do `CatFactsAPIClient`.
+
+Um único `PooledHTTPAdapter` (pool do urllib3, thread-safe) é compartilhado
+por todas as threads de um cliente; cada thread usa a sua própria
+`requests.Session` (`ThreadLocalSessions`), já que a sessão em si (cookies,
+headers) não é thread-safe. Assim as páginas buscadas em paralelo reutilizam
+as mesmas conexões keep-alive em vez de abrir uma por requisição.
+
+Tamanho do pool, bloqueio, keep-alive e compressão vêm do `Config`
+(HTTP_POOL_*, HTTP_KEEP_ALIVE*, HTTP_COMPRESSION).
+"""
+
+import socket
+import threading
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from src.config import Config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+def brotli_available() -> bool:
+    """Indica se há um decodificador Brotli instalado (`brotli` ou `brotlicffi`)."""
+    for module in ("brotli", "brotlicffi"):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def accept_encoding(setting: Optional[str] = None) -> str:
+    """
+    Monta o header `Accept-Encoding` a partir da configuração.
+    
+    Args:
+        setting: Codificações separadas por vírgula (ex.: 'gzip,br') ou 'none'
+    
+    Returns:
+        Valor do header; `br` é omitido se não houver decodificador Brotli,
+        e 'identity' desativa a compressão
+    """
+    setting = Config.HTTP_COMPRESSION if setting is None else setting
+    encodings = [item.strip().lower() for item in setting.split(",") if item.strip()]
+    if "br" in encodings and not brotli_available():
+        logger.debug("Brotli não instalado - 'br' removido do Accept-Encoding")
+        encodings.remove("br")
+    
+    encodings = [item for item in encodings if item != "none"]
+    return ", ".join(encodings) or "identity"
+
+
+def keepalive_socket_options(idle: Optional[int] = None) -> List[tuple]:
+    """
+    Opções de socket com TCP keep-alive ligado.
+    
+    Args:
+        idle: Segundos ociosos antes da primeira sonda (onde o SO permitir)
+    
+    Returns:
+        Opções padrão do urllib3 mais SO_KEEPALIVE (e TCP_KEEPIDLE)
+    """
+    idle = Config.HTTP_KEEPALIVE_TIMEOUT if idle is None else idle
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    if idle > 0 and hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter com tamanho de pool, bloqueio e TCP keep-alive configuráveis."""
+    
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        keep_alive: Optional[bool] = None,
+        max_retries=0
+    ):
+        """
+        Inicializa o adapter.
+        
+        Args:
+            pool_connections: Hosts com pool mantido em cache
+            pool_maxsize: Conexões mantidas por host
+            pool_block: Se True, uma thread espera por uma conexão livre em
+                vez de abrir uma extra (que seria descartada na devolução)
+            keep_alive: Se as conexões são reutilizadas (com TCP keep-alive)
+            max_retries: Retries do urllib3 (int ou `Retry`)
+        """
+        pool_connections = Config.HTTP_POOL_CONNECTIONS if pool_connections is None else pool_connections
+        pool_maxsize = Config.HTTP_POOL_MAXSIZE if pool_maxsize is None else pool_maxsize
+        pool_block = Config.HTTP_POOL_BLOCK if pool_block is None else pool_block
+        keep_alive = Config.HTTP_KEEP_ALIVE if keep_alive is None else keep_alive
+        
+        # Precisa existir antes do super().__init__, que chama init_poolmanager
+        self.keep_alive = keep_alive
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+            pool_block=pool_block
+        )
+    
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        """Cria o PoolManager, ligando o TCP keep-alive nos sockets."""
+        if self.keep_alive:
+            pool_kwargs.setdefault("socket_options", keepalive_socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+
+def default_headers(keep_alive: Optional[bool] = None) -> Dict[str, str]:
+    """Headers enviados em toda requisição."""
+    keep_alive = Config.HTTP_KEEP_ALIVE if keep_alive is None else keep_alive
+    return {
+        "User-Agent": "UOLCatLovers/1.0",
+        "Accept": "application/json",
+        "Accept-Encoding": accept_encoding(),
+        "Connection": "keep-alive" if keep_alive else "close",
+    }
+
+
+class ThreadLocalSessions:
+    """Uma `requests.Session` por thread, todas montadas sobre o mesmo adapter."""
+    
+    def __init__(self, adapter: HTTPAdapter, headers: Optional[Dict[str, str]] = None):
+        """
+        Inicializa a fábrica de sessões.
+        
+        Args:
+            adapter: Adapter (e pool de conexões) compartilhado
+            headers: Headers padrão de cada sessão
+        """
+        self.adapter = adapter
+        self.headers = headers or default_headers()
+        self._local = threading.local()
+    
+    def get(self) -> requests.Session:
+        """Sessão da thread atual (criada no primeiro uso)."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("http://", self.adapter)
+            session.mount("https://", self.adapter)
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
+    
+    def close(self) -> None:
+        """
+        Fecha o pool de conexões compartilhado.
+        
+        As sessões não guardam outros recursos além do adapter, então não é
+        preciso rastreá-las (as de threads já encerradas são coletadas).
+        """
+        self.adapter.close()
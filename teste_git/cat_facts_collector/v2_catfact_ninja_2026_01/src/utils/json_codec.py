@@ -0,0 +1,168 @@
+"""
+Codec JSON plugável para respostas da API e arquivos brutos.
+
+Os corpos das respostas (clientes síncrono e assíncrono, cache HTTP), as
+páginas do Bronze e os registros do checkpoint passam por `loads`/`dumps`
+deste módulo. O backend vem de `Config.JSON_CODEC`:
+    - auto:    o mais rápido instalado (orjson, depois msgspec, depois stdlib)
+    - orjson / msgspec / stdlib: força o backend; se ele não estiver
+      instalado, cai para o stdlib com um aviso
+
+Todos os backends produzem o mesmo JSON: UTF-8, compacto e sem escapar
+caracteres não-ASCII (`ensure_ascii=False`). Manifestos e estado do
+checkpoint continuam com o `json` do stdlib (indentados, para leitura humana).
+"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+from src.config import Config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+# Ordem de preferência do modo 'auto'
+BACKENDS = ("orjson", "msgspec", "stdlib")
+
+
+class JSONCodec:
+    """Par `loads`/`dumps` de um backend JSON."""
+    
+    def __init__(
+        self,
+        name: str,
+        loads: Callable[[Union[bytes, str]], Any],
+        dumps: Callable[[Any], bytes]
+    ):
+        """
+        Inicializa o codec.
+        
+        Args:
+            name: Nome do backend
+            loads: Decodifica bytes ou str (JSON inválido levanta ValueError)
+            dumps: Codifica um objeto em bytes UTF-8
+        """
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+    
+    def __repr__(self) -> str:
+        return f"JSONCodec({self.name!r})"
+
+
+def _stdlib_codec() -> JSONCodec:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    return JSONCodec("stdlib", json.loads, dumps)
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+    
+    # orjson.JSONDecodeError já é subclasse de ValueError
+    return JSONCodec("orjson", orjson.loads, orjson.dumps)
+
+
+def _msgspec_codec() -> JSONCodec:
+    import msgspec
+    
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+    
+    def loads(data: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    
+    return JSONCodec("msgspec", loads, encoder.encode)
+
+
+_FACTORIES: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "stdlib": _stdlib_codec,
+}
+
+_codecs: Dict[str, JSONCodec] = {}
+
+
+def available_codecs() -> Dict[str, JSONCodec]:
+    """
+    Codecs dos backends instalados.
+    
+    Returns:
+        Nome -> codec, na ordem de preferência (o stdlib sempre presente)
+    """
+    codecs = {}
+    for name in BACKENDS:
+        try:
+            codecs[name] = _codecs.get(name) or _FACTORIES[name]()
+        except ImportError:
+            continue
+    return codecs
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Codec de um backend (criado no primeiro uso e reaproveitado).
+    
+    Args:
+        name: 'auto', 'orjson', 'msgspec' ou 'stdlib' (padrão: Config.JSON_CODEC)
+    
+    Returns:
+        Codec do backend pedido, ou do stdlib se ele não estiver instalado
+    
+    Raises:
+        ValueError: Backend desconhecido
+    """
+    name = (name or Config.JSON_CODEC).lower()
+    codec = _codecs.get(name)
+    if codec is not None:
+        return codec
+    
+    if name == "auto":
+        codec = next(iter(available_codecs().values()))
+    elif name in _FACTORIES:
+        try:
+            codec = _FACTORIES[name]()
+        except ImportError:
+            logger.warning(f"JSON_CODEC={name}, mas {name} não está instalado - usando o stdlib")
+            codec = _stdlib_codec()
+    else:
+        raise ValueError(f"JSON_CODEC desconhecido: {name} (use auto, {', '.join(BACKENDS)})")
+    
+    logger.debug(f"Codec JSON: {codec.name}")
+    _codecs[name] = codec
+    return codec
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decodifica JSON com o codec configurado.
+    
+    Args:
+        data: Documento JSON em bytes (UTF-8) ou str
+    
+    Returns:
+        Objeto Python
+    
+    Raises:
+        ValueError: JSON inválido
+    """
+    return get_codec().loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Codifica um objeto em JSON compacto (UTF-8) com o codec configurado.
+    
+    Args:
+        obj: Objeto serializável (dicts, listas, strings, números, None)
+    
+    Returns:
+        JSON em bytes
+    """
+    return get_codec().dumps(obj)
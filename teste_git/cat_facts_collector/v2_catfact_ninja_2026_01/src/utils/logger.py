@@ -2,7 +2,8 @@
 Configuração de logging estruturado para o projeto.
 
 Fornece um logger customizado com formatação colorida para console
-e logging em arquivo para auditoria e debugging.
+e logging em arquivo para auditoria e debugging. O colorlog só é importado
+ao configurar o primeiro logger; sem ele, o console usa o formato simples.
 """
 
 import logging
@@ -10,7 +11,8 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-import colorlog
+CONSOLE_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
 def setup_logger(
@@ -35,18 +37,23 @@ def setup_logger(
     # Remove handlers existentes para evitar duplicação
     logger.handlers.clear()
     
-    # Formato para console (colorido)
-    console_formatter = colorlog.ColoredFormatter(
-        "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
-    )
+    # Formato para console (colorido, se o colorlog estiver instalado)
+    try:
+        import colorlog
+    except ImportError:
+        console_formatter = logging.Formatter(CONSOLE_FORMAT, datefmt=DATE_FORMAT)
+    else:
+        console_formatter = colorlog.ColoredFormatter(
+            "%(log_color)s" + CONSOLE_FORMAT,
+            datefmt=DATE_FORMAT,
+            log_colors={
+                'DEBUG': 'cyan',
+                'INFO': 'green',
+                'WARNING': 'yellow',
+                'ERROR': 'red',
+                'CRITICAL': 'red,bg_white',
+            }
+        )
     
     # Handler para console
     console_handler = logging.StreamHandler(sys.stdout)
@@ -59,7 +66,7 @@ def setup_logger(
         
         file_formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
+            datefmt=DATE_FORMAT
         )
         
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
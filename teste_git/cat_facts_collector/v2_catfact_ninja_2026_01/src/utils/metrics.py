@@ -0,0 +1,285 @@
+"""
+Métricas de execução do pipeline (tempos, throughput e contadores HTTP).
+
+O `MetricsRegistry` é compartilhado pelo extrator e pelo cliente da API e
+registra, de forma thread-safe:
+    - histogramas de latência das requisições por endpoint
+    - contadores (requisições por status, bytes baixados, retries, 429)
+    - tempo e volume de cada etapa (busca, validação, escrita)
+
+Ao final da execução o conteúdo é exportado como relatório JSON e,
+opcionalmente, no formato texto do Prometheus (textfile collector).
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+# Limites (em segundos) dos buckets de latência, como os padrões do Prometheus
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    """Normaliza os labels em uma tupla ordenada (chave de dicionário)."""
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Optional[Dict[str, str]] = None) -> str:
+    """Formata os labels no padrão Prometheus: {chave="valor",...}."""
+    items = list(labels) + list((extra or {}).items())
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in items) + "}"
+
+
+class Histogram:
+    """Histograma de buckets cumulativos, no modelo do Prometheus."""
+    
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+    
+    def observe(self, value: float) -> None:
+        """Registra uma observação."""
+        index = bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Contagens cumulativas por limite superior (`le`), incluindo +Inf."""
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((f"{bound:g}", total))
+        result.append(("+Inf", self.count))
+        return result
+    
+    def to_dict(self) -> Dict:
+        """Resumo do histograma para o relatório JSON."""
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "buckets": dict(self.cumulative()),
+        }
+
+
+class IteratorTimer:
+    """
+    Repassa os itens de um iterável medindo o tempo gasto à espera deles.
+    
+    Em pipelines de geradores, separa o custo de uma etapa do custo das
+    anteriores: o tempo de uma etapa é o seu tempo total menos `seconds`
+    do iterável que a alimenta.
+    """
+    
+    def __init__(self, iterable: Iterable[Any], size: Optional[Callable[[Any], int]] = None):
+        """
+        Args:
+            iterable: Iterável de origem
+            size: Registros representados por cada item (padrão: 1; ex.: `len` para páginas)
+        """
+        self._iterator = iter(iterable)
+        self._size = size
+        self.seconds = 0.0
+        self.records = 0
+    
+    def __iter__(self) -> "IteratorTimer":
+        return self
+    
+    def __next__(self) -> Any:
+        start = time.perf_counter()
+        try:
+            item = next(self._iterator)
+        finally:
+            self.seconds += time.perf_counter() - start
+        self.records += 1 if self._size is None else self._size(item)
+        return item
+
+
+class MetricsRegistry:
+    """Registro thread-safe de contadores, histogramas e etapas de uma execução."""
+    
+    def __init__(self, prefix: str = "catfacts"):
+        """
+        Inicializa um registro vazio.
+        
+        Args:
+            prefix: Prefixo dos nomes das métricas no formato Prometheus
+        """
+        self.prefix = prefix
+        self.started_at = datetime.now(timezone.utc)
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._stages: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        """
+        Incrementa um contador.
+        
+        Args:
+            name: Nome do contador (ex.: 'http_requests_total')
+            value: Incremento
+            **labels: Labels da série (ex.: endpoint='/facts')
+        """
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+    
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """
+        Registra uma observação em um histograma.
+        
+        Args:
+            name: Nome do histograma (ex.: 'http_request_duration_seconds')
+            value: Valor observado
+            **labels: Labels da série
+        """
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(value)
+    
+    def record_stage(self, stage: str, seconds: float, records: int = 0, bytes_: int = 0) -> None:
+        """
+        Acumula o tempo e o volume processado por uma etapa.
+        
+        Args:
+            stage: Nome da etapa (ex.: 'fetch', 'validate', 'write')
+            seconds: Tempo gasto
+            records: Registros processados
+            bytes_: Bytes processados (ex.: tamanho do arquivo gravado)
+        """
+        with self._lock:
+            totals = self._stages.setdefault(stage, {"seconds": 0.0, "records": 0, "bytes": 0})
+            totals["seconds"] += seconds
+            totals["records"] += records
+            totals["bytes"] += bytes_
+    
+    def counter_value(self, name: str, **labels: str) -> float:
+        """
+        Soma das séries de um contador que casam com os labels informados.
+        
+        Args:
+            name: Nome do contador
+            **labels: Filtro de labels (vazio = todas as séries)
+        
+        Returns:
+            Valor acumulado
+        """
+        wanted = set(_labels(labels))
+        with self._lock:
+            return sum(
+                value for (counter, series), value in self._counters.items()
+                if counter == name and wanted <= set(series)
+            )
+    
+    def to_dict(self) -> Dict:
+        """
+        Monta o relatório JSON da execução.
+        
+        Returns:
+            Dicionário com contadores, histogramas e etapas (com throughput)
+        """
+        with self._lock:
+            stages = {}
+            for stage, totals in self._stages.items():
+                seconds = totals["seconds"]
+                stages[stage] = {
+                    "seconds": round(seconds, 6),
+                    "records": totals["records"],
+                    "bytes": totals["bytes"],
+                    "records_per_sec": round(totals["records"] / seconds, 1) if seconds > 0 and totals["records"] else None,
+                    "bytes_per_sec": round(totals["bytes"] / seconds, 1) if seconds > 0 and totals["bytes"] else None,
+                }
+            
+            return {
+                "started_at": self.started_at.isoformat(),
+                "finished_at": datetime.now(timezone.utc).isoformat(),
+                "stages": stages,
+                "counters": [
+                    {"name": name, "labels": dict(labels), "value": value}
+                    for (name, labels), value in sorted(self._counters.items())
+                ],
+                "histograms": [
+                    {"name": name, "labels": dict(labels), **histogram.to_dict()}
+                    for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0])
+                ],
+            }
+    
+    def to_prometheus(self) -> str:
+        """
+        Exporta as métricas no formato texto do Prometheus.
+        
+        Returns:
+            Texto pronto para o textfile collector do node_exporter
+        """
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self._counters}):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} counter")
+                for (counter, labels), value in sorted(self._counters.items()):
+                    if counter == name:
+                        lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+            
+            for name in sorted({name for name, _ in self._histograms}):
+                metric = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for (histogram_name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0]):
+                    if histogram_name != name:
+                        continue
+                    for bound, count in histogram.cumulative():
+                        lines.append(f"{metric}_bucket{_format_labels(labels, {'le': bound})} {count}")
+                    lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum:g}")
+                    lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+            
+            for field in ("seconds", "records", "bytes"):
+                metric = f"{self.prefix}_stage_{field}"
+                if self._stages:
+                    lines.append(f"# TYPE {metric} gauge")
+                for stage, totals in sorted(self._stages.items()):
+                    lines.append(f'{metric}{{stage="{stage}"}} {totals[field]:g}')
+        
+        return "\n".join(lines) + "\n"
+    
+    def write_report(self, json_path: Path, prometheus_path: Optional[Path] = None) -> None:
+        """
+        Grava o relatório JSON e, opcionalmente, o arquivo Prometheus.
+        
+        Args:
+            json_path: Caminho do relatório JSON
+            prometheus_path: Caminho do arquivo .prom (None = não gera)
+        """
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        logger.info(f"Métricas gravadas em {json_path}")
+        
+        if prometheus_path is not None:
+            prometheus_path.write_text(self.to_prometheus(), encoding="utf-8")
+            logger.info(f"Métricas Prometheus gravadas em {prometheus_path}")
@@ -0,0 +1,260 @@
+"""
+Saída append-only particionada por data de ingestão.
+
+Em vez de reescrever um único arquivo a cada execução, cada execução grava
+apenas o seu delta como um novo arquivo de partição:
+    
+    facts/ingestion_date=YYYY-MM-DD/part-00000.csv
+    facts/ingestion_date=YYYY-MM-DD/part-00001.csv
+
+(o particionamento por `ingestion_date` é o mesmo da tabela descrita em
+`bigquery_schema/SCHEMA_DOCUMENTATION.md`). O custo de escrita depende só do
+delta, não do histórico. `compact()` junta as várias partes pequenas de uma
+data em um único arquivo, removendo ids repetidos.
+"""
+
+import csv
+import os
+import re
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from src.config import Config
+from src.utils.columnar_writer import ColumnarWriter
+from src.utils.dedup_index import SeenIds
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+PARTITION_PREFIX = "ingestion_date="
+_PART_PATTERN = re.compile(r"^part-(\d+)\.")
+
+
+class PartitionedOutput:
+    """Gravador de partes append-only em `<root>/ingestion_date=YYYY-MM-DD/`."""
+    
+    def __init__(self, root: Optional[Path] = None, output_format: Optional[str] = None):
+        """
+        Inicializa o gravador.
+        
+        Args:
+            root: Diretório raiz das partições (padrão: Config.FACTS_DIR)
+            output_format: 'csv', 'parquet' ou 'arrow'
+        
+        Raises:
+            ValueError: Formato não suportado
+        """
+        output_format = Config.OUTPUT_FORMAT if output_format is None else output_format
+        if output_format not in ("csv", "parquet", "arrow"):
+            raise ValueError(f"Formato de saída não suportado: {output_format}")
+        
+        self.root = root or Config.FACTS_DIR
+        self.output_format = output_format
+    
+    def partition_dir(self, ingestion_date: date) -> Path:
+        """Diretório da partição de uma data."""
+        return self.root / f"{PARTITION_PREFIX}{ingestion_date.isoformat()}"
+    
+    def partitions(self) -> List[Path]:
+        """Diretórios de partição existentes, em ordem cronológica."""
+        if not self.root.exists():
+            return []
+        return sorted(path for path in self.root.glob(f"{PARTITION_PREFIX}*") if path.is_dir())
+    
+    def parts(self, partition: Path) -> List[Path]:
+        """Arquivos de parte de uma partição, na ordem em que foram gravados."""
+        found = [
+            (int(match.group(1)), path)
+            for path in partition.glob(f"part-*.{self.output_format}")
+            if (match := _PART_PATTERN.match(path.name))
+        ]
+        return [path for _, path in sorted(found)]
+    
+    def _next_part(self, partition: Path) -> Path:
+        """Caminho da próxima parte livre da partição."""
+        parts = self.parts(partition)
+        number = int(_PART_PATTERN.match(parts[-1].name).group(1)) + 1 if parts else 0
+        return partition / f"part-{number:05d}.{self.output_format}"
+    
+    def write(self, records: Iterable[Dict], ingestion_date: Optional[date] = None) -> int:
+        """
+        Grava os registros como uma nova parte da partição da data.
+        
+        A parte é escrita em um arquivo temporário e renomeada no final, de
+        modo que leitores nunca veem uma parte incompleta. Sem registros,
+        nenhum arquivo é criado.
+        
+        Args:
+            records: Dicionários no formato de `CatFact.to_dict()`
+            ingestion_date: Data da partição (padrão: hoje, em UTC)
+        
+        Returns:
+            Quantidade de registros gravados
+        """
+        partition = self.partition_dir(ingestion_date or datetime.now(timezone.utc).date())
+        partition.mkdir(parents=True, exist_ok=True)
+        part_path = self._next_part(partition)
+        tmp_path = part_path.with_name(f".{part_path.name}.tmp")
+        
+        try:
+            if self.output_format == "csv":
+                written = self._write_csv(records, tmp_path)
+            else:
+                written = ColumnarWriter(tmp_path, output_format=self.output_format).write(records)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        if written == 0:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning("Nenhum dado para salvar")
+            return 0
+        
+        os.replace(tmp_path, part_path)
+        logger.info(f"✓ Dados salvos com sucesso: {written} registros")
+        logger.info(f"✓ Arquivo: {part_path}")
+        return written
+    
+    @staticmethod
+    def _write_csv(records: Iterable[Dict], path: Path) -> int:
+        """Grava os registros em CSV, removendo ids repetidos à medida que chegam."""
+        seen_ids = SeenIds()
+        written = 0
+        csv_file = None
+        writer = None
+        
+        try:
+            for record in records:
+                if not seen_ids.add(record["id"]):
+                    continue
+                
+                if writer is None:
+                    csv_file = open(path, "w", newline="", encoding="utf-8")
+                    writer = csv.DictWriter(csv_file, fieldnames=list(record.keys()))
+                    writer.writeheader()
+                
+                writer.writerow(record)
+                written += 1
+        finally:
+            seen_ids.close()
+            if csv_file is not None:
+                csv_file.close()
+        
+        return written
+    
+    def compact(self, partition: Path) -> int:
+        """
+        Junta todas as partes de uma partição em uma única parte.
+        
+        Os registros mantêm a ordem de gravação e, para ids repetidos, vale a
+        primeira ocorrência. A parte compactada é gravada por completo e
+        substitui a primeira parte antes de as demais serem removidas, então
+        uma interrupção no meio deixa no máximo registros repetidos, nunca
+        registros perdidos.
+        
+        Args:
+            partition: Diretório da partição
+        
+        Returns:
+            Quantidade de registros na parte compactada
+        """
+        parts = self.parts(partition)
+        if not parts:
+            return 0
+        tmp_path = partition / f".compacted.{self.output_format}.tmp"
+        
+        try:
+            if self.output_format == "csv":
+                written = self._compact_csv(parts, tmp_path)
+            else:
+                written = ColumnarWriter(tmp_path, output_format=self.output_format).write_tables(
+                    self._iter_unique_tables(parts)
+                )
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        
+        os.replace(tmp_path, parts[0])
+        for part in parts[1:]:
+            part.unlink()
+        
+        logger.info(f"Partição {partition.name}: {len(parts)} partes compactadas em 1 ({written} registros)")
+        return written
+    
+    @staticmethod
+    def _compact_csv(parts: List[Path], path: Path) -> int:
+        """Concatena partes CSV linha a linha, sem montar DataFrame."""
+        seen_ids = SeenIds()
+        written = 0
+        
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as out:
+                writer = csv.writer(out)
+                header = None
+                
+                for part in parts:
+                    with open(part, newline="", encoding="utf-8") as f:
+                        reader = csv.reader(f)
+                        part_header = next(reader, None)
+                        if part_header is None:
+                            continue
+                        if header is None:
+                            header = part_header
+                            writer.writerow(header)
+                        id_index = part_header.index("id")
+                        
+                        for row in reader:
+                            if not seen_ids.add(row[id_index]):
+                                continue
+                            writer.writerow(row)
+                            written += 1
+        finally:
+            seen_ids.close()
+        
+        return written
+    
+    def _read_table(self, part: Path) -> pa.Table:
+        """Lê uma parte Parquet ou Arrow IPC."""
+        if self.output_format == "parquet":
+            return pq.read_table(part)
+        with pa.memory_map(str(part)) as source:
+            return pa.ipc.open_file(source).read_all()
+    
+    def _iter_unique_tables(self, parts: List[Path]) -> Iterator[pa.Table]:
+        """Lê as partes em ordem, descartando ids já vistos em partes anteriores."""
+        seen_ids: Optional[pa.Array] = None
+        
+        for part in parts:
+            table = self._read_table(part)
+            ids = table.column("id")
+            if seen_ids is not None:
+                table = table.filter(pc.invert(pc.is_in(ids, value_set=seen_ids)))
+                ids = table.column("id")
+            new_ids = ids.combine_chunks()
+            seen_ids = new_ids if seen_ids is None else pa.concat_arrays([seen_ids, new_ids])
+            yield table
+    
+    def compact_all(self, min_parts: int = 2) -> Dict[str, int]:
+        """
+        Compacta as partições com pelo menos `min_parts` partes.
+        
+        Args:
+            min_parts: Partes mínimas para a partição ser compactada
+        
+        Returns:
+            Registros por partição compactada (nome do diretório -> total)
+        """
+        compacted = {}
+        for partition in self.partitions():
+            if len(self.parts(partition)) >= max(2, min_parts):
+                compacted[partition.name] = self.compact(partition)
+        
+        if not compacted:
+            logger.info("Nenhuma partição para compactar")
+        return compacted
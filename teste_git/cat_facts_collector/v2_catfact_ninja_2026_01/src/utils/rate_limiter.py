@@ -0,0 +1,163 @@
+"""
+Rate limiter proativo (token bucket) para as requisições à API.
+
+Um único `TokenBucketRateLimiter` é compartilhado por todas as threads (ou
+tasks asyncio) de um cliente: cada requisição reserva um token antes de ser
+enviada, limitando a taxa sustentada a `rate` req/s com rajadas de até
+`burst`. O bucket se ajusta aos headers da API (`Retry-After` e
+`X-RateLimit-*`), pausando até a janela do servidor reabrir em vez de
+esperar pelo próximo 429.
+"""
+
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+from src.config import Config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+def parse_delay(value: Optional[str]) -> Optional[float]:
+    """
+    Converte um header de espera em segundos a partir de agora.
+    
+    Aceita segundos (`Retry-After: 30`), timestamp Unix
+    (`X-RateLimit-Reset: 1767225600`) ou data HTTP
+    (`Retry-After: Wed, 21 Oct 2026 07:28:00 GMT`).
+    
+    Args:
+        value: Valor do header
+    
+    Returns:
+        Segundos de espera (>= 0) ou None se ausente/inválido
+    """
+    if value is None:
+        return None
+    
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    
+    # Valores grandes são timestamps Unix, não durações
+    if seconds > 1_000_000_000:
+        seconds -= time.time()
+    return max(0.0, seconds)
+
+
+class TokenBucketRateLimiter:
+    """Token bucket thread-safe com ajuste pelos headers de rate limit da API."""
+    
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[int] = None
+    ):
+        """
+        Inicializa o bucket cheio.
+        
+        Args:
+            rate: Requisições por segundo sustentadas
+            burst: Requisições que podem sair de uma vez (capacidade do bucket)
+        
+        Raises:
+            ValueError: Taxa não positiva
+        """
+        rate = Config.API_RATE_LIMIT if rate is None else rate
+        burst = Config.API_RATE_BURST if burst is None else burst
+        
+        if rate <= 0:
+            raise ValueError(f"Taxa do rate limiter deve ser positiva: {rate}")
+        
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        # Instante (monotonic) até o qual os tokens já foram contabilizados;
+        # fica no futuro enquanto o servidor pede para aguardar.
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float) -> None:
+        """Adiciona os tokens acumulados desde a última atualização."""
+        if now > self._updated:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+    
+    def reserve(self) -> float:
+        """
+        Reserva um token sem bloquear.
+        
+        O token é consumido imediatamente (o saldo pode ficar negativo), de
+        modo que chamadas concorrentes recebem esperas escalonadas.
+        
+        Returns:
+            Segundos que o chamador deve aguardar antes de enviar a requisição
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            return max(0.0, self._updated - now) + max(0.0, -self._tokens) / self.rate
+    
+    def acquire(self) -> None:
+        """Bloqueia a thread atual até que haja um token disponível."""
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(f"Rate limiter: aguardando {wait:.2f}s")
+            time.sleep(wait)
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Esvazia o bucket e suspende a emissão de tokens por `seconds`.
+        
+        Args:
+            seconds: Tempo até a janela do servidor reabrir
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + seconds)
+    
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Ajusta o bucket com base nos headers de rate limit da resposta.
+        
+        - `Retry-After`: pausa pelo tempo pedido.
+        - `X-RateLimit-Remaining`: o saldo local nunca passa do saldo do servidor;
+          se zerou, pausa até `X-RateLimit-Reset` (quando informado).
+        
+        Args:
+            headers: Headers da resposta HTTP
+        """
+        retry_after = parse_delay(headers.get("Retry-After"))
+        if retry_after is not None:
+            logger.warning(f"Rate limiter: servidor pediu {retry_after:.1f}s de espera")
+            self.pause(retry_after)
+            return
+        
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        
+        try:
+            remaining = int(remaining)
+        except ValueError:
+            return
+        
+        if remaining <= 0:
+            reset = parse_delay(headers.get("X-RateLimit-Reset"))
+            if reset is not None:
+                logger.info(f"Rate limiter: cota esgotada, aguardando {reset:.1f}s")
+                self.pause(reset)
+                return
+        
+        with self._lock:
+            self._tokens = min(self._tokens, float(remaining))
@@ -0,0 +1,230 @@
+"""
+Política única de retry dos clientes HTTP.
+
+Substitui as duas camadas anteriores (o `Retry` do urllib3 dentro do
+adapter e o laço de `_make_request`, que juntas chegavam a max_retries²
+tentativas com esperas fixas). Uma requisição lógica agora tem:
+    - no máximo `max_attempts` tentativas, com backoff exponencial e
+      jitter completo (espera sorteada entre 0 e base * 2^(tentativa-1),
+      limitada a `max_delay`), respeitando `Retry-After` quando houver
+    - um orçamento total de tempo (`budget`): nenhuma espera ou timeout de
+      tentativa ultrapassa o prazo da requisição
+    - um circuit breaker por host, compartilhado por todos os clientes do
+      processo: após `failure_threshold` falhas seguidas (5xx, timeout,
+      conexão) as requisições ao host falham na hora por `reset_timeout`
+      segundos; depois disso uma tentativa de teste decide se o circuito fecha
+
+Usada por `CatFactsAPIClient` e `AsyncCatFactsAPIClient`; a política só
+decide (tentar de novo? quanto esperar?), quem dorme é o cliente.
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from src.config import Config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+# Status que valem nova tentativa (429 e erros transitórios do servidor)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Requisição recusada porque o circuito do host está aberto."""
+
+
+class CircuitBreaker:
+    """Circuit breaker (fechado / aberto / meio-aberto) de um host, thread-safe."""
+    
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None
+    ):
+        """
+        Inicializa o circuito fechado.
+        
+        Args:
+            host: Host protegido (usado nas mensagens)
+            failure_threshold: Falhas seguidas que abrem o circuito (0 = nunca abre)
+            reset_timeout: Segundos com o circuito aberto antes da tentativa de teste
+        """
+        failure_threshold = Config.API_CIRCUIT_FAILURES if failure_threshold is None else failure_threshold
+        reset_timeout = Config.API_CIRCUIT_RESET if reset_timeout is None else reset_timeout
+        
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        """Se o circuito está aberto (ou meio-aberto)."""
+        return self._opened_at is not None
+    
+    def before_request(self) -> None:
+        """
+        Libera ou recusa uma tentativa.
+        
+        Com o circuito aberto só passa uma tentativa de teste a cada
+        `reset_timeout`; as demais são recusadas.
+        
+        Raises:
+            CircuitOpenError: Circuito aberto
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            waited = time.monotonic() - self._opened_at
+            if waited >= self.reset_timeout:
+                # Reinicia a contagem: se o teste nunca reportar o resultado,
+                # outro teste é liberado após mais `reset_timeout`
+                self._opened_at = time.monotonic()
+                self._probing = True
+                logger.info(f"Circuito de {self.host} meio-aberto: enviando tentativa de teste")
+                return
+        raise CircuitOpenError(
+            f"Circuito aberto para {self.host} "
+            f"(nova tentativa em {max(0.0, self.reset_timeout - waited):.0f}s)"
+        )
+    
+    def record_success(self) -> None:
+        """Registra uma resposta do host (fecha o circuito)."""
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuito de {self.host} fechado")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+    
+    def record_failure(self) -> None:
+        """Registra uma falha do host (5xx, timeout ou conexão)."""
+        with self._lock:
+            self._failures += 1
+            if self._probing or (
+                self._opened_at is None and 0 < self.failure_threshold <= self._failures
+            ):
+                logger.warning(
+                    f"Circuito de {self.host} aberto após {self._failures} falhas seguidas "
+                    f"(por {self.reset_timeout:.0f}s)"
+                )
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def circuit_breaker_for(url: str) -> CircuitBreaker:
+    """
+    Circuit breaker do host de `url`, compartilhado no processo.
+    
+    Args:
+        url: URL (ou URL base) da API
+    
+    Returns:
+        O mesmo `CircuitBreaker` para todas as URLs do host
+    """
+    host = urlparse(url).netloc or url
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host)
+        return breaker
+
+
+class RetryPolicy:
+    """Parâmetros de retry de uma requisição lógica."""
+    
+    def __init__(
+        self,
+        max_attempts: Optional[int] = None,
+        base_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        budget: Optional[float] = None
+    ):
+        """
+        Inicializa a política.
+        
+        Args:
+            max_attempts: Tentativas por requisição (incluindo a primeira)
+            base_delay: Teto da espera antes da 2ª tentativa (dobra a cada tentativa)
+            max_delay: Teto de qualquer espera
+            budget: Segundos totais por requisição, contando esperas (0 = sem limite)
+        """
+        max_attempts = Config.API_MAX_RETRIES if max_attempts is None else max_attempts
+        base_delay = Config.API_RETRY_DELAY if base_delay is None else base_delay
+        max_delay = Config.API_RETRY_MAX_DELAY if max_delay is None else max_delay
+        budget = Config.API_RETRY_BUDGET if budget is None else budget
+        
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+    
+    def start(self) -> "RetryState":
+        """Começa a contagem de tentativas e o orçamento de uma requisição."""
+        return RetryState(self)
+
+
+class RetryState:
+    """Tentativas e prazo de uma requisição em andamento."""
+    
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.attempt = 0
+        self.deadline = time.monotonic() + policy.budget if policy.budget > 0 else None
+    
+    def remaining(self) -> Optional[float]:
+        """Segundos até o fim do orçamento (None se não houver orçamento)."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+    
+    def begin_attempt(self, timeout: float) -> float:
+        """
+        Conta uma nova tentativa.
+        
+        Args:
+            timeout: Timeout configurado para uma tentativa
+        
+        Returns:
+            Timeout da tentativa, reduzido ao que resta do orçamento
+        """
+        self.attempt += 1
+        remaining = self.remaining()
+        return timeout if remaining is None else max(0.001, min(timeout, remaining))
+    
+    def next_delay(self, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Decide se há nova tentativa e quanto esperar antes dela.
+        
+        Args:
+            retry_after: Espera pedida pelo servidor (`Retry-After`), se houver
+        
+        Returns:
+            Segundos de espera, ou None se as tentativas ou o orçamento acabaram
+        """
+        if self.attempt >= self.policy.max_attempts:
+            return None
+        
+        ceiling = min(self.policy.max_delay, self.policy.base_delay * 2 ** (self.attempt - 1))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            logger.warning(f"Orçamento de retry esgotado ({self.policy.budget:.0f}s)")
+            return None
+        return delay
@@ -0,0 +1,168 @@
+"""
+Estado da extração incremental.
+
+Guarda em SQLite (dentro de `Config.DATA_DIR`) os hashes de conteúdo já
+vistos — por página e por registro — para que execuções agendadas parem de
+paginar ao encontrar páginas inalteradas e gravem apenas registros novos
+ou alterados.
+
+O hash de registro é o `hash_content` descrito em
+`bigquery_schema/SCHEMA_DOCUMENTATION.md`: SHA256 do texto do fact.
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.config import Config
+from src.utils.dedup_index import ContentHashTable
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class IncrementalStateStore:
+    """Store de hashes de páginas e registros para extração incremental."""
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        db_path: Optional[Path] = None,
+        unchanged_pages_to_stop: Optional[int] = None
+    ):
+        """
+        Abre (ou cria) o store de estado.
+        
+        As alterações ficam numa transação aberta até `commit()`, de modo que
+        uma execução que falhe antes de gravar a saída não marca registros
+        como já vistos.
+        
+        Args:
+            base_url: URL base da API (cada API tem seu próprio estado)
+            db_path: Caminho do banco SQLite (padrão: DATA_DIR/incremental_state.db)
+            unchanged_pages_to_stop: Páginas inalteradas consecutivas que
+                encerram a paginação (se o total de registros não mudou)
+        """
+        base_url = Config.API_BASE_URL if base_url is None else base_url
+        unchanged_pages_to_stop = Config.INCREMENTAL_UNCHANGED_PAGES if unchanged_pages_to_stop is None else unchanged_pages_to_stop
+        
+        self.base_url = base_url
+        self.db_path = db_path or Config.DATA_DIR / "incremental_state.db"
+        self.unchanged_pages_to_stop = max(1, unchanged_pages_to_stop)
+        self._unchanged_streak = 0
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._create_tables()
+        self._records = ContentHashTable(self._conn, "records", scope={"base_url": base_url})
+        self._previous_total = self._get_meta("total")
+    
+    def _create_tables(self) -> None:
+        """Cria as tabelas do estado, se ainda não existirem."""
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (
+                base_url TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT,
+                PRIMARY KEY (base_url, key)
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                base_url TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                page_hash TEXT NOT NULL,
+                PRIMARY KEY (base_url, page)
+            );
+            CREATE TABLE IF NOT EXISTS records (
+                base_url TEXT NOT NULL,
+                hash_content TEXT NOT NULL,
+                first_seen_at TEXT NOT NULL,
+                PRIMARY KEY (base_url, hash_content)
+            ) WITHOUT ROWID;
+        """)
+        self._conn.commit()
+    
+    def _get_meta(self, key: str) -> Optional[str]:
+        """Lê um valor de metadado do estado."""
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE base_url = ? AND key = ?",
+            (self.base_url, key)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def _set_meta(self, key: str, value: str) -> None:
+        """Grava um valor de metadado do estado (pendente até o commit)."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (base_url, key, value) VALUES (?, ?, ?)",
+            (self.base_url, key, value)
+        )
+    
+    def observe_page(self, page: int, response: Dict) -> bool:
+        """
+        Registra o hash de uma página e decide se a paginação deve parar.
+        
+        A paginação para quando o `total` informado pela API é o mesmo da
+        última execução e há `unchanged_pages_to_stop` páginas consecutivas
+        com o mesmo conteúdo já registrado.
+        
+        Args:
+            page: Número da página
+            response: Resposta completa da página
+        
+        Returns:
+            True se a paginação deve parar nesta página
+        """
+        page_hash = hashlib.sha256(
+            json.dumps(response.get("data", []), sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        
+        row = self._conn.execute(
+            "SELECT page_hash FROM pages WHERE base_url = ? AND page = ?",
+            (self.base_url, page)
+        ).fetchone()
+        unchanged = row is not None and row[0] == page_hash
+        
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages (base_url, page, page_hash) VALUES (?, ?, ?)",
+            (self.base_url, page, page_hash)
+        )
+        
+        total = response.get("total")
+        if total is not None:
+            self._set_meta("total", str(total))
+        
+        self._unchanged_streak = self._unchanged_streak + 1 if unchanged else 0
+        same_total = total is not None and str(total) == self._previous_total
+        
+        if same_total and self._unchanged_streak >= self.unchanged_pages_to_stop:
+            logger.info(f"Página {page} inalterada e total estável ({total}): encerrando paginação")
+            return True
+        
+        return False
+    
+    def filter_new(self, facts: List[Dict]) -> List[Dict]:
+        """
+        Mantém apenas os registros cujo conteúdo ainda não foi visto nesta API.
+        
+        Ver `ContentHashTable.filter_new`.
+        
+        Args:
+            facts: Registros brutos de uma página
+        
+        Returns:
+            Registros novos ou alterados, na ordem original
+        """
+        return self._records.filter_new(facts)
+    
+    def commit(self) -> None:
+        """Confirma as alterações de estado desta execução."""
+        self._set_meta("last_run_at", datetime.now(timezone.utc).isoformat())
+        self._conn.commit()
+    
+    def close(self) -> None:
+        """Fecha o banco, descartando alterações não confirmadas."""
+        self._conn.rollback()
+        self._conn.close()
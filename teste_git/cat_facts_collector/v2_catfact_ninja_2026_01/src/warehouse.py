@@ -0,0 +1,391 @@
+"""
+Carga do star schema Gold em um banco SQLite local.
+
+Copia a tabela fato e as dimensões gravadas pelo estágio Gold
+(`src/load.py`) para `Config.DATA_DIR / Config.WAREHOUSE_DB`, com as
+mesmas tabelas e chaves de `bigquery_schema/DIMENSIONAL_MODEL.md`
+(`fact_cat_facts`, `dim_date`, `dim_time`, `dim_source`, `dim_quality`)
+e índices nas chaves estrangeiras. As queries de analytics do modelo
+dimensional ficam disponíveis como views `vw_*` (`VIEWS_SQL`), já no
+dialeto do SQLite, e rodam localmente, sem BigQuery.
+
+A carga é feita em lotes (`executemany`) dentro de uma única transação e
+é idempotente: a `fact_key` vem de (run_id, fact_id) (ver
+`src.load.fact_keys`), então reexecutar para o mesmo lote substitui as
+linhas dele pela chave primária e as coletas de outros lotes são mantidas. Em cargas grandes (mais linhas do que a tabela fato já tem)
+os índices secundários são removidos e recriados no final, o que é bem mais
+rápido do que mantê-los linha a linha.
+
+Uso:
+    python src/warehouse.py                  # todos os lotes Gold
+    python src/warehouse.py --run-id RUN_ID  # um lote
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import Config
+from src.utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+DIMENSIONS = ("dim_source", "dim_date", "dim_time", "dim_quality")
+
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS dim_source (
+    source_key INTEGER PRIMARY KEY,
+    source_id TEXT NOT NULL,
+    source_name TEXT NOT NULL,
+    source_type TEXT,
+    is_active INTEGER,
+    api_endpoint TEXT,
+    effective_date TEXT
+);
+CREATE TABLE IF NOT EXISTS dim_date (
+    date_key INTEGER PRIMARY KEY,
+    full_date TEXT NOT NULL,
+    day_of_week INTEGER,
+    day_name TEXT,
+    month INTEGER,
+    month_name TEXT,
+    quarter INTEGER,
+    year INTEGER,
+    is_weekend INTEGER
+);
+CREATE TABLE IF NOT EXISTS dim_time (
+    time_key INTEGER PRIMARY KEY,
+    hour INTEGER,
+    minute INTEGER,
+    second INTEGER,
+    period TEXT
+);
+CREATE TABLE IF NOT EXISTS dim_quality (
+    quality_key INTEGER PRIMARY KEY,
+    quality_tier TEXT NOT NULL,
+    min_score REAL,
+    max_score REAL,
+    tier_description TEXT
+);
+CREATE TABLE IF NOT EXISTS fact_cat_facts (
+    fact_key INTEGER PRIMARY KEY,
+    fact_id TEXT NOT NULL,
+    fact_text TEXT,
+    fact_length INTEGER,
+    upvotes_count INTEGER,
+    quality_score REAL,
+    source_key INTEGER REFERENCES dim_source (source_key),
+    date_key INTEGER REFERENCES dim_date (date_key),
+    time_key INTEGER REFERENCES dim_time (time_key),
+    quality_key INTEGER REFERENCES dim_quality (quality_key),
+    fact_type TEXT,
+    is_verified INTEGER,
+    ingestion_date TEXT NOT NULL,
+    run_id TEXT NOT NULL
+);
+"""
+
+# Queries de analytics de `bigquery_schema/DIMENSIONAL_MODEL.md` como views
+# no dialeto do SQLite (datas relativas via date('now'), semana via strftime)
+VIEWS_SQL = """
+DROP VIEW IF EXISTS vw_facts_by_source;
+CREATE VIEW vw_facts_by_source AS
+SELECT s.source_name, COUNT(*) AS total
+FROM fact_cat_facts f
+JOIN dim_source s ON f.source_key = s.source_key
+WHERE s.is_active = 1
+GROUP BY s.source_name;
+
+DROP VIEW IF EXISTS vw_facts_by_weekday;
+CREATE VIEW vw_facts_by_weekday AS
+SELECT d.day_of_week, d.day_name, COUNT(*) AS total, AVG(f.fact_length) AS avg_length
+FROM fact_cat_facts f
+JOIN dim_date d ON f.date_key = d.date_key
+GROUP BY d.day_of_week, d.day_name
+ORDER BY d.day_of_week;
+
+DROP VIEW IF EXISTS vw_monthly_trend;
+CREATE VIEW vw_monthly_trend AS
+SELECT d.year, d.month, d.month_name, COUNT(*) AS total_facts
+FROM fact_cat_facts f
+JOIN dim_date d ON f.date_key = d.date_key
+GROUP BY d.year, d.month, d.month_name
+ORDER BY d.year, d.month;
+
+DROP VIEW IF EXISTS vw_facts_by_period;
+CREATE VIEW vw_facts_by_period AS
+SELECT t.period, COUNT(*) AS total, AVG(f.upvotes_count) AS avg_upvotes
+FROM fact_cat_facts f
+JOIN dim_time t ON f.time_key = t.time_key
+GROUP BY t.period
+ORDER BY total DESC;
+
+DROP VIEW IF EXISTS vw_peak_hours;
+CREATE VIEW vw_peak_hours AS
+SELECT t.hour, COUNT(*) AS total
+FROM fact_cat_facts f
+JOIN dim_time t ON f.time_key = t.time_key
+GROUP BY t.hour
+ORDER BY total DESC
+LIMIT 5;
+
+DROP VIEW IF EXISTS vw_quality_distribution;
+CREATE VIEW vw_quality_distribution AS
+SELECT q.quality_tier, COUNT(*) AS total,
+       ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 2) AS percentage
+FROM fact_cat_facts f
+JOIN dim_quality q ON f.quality_key = q.quality_key
+GROUP BY q.quality_tier, q.min_score
+ORDER BY q.min_score DESC;
+
+DROP VIEW IF EXISTS vw_kpis_30d;
+CREATE VIEW vw_kpis_30d AS
+SELECT
+  COUNT(DISTINCT fact_key) AS total_facts,
+  COUNT(DISTINCT date_key) AS days_collected,
+  ROUND(AVG(fact_length), 2) AS avg_length,
+  ROUND(AVG(quality_score), 2) AS avg_quality,
+  SUM(upvotes_count) AS total_upvotes
+FROM fact_cat_facts
+WHERE ingestion_date >= date('now', '-30 days');
+
+DROP VIEW IF EXISTS vw_weekly_trend_90d;
+CREATE VIEW vw_weekly_trend_90d AS
+SELECT
+  d.year,
+  d.month_name,
+  CAST(strftime('%W', d.full_date) AS INTEGER) AS week,
+  COUNT(*) AS total_facts,
+  ROUND(AVG(f.quality_score), 2) AS avg_quality,
+  ROUND(AVG(f.fact_length), 2) AS avg_length
+FROM fact_cat_facts f
+JOIN dim_date d ON f.date_key = d.date_key
+WHERE d.full_date >= date('now', '-90 days')
+GROUP BY d.year, d.month_name, d.month, week
+ORDER BY d.year, d.month, week;
+
+DROP VIEW IF EXISTS vw_top_verified_facts;
+CREATE VIEW vw_top_verified_facts AS
+SELECT f.fact_text, f.fact_length, f.upvotes_count, s.source_name, d.full_date, q.quality_tier
+FROM fact_cat_facts f
+JOIN dim_source s ON f.source_key = s.source_key
+JOIN dim_date d ON f.date_key = d.date_key
+JOIN dim_quality q ON f.quality_key = q.quality_key
+WHERE f.is_verified = 1
+  AND q.quality_tier = 'Excelente'
+  AND f.upvotes_count IS NOT NULL
+ORDER BY f.upvotes_count DESC
+LIMIT 10;
+
+DROP VIEW IF EXISTS vw_source_comparison;
+CREATE VIEW vw_source_comparison AS
+SELECT
+  s.source_name,
+  s.is_active,
+  COUNT(*) AS total_facts,
+  ROUND(AVG(f.fact_length), 2) AS avg_length,
+  ROUND(AVG(f.quality_score), 2) AS avg_quality,
+  SUM(CASE WHEN f.is_verified THEN 1 ELSE 0 END) AS verified_facts,
+  ROUND(AVG(f.upvotes_count), 2) AS avg_upvotes
+FROM fact_cat_facts f
+JOIN dim_source s ON f.source_key = s.source_key
+GROUP BY s.source_name, s.is_active
+ORDER BY total_facts DESC;
+
+DROP VIEW IF EXISTS vw_weekday_period_30d;
+CREATE VIEW vw_weekday_period_30d AS
+SELECT d.day_name, t.period, COUNT(*) AS total_facts, ROUND(AVG(f.quality_score), 2) AS avg_quality
+FROM fact_cat_facts f
+JOIN dim_date d ON f.date_key = d.date_key
+JOIN dim_time t ON f.time_key = t.time_key
+WHERE d.full_date >= date('now', '-30 days')
+GROUP BY d.day_of_week, d.day_name, t.period
+ORDER BY d.day_of_week,
+  CASE t.period
+    WHEN 'Madrugada' THEN 1
+    WHEN 'Manhã' THEN 2
+    WHEN 'Tarde' THEN 3
+    WHEN 'Noite' THEN 4
+  END;
+"""
+
+# Índices secundários da tabela fato (nome -> coluna)
+FACT_INDEXES = {
+    "idx_fact_fact_id": "fact_id",
+    "idx_fact_source_key": "source_key",
+    "idx_fact_date_key": "date_key",
+    "idx_fact_time_key": "time_key",
+    "idx_fact_quality_key": "quality_key",
+    "idx_fact_ingestion_date": "ingestion_date",
+}
+
+
+def _rows(table: pa.Table) -> Iterator[Tuple]:
+    """
+    Converte uma tabela Arrow em tuplas de tipos nativos do Python.
+    
+    Datas e timestamps viram texto ISO 8601 (o SQLite não tem tipo de data).
+    
+    Args:
+        table: Tabela Arrow
+    
+    Returns:
+        Iterador de tuplas, uma por linha
+    """
+    columns = []
+    for column in table.columns:
+        if pa.types.is_date(column.type) or pa.types.is_timestamp(column.type):
+            column = column.cast(pa.string())
+        columns.append(column.to_pylist())
+    return zip(*columns)
+
+
+def _insert(conn: sqlite3.Connection, name: str, table: pa.Table, batch_size: int) -> int:
+    """
+    Insere (ou substitui, pela chave primária) as linhas em lotes.
+    
+    Args:
+        conn: Conexão SQLite
+        name: Tabela de destino
+        table: Linhas a carregar, com os nomes de coluna da tabela
+        batch_size: Linhas por chamada de `executemany`
+    
+    Returns:
+        Quantidade de linhas carregadas
+    """
+    placeholders = ",".join("?" * table.num_columns)
+    sql = f"INSERT OR REPLACE INTO {name} ({','.join(table.column_names)}) VALUES ({placeholders})"
+    
+    rows = _rows(table)
+    while batch := list(islice(rows, batch_size)):
+        conn.executemany(sql, batch)
+    return table.num_rows
+
+
+def _create_indexes(conn: sqlite3.Connection) -> None:
+    """Cria os índices da tabela fato que ainda não existem."""
+    for name, column in FACT_INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON fact_cat_facts ({column})")
+
+
+def _drop_indexes(conn: sqlite3.Connection) -> None:
+    """Remove os índices da tabela fato (recriados por `_create_indexes`)."""
+    for name in FACT_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def fact_paths(run_id: Optional[str] = None) -> List[Path]:
+    """
+    Arquivos da tabela fato Gold, em ordem cronológica.
+    
+    Args:
+        run_id: Restringe a um lote (padrão: todos)
+    
+    Returns:
+        Caminhos `gold/fact_cat_facts/ingestion_date=.../run_id=....parquet`
+    """
+    pattern = f"ingestion_date=*/run_id={run_id or '*'}.parquet"
+    return sorted(
+        (Config.GOLD_DIR / "fact_cat_facts").glob(pattern),
+        key=lambda path: path.stem
+    )
+
+
+def _fact_table(path: Path) -> pa.Table:
+    """Lê um arquivo da tabela fato, acrescentando as colunas vindas do layout."""
+    table = pq.read_table(path)
+    ingestion_date = path.parent.name.split("=", 1)[1]
+    run_id = path.stem.split("=", 1)[1]
+    table = table.append_column("ingestion_date", pa.array([ingestion_date] * table.num_rows, pa.string()))
+    table = table.append_column("run_id", pa.array([run_id] * table.num_rows, pa.string()))
+    # Inserir na ordem da chave primária evita reorganizar a B-tree a cada linha
+    return table.sort_by("fact_key")
+
+
+def load_warehouse(
+    paths: Iterable[Path],
+    db_path: Optional[Path] = None,
+    batch_size: Optional[int] = None
+) -> int:
+    """
+    Carrega dimensões e lotes da tabela fato Gold no banco SQLite.
+    
+    Args:
+        paths: Arquivos da tabela fato (ver `fact_paths`)
+        db_path: Banco de destino (padrão: DATA_DIR/WAREHOUSE_DB)
+        batch_size: Linhas por chamada de `executemany`
+    
+    Returns:
+        Quantidade de linhas de fato carregadas
+    """
+    batch_size = Config.WAREHOUSE_BATCH_SIZE if batch_size is None else batch_size
+    db_path = db_path or Config.DATA_DIR / Config.WAREHOUSE_DB
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    loaded = 0
+    
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.executescript(SCHEMA_SQL)
+        conn.executescript(VIEWS_SQL)
+        
+        tables = [_fact_table(path) for path in paths]
+        incoming = sum(table.num_rows for table in tables)
+        existing = conn.execute("SELECT COUNT(*) FROM fact_cat_facts").fetchone()[0]
+        rebuild_indexes = incoming >= existing
+        
+        with conn:
+            for name in DIMENSIONS:
+                dimension_path = Config.GOLD_DIR / f"{name}.parquet"
+                if dimension_path.exists():
+                    _insert(conn, name, pq.read_table(dimension_path), batch_size)
+            
+            if rebuild_indexes:
+                _drop_indexes(conn)
+            for table in tables:
+                loaded += _insert(conn, "fact_cat_facts", table, batch_size)
+            _create_indexes(conn)
+        
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    
+    logger.info(f"Warehouse: {loaded} fatos carregados em {db_path} ({time.perf_counter() - start:.2f}s)")
+    return loaded
+
+
+def main(argv: Optional[List[str]] = None):
+    """Carrega os lotes Gold no banco SQLite local."""
+    parser = argparse.ArgumentParser(description="Gold -> banco SQLite local")
+    parser.add_argument("--run-id", help="Lote Gold a carregar (padrão: todos)")
+    parser.add_argument("--db", type=Path, help="Banco de destino (padrão: DATA_DIR/WAREHOUSE_DB)")
+    args = parser.parse_args(argv)
+    
+    try:
+        paths = fact_paths(args.run_id)
+        if not paths:
+            raise FileNotFoundError(f"Nenhum lote Gold encontrado em {Config.GOLD_DIR}")
+        
+        load_warehouse(paths, args.db)
+        sys.exit(0)
+    
+    except Exception as e:
+        logger.error(f"Erro fatal na carga do warehouse: {e}", exc_info=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()